@@ -10,6 +10,7 @@ import argparse
 import json
 import os
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List
 
@@ -48,7 +49,7 @@ from scenarios.canonical_workloads import get_workload, WORKLOADS
 from utils.benchmarks_doc import update_benchmarks_markdown
 from utils.charting import export_latency_charts
 from utils.dataset_generator import DatasetGenerator, GeneratorConfig
-from utils.manifest import RunManifest, ResultsBundle, ResultRecord
+from utils.manifest import RunManifest, ResultsBundle, ResultRecord, write_json
 
 
 DEFAULT_DOCS_ASSETS_DIR = (
@@ -331,8 +332,7 @@ def run_benchmark_for_engine(
             # Save individual results
             for record in result_records:
                 output_file = output_dir / f"results_{engine}_{record.benchmark}.json"
-                with open(output_file, "w") as f:
-                    json.dump(record.to_dict(), f, indent=2)
+                write_json(output_file, record.to_dict())
 
             return {"status": "completed", "reason": "", "results": result_records}
 
@@ -381,6 +381,46 @@ def _path_size_bytes(path: Path) -> int:
     return 0
 
 
+def _run_engines(
+    engines: List[str],
+    engine_configs: Dict[str, Any],
+    jobs: int,
+    **engine_kwargs: Any,
+) -> List[Dict[str, Any]]:
+    """Run each engine's benchmarks, optionally across worker processes.
+
+    Engines are independent (each gets its own temp directory and
+    connection), so with ``jobs > 1`` they are fanned out to a process pool.
+    Outcomes are returned in the same order as ``engines``.
+    """
+    if jobs <= 1 or len(engines) <= 1:
+        outcomes = []
+        for engine in engines:
+            print(f"\n=== Benchmarking {engine} ===")
+            outcomes.append(
+                run_benchmark_for_engine(
+                    engine=engine,
+                    engine_config=engine_configs.get(engine, {}),
+                    **engine_kwargs,
+                )
+            )
+        return outcomes
+
+    workers = min(jobs, len(engines))
+    print(f"\n=== Benchmarking {', '.join(engines)} ({workers} parallel workers) ===")
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(
+                run_benchmark_for_engine,
+                engine=engine,
+                engine_config=engine_configs.get(engine, {}),
+                **engine_kwargs,
+            )
+            for engine in engines
+        ]
+        return [future.result() for future in futures]
+
+
 def run_comparison(
     engines: List[str],
     config: Dict[str, Any],
@@ -396,6 +436,7 @@ def run_comparison(
     os_cache_state: str,
     storage_state: str,
     output_dir: Path,
+    jobs: int = 1,
 ) -> ResultsBundle:
     """Run comparison across multiple engines.
 
@@ -411,6 +452,7 @@ def run_comparison(
         operations: Operations per benchmark
         warmup: Warmup operations
         output_dir: Output directory
+        jobs: Maximum number of engines to benchmark in parallel
 
     Returns:
         ResultsBundle with all results
@@ -434,29 +476,26 @@ def run_comparison(
         "process_state": process_state,
         "os_cache_state": os_cache_state,
         "storage_state": storage_state,
+        "parallel_jobs": str(jobs),
     }
 
     bundle = ResultsBundle(manifest)
 
-    # Run benchmarks for each engine
-    for engine in engines:
-        engine_config = config.get("engines", {}).get(engine, {})
-
-        # Check if engine is enabled
-        if not engine_config.get("enabled", True):
+    # Check which engines are enabled
+    engine_configs = config.get("engines", {})
+    enabled = [
+        engine_configs.get(engine, {}).get("enabled", True) for engine in engines
+    ]
+    for engine, is_enabled in zip(engines, enabled):
+        if not is_enabled:
             print(f"Skipping disabled engine: {engine}")
-            manifest.engine_status[engine] = {
-                "status": "disabled",
-                "reason": "disabled in configuration",
-                "result_count": 0,
-            }
-            continue
 
-        print(f"\n=== Benchmarking {engine} ===")
-
-        outcome = run_benchmark_for_engine(
-            engine=engine,
-            engine_config=engine_config,
+    # Run benchmarks for each enabled engine
+    outcomes = iter(
+        _run_engines(
+            [engine for engine, is_enabled in zip(engines, enabled) if is_enabled],
+            engine_configs,
+            jobs,
             workload_name=workload_name,
             scenario_name=scenario_name,
             transaction_mode=transaction_mode,
@@ -470,7 +509,18 @@ def run_comparison(
             storage_state=storage_state,
             output_dir=output_dir,
         )
+    )
+
+    for engine, is_enabled in zip(engines, enabled):
+        if not is_enabled:
+            manifest.engine_status[engine] = {
+                "status": "disabled",
+                "reason": "disabled in configuration",
+                "result_count": 0,
+            }
+            continue
 
+        outcome = next(outcomes)
         results = outcome["results"]
         manifest.engine_status[engine] = {
             "status": outcome["status"],
@@ -489,12 +539,10 @@ def run_comparison(
 
     # Save manifest
     manifest_path = output_dir / "manifest.json"
-    with open(manifest_path, "w") as f:
-        json.dump(manifest.to_dict(), f, indent=2)
+    write_json(manifest_path, manifest.to_dict())
 
     engine_status_path = output_dir / "engine_status.json"
-    with open(engine_status_path, "w") as f:
-        json.dump(manifest.engine_status, f, indent=2)
+    write_json(engine_status_path, manifest.engine_status)
 
     # Save merged results
     merged_path = output_dir / "results_merged.json"
@@ -620,6 +668,15 @@ def main():
         default=DEFAULT_BENCHMARKS_DOC_PATH,
         help="Path to docs benchmark markdown file to update",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Benchmark up to N engines in parallel worker processes "
+            "(engines compete for CPU and I/O, so keep 1 for publishable numbers)"
+        ),
+    )
     parser.add_argument(
         "--customers",
         type=int,
@@ -702,6 +759,7 @@ def main():
                 os_cache_state=args.os_cache_state,
                 storage_state=args.storage_state,
                 output_dir=run_output_dir,
+                jobs=args.jobs,
             )
         )
 
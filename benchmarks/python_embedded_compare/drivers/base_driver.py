@@ -9,6 +9,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from utils.performance_timer import select_ranks
+
 
 @dataclass
 class EngineMetadata:
@@ -229,14 +231,12 @@ class BenchmarkMetrics:
         if not self.latencies:
             return {"p50_ms": 0, "p95_ms": 0, "p99_ms": 0}
 
-        sorted_latencies = sorted(self.latencies)
-        n = len(sorted_latencies)
+        n = len(self.latencies)
+        p50, p95, p99 = select_ranks(
+            self.latencies, (int(n * 0.50), int(n * 0.95), int(n * 0.99))
+        )
 
-        return {
-            "p50_ms": sorted_latencies[int(n * 0.50)],
-            "p95_ms": sorted_latencies[int(n * 0.95)],
-            "p99_ms": sorted_latencies[int(n * 0.99)],
-        }
+        return {"p50_ms": p50, "p95_ms": p95, "p99_ms": p99}
 
     def get_throughput(self, duration_sec: float) -> float:
         """Calculate operations per second.
@@ -56,6 +56,13 @@ class DuckDBDriver(DatabaseDriver):
             self._cursor = None
             self._prepared_stmts.clear()
 
+    def _get_cursor(self, sql: str):
+        cursor = self._prepared_stmts.get(sql)
+        if cursor is None:
+            cursor = self.connection.cursor()
+            self._prepared_stmts[sql] = cursor
+        return cursor
+
     def create_schema(self, schema_sql: str):
         # DuckDB supports multiple statements in execute_batch
         statements = schema_sql.split(";")
@@ -68,7 +75,7 @@ class DuckDBDriver(DatabaseDriver):
         self.connection.execute(f"DROP TABLE IF EXISTS {table_name}")
 
     def execute_query(self, sql: str, params: Optional[Tuple] = None) -> List[Dict]:
-        cursor = self.connection.cursor()
+        cursor = self._get_cursor(sql)
         if params:
             cursor.execute(sql, params)
         else:
@@ -104,11 +111,7 @@ class DuckDBDriver(DatabaseDriver):
         self.connection.execute("ROLLBACK")
 
     def prepare_statement(self, sql: str):
-        cursor = self._prepared_stmts.get(sql)
-        if cursor is None:
-            cursor = self.connection.cursor()
-            self._prepared_stmts[sql] = cursor
-        return sql, cursor
+        return sql, self._get_cursor(sql)
 
     def execute_prepared(
         self, handle: Any, params: Optional[Tuple] = None
@@ -180,6 +180,13 @@ class JDBCDriver(DatabaseDriver):
                 pass
             self.connection = None
 
+    def _get_cursor(self, sql: str):
+        cursor = self._prepared_stmts.get(sql)
+        if cursor is None:
+            cursor = self.connection.cursor()
+            self._prepared_stmts[sql] = cursor
+        return cursor
+
     def create_schema(self, schema_sql: str):
         cursor = self.connection.cursor()
         statements = self._adapt_sql(schema_sql).split(";")
@@ -196,7 +203,7 @@ class JDBCDriver(DatabaseDriver):
 
     def execute_query(self, sql: str, params: Optional[Tuple] = None) -> List[Dict]:
         sql = self._adapt_sql(sql)
-        cursor = self.connection.cursor()
+        cursor = self._get_cursor(sql)
         if params:
             cursor.execute(sql, params)
         else:
@@ -206,29 +213,23 @@ class JDBCDriver(DatabaseDriver):
         columns = [desc[0] for desc in cursor.description] if cursor.description else []
 
         rows = cursor.fetchall()
-        cursor.close()
 
         return [dict(zip(columns, row)) for row in rows]
 
     def execute_update(self, sql: str, params: Optional[Tuple] = None) -> int:
         sql = self._adapt_sql(sql)
-        cursor = self.connection.cursor()
+        cursor = self._get_cursor(sql)
         if params:
             cursor.execute(sql, params)
         else:
             cursor.execute(sql)
-
-        rowcount = cursor.rowcount
-        cursor.close()
-        return rowcount
+        return cursor.rowcount
 
     def execute_many(self, sql: str, params_list: List[Tuple]) -> int:
         sql = self._adapt_sql(sql)
-        cursor = self.connection.cursor()
+        cursor = self._get_cursor(sql)
         cursor.executemany(sql, params_list)
-        rowcount = cursor.rowcount * len(params_list)
-        cursor.close()
-        return rowcount
+        return cursor.rowcount * len(params_list)
 
     def begin_transaction(self):
         # Auto-commit is already off, but we explicitly begin
@@ -242,11 +243,7 @@ class JDBCDriver(DatabaseDriver):
 
     def prepare_statement(self, sql: str):
         sql = self._adapt_sql(sql)
-        cursor = self._prepared_stmts.get(sql)
-        if cursor is None:
-            cursor = self.connection.cursor()
-            self._prepared_stmts[sql] = cursor
-        return sql, cursor
+        return sql, self._get_cursor(sql)
 
     def execute_prepared(self, handle, params: Optional[Tuple] = None) -> Any:
         sql, cursor = handle
@@ -4,10 +4,13 @@ This module defines the standard workloads that all engines must implement
 to ensure fair comparison.
 """
 
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+
 from drivers.base_driver import DatabaseDriver
 from utils.dataset_generator import Customer, Order, Event
 from utils.performance_timer import BenchmarkRunner, LatencyTracker, Timer
@@ -223,62 +226,63 @@ CREATE INDEX idx_orders_created_status ON orders(created_at, status);
         queries = self._get_queries()
 
         if transaction_mode == "autocommit":
+            execute_update = driver.execute_update
+            commit = driver.commit
+
             # Insert customers
+            insert_customer = queries["insert_customer"]
             for c in customers:
-                driver.execute_update(
-                    queries["insert_customer"], (c.customer_id, c.email, c.created_at)
-                )
-                driver.commit()
+                execute_update(insert_customer, (c.customer_id, c.email, c.created_at))
+                commit()
 
             # Insert orders
+            insert_order = queries["insert_order"]
             for o in orders:
-                driver.execute_update(
-                    queries["insert_order"],
+                execute_update(
+                    insert_order,
                     (o.order_id, o.customer_id, o.created_at, o.status, o.total_cents),
                 )
-                driver.commit()
+                commit()
 
         elif transaction_mode == "batched":
             # Insert customers in batches
             for i in range(0, len(customers), batch_size):
                 driver.begin_transaction()
-                batch = customers[i : i + batch_size]
-                for c in batch:
-                    driver.execute_update(
-                        queries["insert_customer"],
-                        (c.customer_id, c.email, c.created_at),
-                    )
+                driver.execute_many(
+                    queries["insert_customer"],
+                    [
+                        (c.customer_id, c.email, c.created_at)
+                        for c in customers[i : i + batch_size]
+                    ],
+                )
                 driver.commit()
 
             # Insert orders in batches
             for i in range(0, len(orders), batch_size):
                 driver.begin_transaction()
-                batch = orders[i : i + batch_size]
-                for o in batch:
-                    driver.execute_update(
-                        queries["insert_order"],
-                        (
-                            o.order_id,
-                            o.customer_id,
-                            o.created_at,
-                            o.status,
-                            o.total_cents,
-                        ),
-                    )
+                driver.execute_many(
+                    queries["insert_order"],
+                    [
+                        (o.order_id, o.customer_id, o.created_at, o.status, o.total_cents)
+                        for o in orders[i : i + batch_size]
+                    ],
+                )
                 driver.commit()
 
         elif transaction_mode == "explicit":
             # Single large transaction for everything
             driver.begin_transaction()
-            for c in customers:
-                driver.execute_update(
-                    queries["insert_customer"], (c.customer_id, c.email, c.created_at)
-                )
-            for o in orders:
-                driver.execute_update(
-                    queries["insert_order"],
-                    (o.order_id, o.customer_id, o.created_at, o.status, o.total_cents),
-                )
+            driver.execute_many(
+                queries["insert_customer"],
+                [(c.customer_id, c.email, c.created_at) for c in customers],
+            )
+            driver.execute_many(
+                queries["insert_order"],
+                [
+                    (o.order_id, o.customer_id, o.created_at, o.status, o.total_cents)
+                    for o in orders
+                ],
+            )
             driver.commit()
 
         self._customers = list(customers)
@@ -292,11 +296,10 @@ CREATE INDEX idx_orders_created_status ON orders(created_at, status);
         self, customers: List[Customer], n: int
     ) -> List[Tuple]:
         """Generate parameters for point lookup queries."""
-        import random
-
-        rng = random.Random(42)  # Deterministic
+        rng = np.random.default_rng(42)  # Deterministic
         customer_ids = [customer.customer_id for customer in customers]
-        return [(customer_ids[rng.randint(0, len(customer_ids) - 1)],) for _ in range(n)]
+        picks = rng.integers(0, len(customer_ids), size=n).tolist()
+        return [(customer_ids[index],) for index in picks]
 
     def _generate_range_params(self, orders: List[Order], n: int) -> List[Tuple]:
         """Generate parameters for range scan queries."""
@@ -415,15 +418,15 @@ CREATE INDEX idx_orders_created_status ON orders(created_at, status);
 
         # Benchmark
         tracker = LatencyTracker()
+        now = time.perf_counter
         timer = Timer()
         timer.start()
 
         for params in params_list[warmup:]:
-            op_timer = Timer()
-            op_timer.start()
+            started = now()
             try:
                 driver.execute_query(queries["point_lookup"], params)
-                tracker.record(op_timer.stop() * 1000)
+                tracker.record((now() - started) * 1000)
             except Exception:
                 tracker.record_error()
 
@@ -455,15 +458,15 @@ CREATE INDEX idx_orders_created_status ON orders(created_at, status);
 
         # Benchmark
         tracker = LatencyTracker()
+        now = time.perf_counter
         timer = Timer()
         timer.start()
 
         for params in params_list[warmup:]:
-            op_timer = Timer()
-            op_timer.start()
+            started = now()
             try:
                 driver.execute_query(queries["range_scan"], params)
-                tracker.record(op_timer.stop() * 1000)
+                tracker.record((now() - started) * 1000)
             except Exception:
                 tracker.record_error()
 
@@ -495,15 +498,15 @@ CREATE INDEX idx_orders_created_status ON orders(created_at, status);
 
         # Benchmark
         tracker = LatencyTracker()
+        now = time.perf_counter
         timer = Timer()
         timer.start()
 
         for params in params_list[warmup:]:
-            op_timer = Timer()
-            op_timer.start()
+            started = now()
             try:
                 driver.execute_query(queries["join"], params)
-                tracker.record(op_timer.stop() * 1000)
+                tracker.record((now() - started) * 1000)
             except Exception:
                 tracker.record_error()
 
@@ -535,15 +538,15 @@ CREATE INDEX idx_orders_created_status ON orders(created_at, status);
 
         # Benchmark
         tracker = LatencyTracker()
+        now = time.perf_counter
         timer = Timer()
         timer.start()
 
         for params in params_list[warmup:]:
-            op_timer = Timer()
-            op_timer.start()
+            started = now()
             try:
                 driver.execute_query(queries["aggregate"], params)
-                tracker.record(op_timer.stop() * 1000)
+                tracker.record((now() - started) * 1000)
             except Exception:
                 tracker.record_error()
 
@@ -573,15 +576,15 @@ CREATE INDEX idx_orders_created_status ON orders(created_at, status);
 
         # Benchmark
         tracker = LatencyTracker()
+        now = time.perf_counter
         timer = Timer()
         timer.start()
 
         for params in params_list[warmup:]:
-            op_timer = Timer()
-            op_timer.start()
+            started = now()
             try:
                 self._execute_write_op(driver, queries["update"], params)
-                tracker.record(op_timer.stop() * 1000)
+                tracker.record((now() - started) * 1000)
             except Exception:
                 tracker.record_error()
 
@@ -612,15 +615,15 @@ CREATE INDEX idx_orders_created_status ON orders(created_at, status);
 
         # Benchmark
         tracker = LatencyTracker()
+        now = time.perf_counter
         timer = Timer()
         timer.start()
 
         for params in benchmark_params:
-            op_timer = Timer()
-            op_timer.start()
+            started = now()
             try:
                 self._execute_write_op(driver, queries["delete"], params)
-                tracker.record(op_timer.stop() * 1000)
+                tracker.record((now() - started) * 1000)
             except Exception:
                 tracker.record_error()
 
@@ -674,31 +677,33 @@ CREATE INDEX idx_events_ts ON events(ts);
         insert_sql = "INSERT INTO events (event_id, user_id, ts, path, referrer, bytes) VALUES (?, ?, ?, ?, ?, ?)"
 
         if transaction_mode == "autocommit":
+            execute_update = driver.execute_update
+            commit = driver.commit
             for e in events:
-                driver.execute_update(
+                execute_update(
                     insert_sql,
                     (e.event_id, e.user_id, e.ts, e.path, e.referrer, e.bytes),
                 )
-                driver.commit()
+                commit()
 
         elif transaction_mode == "batched":
             for i in range(0, len(events), batch_size):
                 driver.begin_transaction()
-                batch = events[i : i + batch_size]
-                for e in batch:
-                    driver.execute_update(
-                        insert_sql,
-                        (e.event_id, e.user_id, e.ts, e.path, e.referrer, e.bytes),
-                    )
+                driver.execute_many(
+                    insert_sql,
+                    [
+                        (e.event_id, e.user_id, e.ts, e.path, e.referrer, e.bytes)
+                        for e in events[i : i + batch_size]
+                    ],
+                )
                 driver.commit()
 
         elif transaction_mode == "explicit":
             driver.begin_transaction()
-            for e in events:
-                driver.execute_update(
-                    insert_sql,
-                    (e.event_id, e.user_id, e.ts, e.path, e.referrer, e.bytes),
-                )
+            driver.execute_many(
+                insert_sql,
+                [(e.event_id, e.user_id, e.ts, e.path, e.referrer, e.bytes) for e in events],
+            )
             driver.commit()
 
         self._events = list(events)
@@ -768,15 +773,15 @@ CREATE INDEX idx_events_ts ON events(ts);
 
         # Benchmark
         tracker = LatencyTracker()
+        now = time.perf_counter
         timer = Timer()
         timer.start()
 
         for params in params_list[warmup:]:
-            op_timer = Timer()
-            op_timer.start()
+            started = now()
             try:
                 driver.execute_query(sql, params)
-                tracker.record(op_timer.stop() * 1000)
+                tracker.record((now() - started) * 1000)
             except Exception:
                 tracker.record_error()
 
@@ -816,15 +821,15 @@ CREATE INDEX idx_events_ts ON events(ts);
 
         # Benchmark
         tracker = LatencyTracker()
+        now = time.perf_counter
         timer = Timer()
         timer.start()
 
         for params in params_list[warmup:]:
-            op_timer = Timer()
-            op_timer.start()
+            started = now()
             try:
                 driver.execute_query(sql, params)
-                tracker.record(op_timer.stop() * 1000)
+                tracker.record((now() - started) * 1000)
             except Exception:
                 tracker.record_error()
 
@@ -894,20 +899,19 @@ CREATE INDEX bench_id_idx ON bench(id);
         ]
 
         if transaction_mode == "autocommit":
+            execute_update = driver.execute_update
+            commit = driver.commit
             for row in rows:
-                driver.execute_update(insert_sql, row)
-                driver.commit()
+                execute_update(insert_sql, row)
+                commit()
         elif transaction_mode == "batched":
             for i in range(0, len(rows), batch_size):
                 driver.begin_transaction()
-                batch = rows[i : i + batch_size]
-                for row in batch:
-                    driver.execute_update(insert_sql, row)
+                driver.execute_many(insert_sql, rows[i : i + batch_size])
                 driver.commit()
         elif transaction_mode == "explicit":
             driver.begin_transaction()
-            for row in rows:
-                driver.execute_update(insert_sql, row)
+            driver.execute_many(insert_sql, rows)
             driver.commit()
 
         self._row_count = len(rows)
@@ -917,16 +921,12 @@ CREATE INDEX bench_id_idx ON bench(id);
             raise ValueError("Workload data must be loaded before running benchmarks")
 
     def _generate_point_lookup_params(self, n: int) -> List[Tuple]:
-        import random
-
-        rng = random.Random(60)
-        return [(rng.randrange(self._row_count),) for _ in range(n)]
+        rng = np.random.default_rng(60)
+        return [(row_id,) for row_id in rng.integers(0, self._row_count, size=n).tolist()]
 
     def _generate_prepared_roundtrip_params(self, n: int) -> List[Tuple]:
-        import random
-
-        rng = random.Random(61)
-        return [(rng.randrange(self._row_count),) for _ in range(n)]
+        rng = np.random.default_rng(61)
+        return [(row_id,) for row_id in rng.integers(0, self._row_count, size=n).tolist()]
 
     def _generate_materialization_params(self, n: int) -> List[Tuple]:
         import random
@@ -951,15 +951,15 @@ CREATE INDEX bench_id_idx ON bench(id);
             driver.execute_query(sql, params)
 
         tracker = LatencyTracker()
+        now = time.perf_counter
         timer = Timer()
         timer.start()
 
         for params in params_list[warmup:]:
-            op_timer = Timer()
-            op_timer.start()
+            started = now()
             try:
                 driver.execute_query(sql, params)
-                tracker.record(op_timer.stop() * 1000)
+                tracker.record((now() - started) * 1000)
             except Exception:
                 tracker.record_error()
 
@@ -989,15 +989,15 @@ CREATE INDEX bench_id_idx ON bench(id);
             driver.execute_prepared(prepared, params)
 
         tracker = LatencyTracker()
+        now = time.perf_counter
         timer = Timer()
         timer.start()
 
         for params in params_list[warmup:]:
-            op_timer = Timer()
-            op_timer.start()
+            started = now()
             try:
                 driver.execute_prepared(prepared, params)
-                tracker.record(op_timer.stop() * 1000)
+                tracker.record((now() - started) * 1000)
             except Exception:
                 tracker.record_error()
 
@@ -61,6 +61,19 @@ class TestRunManifest:
         assert "os" in info
         assert info["hostname"] is not None
 
+    def test_machine_info_reports_cpu_model(self):
+        """Machine info should always carry a non-empty CPU model."""
+        info = get_machine_info()
+
+        assert info["cpu_model"]
+
+    def test_machine_info_returns_independent_copies(self):
+        """Cached machine info should not leak caller mutations."""
+        first = get_machine_info()
+        first["hostname"] = "mutated"
+
+        assert get_machine_info()["hostname"] != "mutated"
+
     def test_python_version_is_recorded(self):
         """Python version should be recorded."""
         version = get_python_version()
@@ -203,3 +216,32 @@ class TestResultsBundle:
         assert "manifest" in d
         assert "results" in d
         assert len(d["results"]) == 1
+
+    def test_bundle_save_load_round_trip(self, tmp_path):
+        """Saved bundles should load back with identical contents."""
+        manifest = RunManifest.create(
+            workload_name="workload_a",
+            scenario_name="canonical",
+            transaction_mode="batched",
+            durability_mode="durable",
+            engines=["sqlite"],
+            dataset_seed=42,
+        )
+
+        bundle = ResultsBundle(manifest)
+        bundle.add_result(
+            ResultRecord(
+                engine="SQLite",
+                engine_version="3.44.0",
+                benchmark="point_select",
+                operations=10000,
+                duration_sec=1.5,
+                latency_ms={"p50_ms": 0.000018, "p95_ms": 0.25},
+                throughput_ops_sec=6666.67,
+            )
+        )
+
+        path = tmp_path / "out" / "results_merged.json"
+        bundle.save(path)
+
+        assert ResultsBundle.load(path).to_dict() == bundle.to_dict()
@@ -0,0 +1,47 @@
+"""Tests for performance timer statistics."""
+
+import pytest
+
+from utils.performance_timer import LatencyTracker, select_ranks
+
+
+class TestLatencyTracker:
+    """Test latency statistics computation."""
+
+    def test_empty_tracker_reports_zeros(self):
+        """An empty tracker should report zeroed statistics."""
+        stats = LatencyTracker().get_statistics()
+
+        assert stats["ops_count"] == 0
+        assert stats["p50_ms"] == 0
+        assert stats["mean_ms"] == 0
+
+    def test_statistics_match_recorded_samples(self):
+        """Min/max/mean/percentiles should reflect every recorded sample."""
+        tracker = LatencyTracker()
+        samples = [5.0, 1.0, 3.0, 2.0, 4.0]
+        for sample in samples:
+            tracker.record(sample)
+        tracker.record_error()
+
+        stats = tracker.get_statistics()
+
+        assert stats["min_ms"] == 1.0
+        assert stats["max_ms"] == 5.0
+        assert stats["mean_ms"] == pytest.approx(3.0)
+        assert stats["p50_ms"] == 3.0
+        assert stats["p95_ms"] == 5.0
+        assert stats["p99_ms"] == 5.0
+        assert stats["ops_count"] == 5
+        assert stats["error_count"] == 1
+
+
+class TestSelectRanks:
+    """Test partition-based order statistics."""
+
+    def test_matches_sorted_indexing(self):
+        """Selected ranks should match indexing into the sorted samples."""
+        values = [9.0, 2.5, 7.0, 1.0, 4.0, 8.0, 3.0]
+        ranks = (0, 3, 6)
+
+        assert select_ranks(values, ranks) == [sorted(values)[r] for r in ranks]
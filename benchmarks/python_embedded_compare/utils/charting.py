@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+import shutil
+from collections import defaultdict
 from pathlib import Path
 from typing import Dict, Iterable, List, Tuple
 
@@ -11,12 +13,15 @@ import matplotlib
 matplotlib.use("Agg")
 
 import matplotlib.pyplot as plt
+import numpy as np
 
 from utils.manifest import ResultsBundle
 
 
 DECENTDB_ENGINE_NAME = "DecentDB"
 
+_SERIES_DTYPE = np.dtype([("operations", np.int64), ("latency_us", np.float64)])
+
 
 def _flatten_bundle(bundle: ResultsBundle) -> List[Dict[str, object]]:
     rows: List[Dict[str, object]] = []
@@ -46,10 +51,19 @@ def _flatten_bundle(bundle: ResultsBundle) -> List[Dict[str, object]]:
     return rows
 
 
-def _write_chart_data(rows: List[Dict[str, object]], output_dir: Path) -> None:
+def _group_rows(rows: List[Dict[str, object]], field: str) -> Dict[str, List[Dict[str, object]]]:
+    grouped: Dict[str, List[Dict[str, object]]] = defaultdict(list)
+    for row in rows:
+        grouped[str(row[field])].append(row)
+    return grouped
+
+
+def _write_chart_data(rows: List[Dict[str, object]], output_dir: Path) -> Path:
     output_dir.mkdir(parents=True, exist_ok=True)
     chart_data_path = output_dir / "chart_data.json"
-    chart_data_path.write_text(json.dumps(rows, indent=2), encoding="utf-8")
+    with chart_data_path.open("w", encoding="utf-8") as handle:
+        json.dump(rows, handle, indent=2)
+    return chart_data_path
 
 
 def _style_axes(axis) -> None:
@@ -174,8 +188,17 @@ def _add_decentdb_badge(axis, summary: str | None, *, placement: str = "inside")
     )
 
 
-def _label_decentdb_endpoint(axis, xs: List[int], ys: List[float]) -> None:
-    if not xs or not ys:
+def _engine_series(engine_rows: List[Dict[str, object]]) -> Tuple[np.ndarray, np.ndarray]:
+    series = np.array(
+        [(int(row["operations"]), float(row["mean_latency_us"])) for row in engine_rows],
+        dtype=_SERIES_DTYPE,
+    )
+    series.sort(kind="stable", order="operations")
+    return series["operations"], series["latency_us"]
+
+
+def _label_decentdb_endpoint(axis, xs: np.ndarray, ys: np.ndarray) -> None:
+    if len(xs) == 0 or len(ys) == 0:
         return
 
     axis.annotate(
@@ -213,12 +236,14 @@ def _save_figure(figure, output_dir: Path, base_name: str) -> List[Path]:
     return [svg_path, png_path]
 
 
-def _plot_benchmark_line(rows: List[Dict[str, object]], benchmark: str, output_dir: Path) -> List[Path]:
-    benchmark_rows = [row for row in rows if row["benchmark"] == benchmark]
+def _plot_benchmark_line(
+    benchmark_rows: List[Dict[str, object]], benchmark: str, output_dir: Path
+) -> List[Path]:
     if not benchmark_rows:
         return []
 
-    engines = sorted({str(row["engine"]) for row in benchmark_rows}, key=_engine_sort_key)
+    rows_by_engine = _group_rows(benchmark_rows, "engine")
+    engines = sorted(rows_by_engine, key=_engine_sort_key)
     op_counts = sorted({int(row["operations"]) for row in benchmark_rows})
 
     plt.style.use("default")
@@ -228,10 +253,7 @@ def _plot_benchmark_line(rows: List[Dict[str, object]], benchmark: str, output_d
     figure.set_constrained_layout_pads(h_pad=0.08, w_pad=0.04, hspace=0.04, wspace=0.04)
 
     for index, engine in enumerate(engines):
-        engine_rows = [row for row in benchmark_rows if row["engine"] == engine]
-        engine_rows.sort(key=lambda row: int(row["operations"]))
-        xs = [int(row["operations"]) for row in engine_rows]
-        ys = [float(row["mean_latency_us"]) for row in engine_rows]
+        xs, ys = _engine_series(rows_by_engine[engine])
         style = _engine_style(engine, index)
         axis.plot(
             xs,
@@ -265,12 +287,13 @@ def _plot_benchmark_line(rows: List[Dict[str, object]], benchmark: str, output_d
     return _save_figure(figure, output_dir, f"{benchmark}-latency")
 
 
-def _plot_benchmark_bar(rows: List[Dict[str, object]], benchmark: str, output_dir: Path) -> List[Path]:
-    benchmark_rows = [row for row in rows if row["benchmark"] == benchmark]
+def _plot_benchmark_bar(
+    benchmark_rows: List[Dict[str, object]], benchmark: str, output_dir: Path
+) -> List[Path]:
     if not benchmark_rows:
         return []
 
-    benchmark_rows.sort(key=lambda row: float(row["mean_latency_us"]))
+    benchmark_rows = sorted(benchmark_rows, key=lambda row: float(row["mean_latency_us"]))
     labels = [str(row["engine"]) for row in benchmark_rows]
     values = [float(row["mean_latency_us"]) for row in benchmark_rows]
     colors = [str(_engine_style(label, index)["color"]) for index, label in enumerate(labels)]
@@ -318,8 +341,12 @@ def _plot_benchmark_bar(rows: List[Dict[str, object]], benchmark: str, output_di
     return _save_figure(figure, output_dir, f"{benchmark}-latency")
 
 
-def _plot_overview(rows: List[Dict[str, object]], output_dir: Path) -> List[Path]:
-    benchmarks = sorted({str(row["benchmark"]) for row in rows})
+def _plot_overview(
+    rows: List[Dict[str, object]],
+    rows_by_benchmark: Dict[str, List[Dict[str, object]]],
+    output_dir: Path,
+) -> List[Path]:
+    benchmarks = sorted(rows_by_benchmark)
     op_counts = sorted({int(row["operations"]) for row in rows})
 
     plt.style.use("default")
@@ -331,15 +358,14 @@ def _plot_overview(rows: List[Dict[str, object]], output_dir: Path) -> List[Path
         engines = sorted({str(row["engine"]) for row in rows}, key=_engine_sort_key)
         for axis, benchmark in zip(axes_list, benchmarks):
             _style_axes(axis)
-            benchmark_rows = [row for row in rows if row["benchmark"] == benchmark]
+            benchmark_rows = rows_by_benchmark[benchmark]
+            rows_by_engine = _group_rows(benchmark_rows, "engine")
             for index, engine in enumerate(engines):
-                engine_rows = [row for row in benchmark_rows if row["engine"] == engine]
+                engine_rows = rows_by_engine.get(engine)
                 if not engine_rows:
                     continue
-                engine_rows.sort(key=lambda row: int(row["operations"]))
                 style = _engine_style(engine, index)
-                xs = [int(row["operations"]) for row in engine_rows]
-                ys = [float(row["mean_latency_us"]) for row in engine_rows]
+                xs, ys = _engine_series(engine_rows)
                 axis.plot(
                     xs,
                     ys,
@@ -367,8 +393,9 @@ def _plot_overview(rows: List[Dict[str, object]], output_dir: Path) -> List[Path
     else:
         for axis, benchmark in zip(axes_list, benchmarks):
             _style_axes(axis)
-            benchmark_rows = [row for row in rows if row["benchmark"] == benchmark]
-            benchmark_rows.sort(key=lambda row: float(row["mean_latency_us"]))
+            benchmark_rows = sorted(
+                rows_by_benchmark[benchmark], key=lambda row: float(row["mean_latency_us"])
+            )
             labels = [str(row["engine"]) for row in benchmark_rows]
             values = [float(row["mean_latency_us"]) for row in benchmark_rows]
             colors = [str(_engine_style(label, index)["color"]) for index, label in enumerate(labels)]
@@ -409,18 +436,20 @@ def export_latency_charts(
     if not rows:
         return []
 
-    _write_chart_data(rows, output_dir)
+    chart_data_path = _write_chart_data(rows, output_dir)
     exported: List[Path] = []
-    benchmarks = sorted({str(row["benchmark"]) for row in rows})
+    rows_by_benchmark = _group_rows(rows, "benchmark")
+    benchmarks = sorted(rows_by_benchmark)
     op_counts = sorted({int(row["operations"]) for row in rows})
 
-    exported.extend(_plot_overview(rows, output_dir))
+    exported.extend(_plot_overview(rows, rows_by_benchmark, output_dir))
 
     for benchmark in benchmarks:
+        benchmark_rows = rows_by_benchmark[benchmark]
         if len(op_counts) > 1:
-            exported.extend(_plot_benchmark_line(rows, benchmark, output_dir))
+            exported.extend(_plot_benchmark_line(benchmark_rows, benchmark, output_dir))
         else:
-            exported.extend(_plot_benchmark_bar(rows, benchmark, output_dir))
+            exported.extend(_plot_benchmark_bar(benchmark_rows, benchmark, output_dir))
 
     if docs_assets_dir is not None:
         workload_name = str(rows[0]["workload"])
@@ -429,11 +458,8 @@ def export_latency_charts(
         for existing_path in workload_docs_dir.iterdir():
             if existing_path.is_file():
                 existing_path.unlink()
-        (workload_docs_dir / "chart_data.json").write_text(
-            json.dumps(rows, indent=2), encoding="utf-8"
-        )
+        shutil.copyfile(chart_data_path, workload_docs_dir / chart_data_path.name)
         for path in exported:
-            target = workload_docs_dir / path.name
-            target.write_bytes(path.read_bytes())
+            shutil.copyfile(path, workload_docs_dir / path.name)
 
     return exported
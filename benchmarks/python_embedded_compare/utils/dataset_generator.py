@@ -43,7 +43,7 @@ class GeneratorConfig:
     path_cardinality: int = 100
 
 
-@dataclass
+@dataclass(slots=True)
 class Customer:
     """Customer record."""
 
@@ -52,7 +52,7 @@ class Customer:
     created_at: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """Order record."""
 
@@ -63,7 +63,7 @@ class Order:
     total_cents: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """Web analytics event record."""
 
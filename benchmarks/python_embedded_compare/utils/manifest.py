@@ -7,17 +7,65 @@ Each benchmark run produces a manifest that captures:
 - Environment details
 """
 
+import json
 import os
 import platform
 import socket
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup.
+    orjson = None
+
+
+def write_json(path: Path, document: Any):
+    """Write a JSON document with two-space indentation.
+
+    Uses orjson when it is installed and falls back to the stdlib encoder.
+    """
+    if orjson is not None:
+        Path(path).write_bytes(
+            orjson.dumps(
+                document, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        )
+        return
+    with open(path, "w") as f:
+        json.dump(document, f, indent=2)
+
+
+@lru_cache(maxsize=1)
+def _read_linux_cpu_model() -> Optional[str]:
+    """Return the first ``model name`` entry from /proc/cpuinfo, if any."""
+    # The first processor block holds the model name, so a single bounded
+    # read plus a substring search avoids walking every per-core block.
+    with open("/proc/cpuinfo", "rb") as f:
+        data = f.read(16384)
+    start = data.find(b"model name")
+    if start < 0:
+        return None
+    end = data.find(b"\n", start)
+    line = data[start:end] if end >= 0 else data[start:]
+    _, sep, value = line.partition(b":")
+    if not sep:
+        return None
+    return value.strip().decode("utf-8", errors="replace")
+
 
 def get_machine_info() -> Dict[str, str]:
     """Get machine and environment information."""
+    # Each run manifest gets its own copy so callers may annotate it freely.
+    return dict(_collect_machine_info())
+
+
+@lru_cache(maxsize=1)
+def _collect_machine_info() -> Dict[str, str]:
+    """Probe machine details once per process."""
     info = {
         "hostname": socket.gethostname(),
         "os": platform.system(),
@@ -25,18 +73,15 @@ def get_machine_info() -> Dict[str, str]:
         "arch": platform.machine(),
     }
 
-    # Try to get CPU info
+    # Try to get CPU info, falling back to portable probes off Linux (or
+    # when /proc/cpuinfo has no model name, e.g. on some ARM kernels).
+    cpu_model = None
     try:
         if platform.system() == "Linux" and os.path.exists("/proc/cpuinfo"):
-            with open("/proc/cpuinfo", "r") as f:
-                for line in f:
-                    if line.startswith("model name"):
-                        info["cpu_model"] = line.split(":", 1)[1].strip()
-                        break
-        else:
-            info["cpu_model"] = platform.processor()
+            cpu_model = _read_linux_cpu_model()
     except:
-        info["cpu_model"] = "unknown"
+        pass
+    info["cpu_model"] = cpu_model or platform.processor() or platform.machine() or "unknown"
 
     # Try to get memory info
     try:
@@ -229,16 +274,11 @@ class ResultsBundle:
 
     def save(self, path: Path):
         """Save results to JSON file."""
-        import json
-
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w") as f:
-            json.dump(self.to_dict(), f, indent=2)
+        write_json(path, self.to_dict())
 
     @classmethod
     def load(cls, path: Path) -> "ResultsBundle":
         """Load results from JSON file."""
-        import json
-
         with open(path, "r") as f:
             return cls.from_dict(json.load(f))
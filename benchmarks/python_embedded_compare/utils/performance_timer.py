@@ -3,9 +3,30 @@
 Provides nanosecond-resolution timing using time.perf_counter().
 """
 
+import math
 import time
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+
+def select_ranks(values: Sequence[float], ranks: Sequence[int]) -> List[float]:
+    """Return the values at the given sorted-order ranks.
+
+    Uses numpy's introselect partition, which is O(n) on average instead of
+    the O(n log n) full sort needed to index into ``sorted(values)``.
+
+    Args:
+        values: Unordered samples
+        ranks: Zero-based positions in sorted order
+
+    Returns:
+        The selected samples, in the same order as ``ranks``
+    """
+    arr = np.fromiter(values, dtype=np.float64, count=len(values))
+    kth = list(ranks)
+    return np.partition(arr, kth)[kth].tolist()
 
 
 @dataclass
@@ -72,11 +93,20 @@ class LatencyTracker:
         self.latencies_ms: List[float] = []
         self.operation_count: int = 0
         self.error_count: int = 0
+        # Running accumulators so min/max/mean never need an extra pass.
+        self._total_ms: float = 0.0
+        self._min_ms: float = math.inf
+        self._max_ms: float = -math.inf
 
     def record(self, latency_ms: float):
         """Record a latency measurement in milliseconds."""
         self.latencies_ms.append(latency_ms)
         self.operation_count += 1
+        self._total_ms += latency_ms
+        if latency_ms < self._min_ms:
+            self._min_ms = latency_ms
+        if latency_ms > self._max_ms:
+            self._max_ms = latency_ms
 
     def record_error(self):
         """Record an error (no latency)."""
@@ -100,18 +130,19 @@ class LatencyTracker:
                 "error_count": 0,
             }
 
-        sorted_latencies = sorted(self.latencies_ms)
-        n = len(sorted_latencies)
+        n = len(self.latencies_ms)
+        p50, p95, p99 = select_ranks(
+            self.latencies_ms,
+            (int(n * 0.50), int(n * 0.95), int(n * 0.99) if n >= 100 else n - 1),
+        )
 
         return {
-            "min_ms": sorted_latencies[0],
-            "max_ms": sorted_latencies[-1],
-            "mean_ms": sum(sorted_latencies) / n,
-            "p50_ms": sorted_latencies[int(n * 0.50)],
-            "p95_ms": sorted_latencies[int(n * 0.95)],
-            "p99_ms": sorted_latencies[int(n * 0.99)]
-            if n >= 100
-            else sorted_latencies[-1],
+            "min_ms": self._min_ms,
+            "max_ms": self._max_ms,
+            "mean_ms": self._total_ms / n,
+            "p50_ms": p50,
+            "p95_ms": p95,
+            "p99_ms": p99,
             "ops_count": self.operation_count,
             "error_count": self.error_count,
         }
@@ -171,13 +202,13 @@ class BenchmarkRunner:
             op_func(*args, **kwargs)
 
         # Benchmark phase
+        now = time.perf_counter
         self.timer.start()
         for _ in range(self.ops):
-            op_timer = Timer()
-            op_timer.start()
+            started = now()
             try:
                 op_func(*args, **kwargs)
-                latency = op_timer.stop()
+                latency = now() - started
                 self.latency_tracker.record(latency * 1000)  # Convert to ms
             except Exception:
                 self.latency_tracker.record_error()
@@ -213,13 +244,13 @@ class BenchmarkRunner:
             op_func(*params)
 
         # Benchmark phase
+        now = time.perf_counter
         self.timer.start()
         for params in params_list[warmup_count:]:
-            op_timer = Timer()
-            op_timer.start()
+            started = now()
             try:
                 op_func(*params)
-                latency = op_timer.stop()
+                latency = now() - started
                 self.latency_tracker.record(latency * 1000)
             except Exception:
                 self.latency_tracker.record_error()
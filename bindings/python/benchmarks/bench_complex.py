@@ -150,11 +150,13 @@ def remove_if_exists(path):
         pass
 
 
+# The database file plus DecentDB and SQLite sidecars.
+DB_FILE_SUFFIXES = ("", ".wal", "-wal", ".shm", "-shm")
+
+
 def cleanup_db_files(base_path):
-    remove_if_exists(base_path)
-    remove_if_exists(base_path + ".wal")
-    remove_if_exists(base_path + "-wal")
-    remove_if_exists(base_path + "-shm")
+    for suffix in DB_FILE_SUFFIXES:
+        remove_if_exists(base_path + suffix)
 
 
 def percentile_sorted(sorted_values, pct):
@@ -489,17 +491,9 @@ def setup_schema(conn, engine_name):
     cur.execute("CREATE INDEX idx_payments_order_id ON payments(order_id)")
 
 
-def _cleanup_db_files(db_path):
-    for suffix in ("", ".wal", "-wal", ".shm", "-shm"):
-        try:
-            os.unlink(db_path + suffix)
-        except OSError:
-            pass
-
-
 def storage_size_bytes(db_path):
     total = 0
-    for suffix in ("", ".wal", "-wal", ".shm", "-shm"):
+    for suffix in DB_FILE_SUFFIXES:
         path = db_path + suffix
         if os.path.exists(path):
             total += os.path.getsize(path)
@@ -507,7 +501,7 @@ def storage_size_bytes(db_path):
 
 
 def setup_decentdb(db_path, *, options="", stmt_cache_size=128, initialize_complex=True):
-    _cleanup_db_files(db_path)
+    cleanup_db_files(db_path)
     conn = decentdb.connect(db_path, options=options, stmt_cache_size=stmt_cache_size)
     if initialize_complex:
         setup_schema(conn, "decentdb")
@@ -521,7 +515,7 @@ def setup_sqlite(
     cache_mb=64,
     initialize_complex=True,
 ):
-    _cleanup_db_files(db_path)
+    cleanup_db_files(db_path)
     conn = sqlite3.connect(db_path)
     cur = conn.cursor()
     if profile in ("wal_full", "wal_normal"):
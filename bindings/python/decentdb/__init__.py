@@ -1,13 +1,18 @@
 import collections
+import contextlib
 import ctypes
 import datetime
 import decimal
+import functools
 import itertools
 from dataclasses import dataclass
 import ipaddress
 import json
 import os
 import re
+import struct
+import threading
+import time
 import uuid
 import warnings
 import weakref
@@ -22,6 +27,19 @@ try:
 except Exception:
     _fastdecode_native = None
 
+# Engine failures raised by the C fast paths; an empty tuple catches nothing
+# when the extension is unavailable.
+_NativeError = (
+    getattr(_fastdecode_native, "NativeError", ())
+    if _fastdecode_native is not None
+    else ()
+)
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 from .native import (
     DDB_VALUE_BLOB,
     DDB_VALUE_BOOL,
@@ -222,6 +240,9 @@ NUMBER = float
 DATETIME = datetime.datetime
 ROWID = int
 _UNIX_EPOCH_UTC = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+# Powers of ten for every possible decimal_scale (a uint8 in the C ABI).
+_DECIMAL_POW10 = tuple(decimal.Decimal(10) ** scale for scale in range(256))
+_DECIMAL_QUANTUM_18 = decimal.Decimal(10) ** -18
 _UNIX_EPOCH_DATE = datetime.date(1970, 1, 1)
 
 
@@ -345,6 +366,10 @@ def _raise_error(code, *, sql=None, params=None):
     raise DatabaseError(message, diagnostic=diagnostic, native_code=native_code)
 
 
+def _raise_native_error(exc, *, sql=None, params=None):
+    _raise_error(int(exc.args[1]), sql=sql, params=params)
+
+
 def _encode_queued_param(value):
     native = DdbValue()
     native.tag = DDB_VALUE_NULL
@@ -388,11 +413,11 @@ def _encode_queued_param(value):
             int_val = int(value)
             scale = 0
         elif scale > 18:
-            quantized = value.quantize(decimal.Decimal(10) ** -18)
+            quantized = value.quantize(_DECIMAL_QUANTUM_18)
             scale = 18
-            int_val = int(quantized * (decimal.Decimal(10) ** 18))
+            int_val = int(quantized * _DECIMAL_POW10[18])
         else:
-            int_val = int(value * (decimal.Decimal(10) ** scale))
+            int_val = int(value * _DECIMAL_POW10[scale])
         if int_val < -(2 ** 63) or int_val > (2 ** 63 - 1):
             raise DataError("Decimal value too large for DecentDB")
         native.tag = DDB_VALUE_DECIMAL
@@ -437,6 +462,55 @@ def _encode_queued_param(value):
     return native, keep_alive
 
 
+def _bind_null(lib, stmt, index_1_based, param):
+    return lib.ddb_stmt_bind_null(stmt, index_1_based)
+
+
+def _bind_bool(lib, stmt, index_1_based, param):
+    return lib.ddb_stmt_bind_bool(stmt, index_1_based, 1 if param else 0)
+
+
+def _bind_int64(lib, stmt, index_1_based, param):
+    return lib.ddb_stmt_bind_int64(stmt, index_1_based, param)
+
+
+def _bind_float64(lib, stmt, index_1_based, param):
+    return lib.ddb_stmt_bind_float64(stmt, index_1_based, param)
+
+
+def _bind_text(lib, stmt, index_1_based, param):
+    raw = param.encode("utf-8")
+    return lib.ddb_stmt_bind_text(stmt, index_1_based, raw, len(raw))
+
+
+_native_bind_text = (
+    getattr(_fastdecode_native, "bind_text", None)
+    if _fastdecode_native is not None
+    else None
+)
+
+
+def _bind_text_native(lib, stmt, index_1_based, param):
+    return _native_bind_text(stmt.value, index_1_based, param)
+
+
+def _bind_blob(lib, stmt, index_1_based, param):
+    return lib.ddb_stmt_bind_blob(stmt, index_1_based, param or None, len(param))
+
+
+# Exact-type dispatch for the common parameter types. Subclasses (IntEnum,
+# str enums, ...) and the richer types fall through to the isinstance chain
+# in Cursor._bind_param.
+_BIND_DISPATCH = {
+    type(None): _bind_null,
+    bool: _bind_bool,
+    int: _bind_int64,
+    float: _bind_float64,
+    str: _bind_text if _native_bind_text is None else _bind_text_native,
+    bytes: _bind_blob,
+}
+
+
 def _prepare_queued_params(params):
     if not params:
         return [], []
@@ -494,32 +568,63 @@ def _build_open_options(
     return " ".join(option_items)
 
 
+_NAMED_PARAM_RE = re.compile(r":([a-zA-Z_][a-zA-Z0-9_]*)")
+# Per-connection LRU of named-parameter SQL -> (rewritten SQL, name order).
+_NAMED_REWRITE_CACHE_SIZE = 256
+
+
+def _rewrite_named_params(sql):
+    """Rewrite ``:name`` placeholders to ``$N``; return the SQL and name order."""
+    # split() alternates literal SQL and captured names, so odd slots are names.
+    parts = _NAMED_PARAM_RE.split(sql)
+    positions = {}
+    for i in range(1, len(parts), 2):
+        name = parts[i]
+        position = positions.get(name)
+        if position is None:
+            position = positions[name] = len(positions) + 1
+        parts[i] = f"${position}"
+    return "".join(parts), tuple(positions)
+
+
+def _named_param_values(names, params):
+    try:
+        return [params[name] for name in names]
+    except KeyError:
+        for name in names:
+            if name not in params:
+                raise ProgrammingError(f"Missing parameter '{name}'") from None
+        raise
+
+
+def _named_rows_as_positional(names, rows):
+    for params in rows:
+        if type(params) is not dict and not isinstance(params, Mapping):
+            raise ProgrammingError(
+                "Mixed parameter styles are not supported in executemany"
+            )
+        yield _named_param_values(names, params)
+
+
 def _convert_params(sql, params):
     if params is None:
         return sql, []
 
-    if isinstance(params, Mapping):
+    params_type = type(params)
+    if params_type is dict or (
+        params_type is not tuple
+        and params_type is not list
+        and isinstance(params, Mapping)
+    ):
         if "?" in sql:
             raise ProgrammingError(
                 "Mixed parameter styles are not supported: got named parameters with qmark placeholders"
             )
 
-        param_map = {}
-        new_params = []
-
-        def replace(match):
-            name = match.group(1)
-            if name not in param_map:
-                if name not in params:
-                    raise ProgrammingError(f"Missing parameter '{name}'")
-                param_map[name] = len(new_params) + 1
-                new_params.append(params[name])
-            return f"${param_map[name]}"
+        new_sql, names = _rewrite_named_params(sql)
+        return new_sql, _named_param_values(names, params)
 
-        new_sql = re.sub(r":([a-zA-Z_][a-zA-Z0-9_]*)", replace, sql)
-        return new_sql, new_params
-
-    if re.search(r":([a-zA-Z_][a-zA-Z0-9_]*)", sql) is not None:
+    if ":" in sql and _NAMED_PARAM_RE.search(sql) is not None:
         raise ProgrammingError(
             "Mixed parameter styles are not supported: got positional parameters with named placeholders"
         )
@@ -530,11 +635,13 @@ def _convert_params(sql, params):
             raise ProgrammingError(
                 f"Incorrect number of parameters: expected {len(parts) - 1}, got {len(params)}"
             )
-        new_sql = ""
-        for i in range(len(parts) - 1):
-            new_sql += parts[i] + f"${i + 1}"
-        new_sql += parts[-1]
-        return new_sql, params
+        pieces = []
+        append = pieces.append
+        for i, part in enumerate(parts[:-1], start=1):
+            append(part)
+            append(f"${i}")
+        append(parts[-1])
+        return "".join(pieces), params
 
     return sql, params
 
@@ -682,8 +789,9 @@ def _decode_ffi_value(lib, value):
             return b""
         return bytes(ctypes.string_at(value.data, value.len))
     if tag == DDB_VALUE_DECIMAL:
-        return decimal.Decimal(int(value.decimal_scaled)) / (
-            decimal.Decimal(10) ** int(value.decimal_scale)
+        return (
+            decimal.Decimal(value.decimal_scaled)
+            / _DECIMAL_POW10[value.decimal_scale]
         )
     if tag == DDB_VALUE_UUID:
         return bytes(bytearray(value.uuid_bytes))
@@ -694,6 +802,98 @@ def _decode_ffi_value(lib, value):
     return _decode_semantic_value(value)
 
 
+def _value_view_head_struct():
+    # Only the fields the scalar decoders read; everything else is padding.
+    # Offsets come from the ctypes layout so the stride always matches
+    # sizeof(ddb_value_view_t).
+    word = "Q" if ctypes.sizeof(ctypes.c_void_p) == 8 else "I"
+    fields = (
+        ("tag", "I"),
+        ("bool_value", "B"),
+        ("int64_value", "q"),
+        ("float64_value", "d"),
+        ("decimal_scaled", "q"),
+        ("decimal_scale", "B"),
+        ("data", word),
+        ("len", word),
+    )
+    fmt = ["="]
+    position = 0
+    for name, code in fields:
+        offset = getattr(DdbValueView, name).offset
+        if offset > position:
+            fmt.append(f"{offset - position}x")
+        fmt.append(code)
+        position = offset + struct.calcsize("=" + code)
+    tail = ctypes.sizeof(DdbValueView) - position
+    if tail:
+        fmt.append(f"{tail}x")
+    return struct.Struct("".join(fmt))
+
+
+_VALUE_VIEW_HEAD = _value_view_head_struct()
+
+
+def _decode_value_views(lib, values_ptr, count):
+    """Decode ``count`` consecutive value views into a flat list.
+
+    Scalar columns are read from one struct unpack of the view array rather
+    than per-field ctypes attribute access; rarer tags use the ctypes view.
+    """
+    string_at = ctypes.string_at
+    raw = string_at(
+        ctypes.addressof(values_ptr.contents), _VALUE_VIEW_HEAD.size * count
+    )
+    out = []
+    append = out.append
+    for index, (
+        tag,
+        bool_value,
+        int64_value,
+        float64_value,
+        decimal_scaled,
+        decimal_scale,
+        data,
+        length,
+    ) in enumerate(_VALUE_VIEW_HEAD.iter_unpack(raw)):
+        if tag == DDB_VALUE_NULL:
+            append(None)
+        elif tag == DDB_VALUE_INT64:
+            append(int64_value)
+        elif tag == DDB_VALUE_FLOAT64:
+            append(float64_value)
+        elif tag == DDB_VALUE_BOOL:
+            append(bool_value != 0)
+        elif tag == DDB_VALUE_TEXT:
+            if not data or length == 0:
+                append("")
+            else:
+                append(string_at(data, length).decode("utf-8"))
+        elif tag in _BINARY_BYTES_TAGS:
+            if not data or length == 0:
+                append(b"")
+            else:
+                append(string_at(data, length))
+        elif tag == DDB_VALUE_DECIMAL:
+            append(decimal.Decimal(decimal_scaled) / _DECIMAL_POW10[decimal_scale])
+        elif tag == DDB_VALUE_UUID:
+            append(bytes(values_ptr[index].uuid_bytes))
+        elif tag == DDB_VALUE_TIMESTAMP_MICROS:
+            append(
+                _UNIX_EPOCH_UTC
+                + datetime.timedelta(microseconds=values_ptr[index].timestamp_micros)
+            )
+        else:
+            append(_decode_ffi_value(lib, values_ptr[index]))
+    return out
+
+
+@functools.lru_cache(maxsize=256)
+def _utf8(text):
+    """Encode a table or view name once; repeated names hit the cache."""
+    return text.encode("utf-8")
+
+
 def _string_out(lib, func, *args):
     out = ctypes.c_char_p()
     code = func(*args, ctypes.byref(out))
@@ -715,10 +915,24 @@ class Cursor:
         self._has_buffered_row = False
         self._buffered_row = None
         self._prefetched_rows = None
+        self._iter_prefetched_rows = None
         self._query_active = False
         self.description = None
         self.rowcount = -1
         self.arraysize = 1
+        # Reusable out-parameters for the per-row step/row-view calls. The
+        # native side overwrites them on every call and rows are decoded
+        # before the next call, so one set per cursor is enough.
+        self._out_values_ptr = ctypes.POINTER(DdbValueView)()
+        self._out_count = ctypes.c_size_t()
+        self._out_has_row = ctypes.c_uint8()
+        self._out_values_ptr_ref = ctypes.byref(self._out_values_ptr)
+        self._out_count_ref = ctypes.byref(self._out_count)
+        self._out_has_row_ref = ctypes.byref(self._out_has_row)
+        self._out_affected = ctypes.c_uint64()
+        self._out_affected_ref = ctypes.byref(self._out_affected)
+        self._out_columns = ctypes.c_size_t()
+        self._out_columns_ref = ctypes.byref(self._out_columns)
         self._closed = False
         self._rewrite_sql_cache = {}
         self._metadata_cache = {}
@@ -737,6 +951,11 @@ class Cursor:
         )
         if self._fetchall_chunk_rows < 0:
             self._fetchall_chunk_rows = 0
+        self._iter_batch_rows = int(
+            os.environ.get("DECENTDB_PY_ITER_BATCH_ROWS", "256") or "0"
+        )
+        if self._iter_batch_rows < 0:
+            self._iter_batch_rows = 0
         self._use_row_view = os.environ.get(
             "DECENTDB_PY_USE_ROW_VIEW", "1"
         ) != "0" and hasattr(self._lib, "ddb_stmt_row_view")
@@ -829,6 +1048,16 @@ class Cursor:
             if _fastdecode_native is not None
             else None
         )
+        self._decode_row_generic_native = (
+            getattr(_fastdecode_native, "decode_row_generic", None)
+            if _fastdecode_native is not None
+            else None
+        )
+        self._decode_matrix_generic_native = (
+            getattr(_fastdecode_native, "decode_matrix_generic", None)
+            if _fastdecode_native is not None
+            else None
+        )
         self._decode_row_i64_f64_text_text_i64_f64_native = (
             getattr(_fastdecode_native, "decode_row_i64_f64_text_text_i64_f64", None)
             if _fastdecode_native is not None
@@ -894,6 +1123,16 @@ class Cursor:
             if _fastdecode_native is not None
             else None
         )
+        self._native_step_row_generic = (
+            getattr(_fastdecode_native, "step_row_generic", None)
+            if _fastdecode_native is not None
+            else None
+        )
+        self._native_execute_many_generic = (
+            getattr(_fastdecode_native, "execute_many_generic", None)
+            if _fastdecode_native is not None
+            else None
+        )
         self._native_bind_int64_fetch_all_row_views = (
             getattr(_fastdecode_native, "bind_int64_fetch_all_row_views", None)
             if _fastdecode_native is not None
@@ -971,6 +1210,11 @@ class Cursor:
             if _fastdecode_native is not None
             else None
         )
+        self._native_reset_bind_step_affected = (
+            getattr(_fastdecode_native, "reset_bind_step_affected", None)
+            if _fastdecode_native is not None
+            else None
+        )
         self._native_fetch_rows_i64_text_f64 = (
             getattr(_fastdecode_native, "fetch_rows_i64_text_f64", None)
             if _fastdecode_native is not None
@@ -1021,6 +1265,9 @@ class Cursor:
         self._native_reset_bind_int64_step_affected_enabled = (
             self._native_reset_bind_int64_step_affected is not None
         )
+        self._native_reset_bind_step_affected_enabled = (
+            self._native_reset_bind_step_affected is not None
+        )
         self._native_fetch_rows_i64_text_f64_sql_support = {}
         self._decode_matrix_i64_text_sql_support = {}
         self._decode_matrix_i64_f64_sql_support = {}
@@ -1084,6 +1331,7 @@ class Cursor:
         self._has_buffered_row = False
         self._buffered_row = None
         self._prefetched_rows = None
+        self._iter_prefetched_rows = None
         self._query_active = False
         self.description = None
         self._bound_param_count = None
@@ -1111,11 +1359,10 @@ class Cursor:
         self._metadata_cache[sql] = (0, None)
 
     def _load_description(self):
-        count = ctypes.c_size_t()
-        code = self._lib.ddb_stmt_column_count(self._stmt, ctypes.byref(count))
+        code = self._lib.ddb_stmt_column_count(self._stmt, self._out_columns_ref)
         if code != ERR_OK:
             _raise_error(code, sql=self._last_sql, params=None)
-        self._col_count = int(count.value)
+        self._col_count = int(self._out_columns.value)
         if self._col_count == 0:
             self.description = None
             return
@@ -1135,7 +1382,10 @@ class Cursor:
         self.description = desc
 
     def _bind_param(self, index_1_based, param, sql, params):
-        if param is None:
+        bind = _BIND_DISPATCH.get(type(param))
+        if bind is not None:
+            code = bind(self._lib, self._stmt, index_1_based, param)
+        elif param is None:
             code = self._lib.ddb_stmt_bind_null(self._stmt, index_1_based)
         elif isinstance(param, bool):
             code = self._lib.ddb_stmt_bind_bool(
@@ -1152,38 +1402,19 @@ class Cursor:
             )
         elif isinstance(param, GeometryWKB):
             raw = param.data
-            if raw:
-                array_type = ctypes.c_uint8 * len(raw)
-                payload = array_type.from_buffer_copy(raw)
-                code = self._lib.ddb_stmt_bind_geometry_wkb(
-                    self._stmt, index_1_based, payload, len(raw)
-                )
-            else:
-                code = self._lib.ddb_stmt_bind_geometry_wkb(
-                    self._stmt, index_1_based, None, 0
-                )
+            code = self._lib.ddb_stmt_bind_geometry_wkb(
+                self._stmt, index_1_based, raw or None, len(raw)
+            )
         elif isinstance(param, GeographyWKB):
             raw = param.data
-            if raw:
-                array_type = ctypes.c_uint8 * len(raw)
-                payload = array_type.from_buffer_copy(raw)
-                code = self._lib.ddb_stmt_bind_geography_wkb(
-                    self._stmt, index_1_based, payload, len(raw)
-                )
-            else:
-                code = self._lib.ddb_stmt_bind_geography_wkb(
-                    self._stmt, index_1_based, None, 0
-                )
+            code = self._lib.ddb_stmt_bind_geography_wkb(
+                self._stmt, index_1_based, raw or None, len(raw)
+            )
         elif isinstance(param, (bytes, bytearray, memoryview)):
             raw = bytes(param)
-            if raw:
-                array_type = ctypes.c_uint8 * len(raw)
-                payload = array_type.from_buffer_copy(raw)
-                code = self._lib.ddb_stmt_bind_blob(
-                    self._stmt, index_1_based, payload, len(raw)
-                )
-            else:
-                code = self._lib.ddb_stmt_bind_blob(self._stmt, index_1_based, None, 0)
+            code = self._lib.ddb_stmt_bind_blob(
+                self._stmt, index_1_based, raw or None, len(raw)
+            )
         elif isinstance(param, decimal.Decimal):
             t = param.as_tuple()
             exponent = t.exponent
@@ -1194,22 +1425,19 @@ class Cursor:
                 int_val = int(param)
                 scale = 0
             elif scale > 18:
-                quantized = param.quantize(decimal.Decimal(10) ** -18)
+                quantized = param.quantize(_DECIMAL_QUANTUM_18)
                 scale = 18
-                int_val = int(quantized * (decimal.Decimal(10) ** 18))
+                int_val = int(quantized * _DECIMAL_POW10[18])
             else:
-                int_val = int(param * (decimal.Decimal(10) ** scale))
+                int_val = int(param * _DECIMAL_POW10[scale])
             if int_val < -9223372036854775808 or int_val > 9223372036854775807:
                 raise DataError("Decimal value too large for DecentDB")
             code = self._lib.ddb_stmt_bind_decimal(
                 self._stmt, index_1_based, int_val, scale
             )
         elif isinstance(param, uuid.UUID):
-            raw = param.bytes
-            array_type = ctypes.c_uint8 * len(raw)
-            payload = array_type.from_buffer_copy(raw)
             code = self._lib.ddb_stmt_bind_blob(
-                self._stmt, index_1_based, payload, len(raw)
+                self._stmt, index_1_based, param.bytes, 16
             )
         elif isinstance(param, datetime.datetime):
             epoch = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
@@ -1275,6 +1503,7 @@ class Cursor:
                 self._has_buffered_row = False
                 self._buffered_row = None
                 self._prefetched_rows = None
+                self._iter_prefetched_rows = None
                 self.rowcount = 0
             finally:
                 self._lib.ddb_result_free(ctypes.byref(result))
@@ -1286,10 +1515,12 @@ class Cursor:
         self._has_buffered_row = False
         self._buffered_row = None
         self._prefetched_rows = None
+        self._iter_prefetched_rows = None
         self.rowcount = 0
 
     def _activate_statement(self, sql, params, param_count):
         self._prefetched_rows = None
+        self._iter_prefetched_rows = None
         if self._stmt and self._last_sql != sql:
             for i, (slot_sql, slot_stmt) in enumerate(self._cursor_stmt_slots):
                 if slot_sql == sql:
@@ -1354,8 +1585,8 @@ class Cursor:
             params_type = type(parameters)
             if params_type is tuple or params_type is list:
                 cache_key = (operation, "seq", len(parameters))
-            elif isinstance(parameters, Mapping):
-                cache_key = None
+            elif params_type is dict or isinstance(parameters, Mapping):
+                return self._resolve_named_sql_and_params(operation, parameters)
             else:
                 try:
                     param_count = len(parameters)
@@ -1374,6 +1605,26 @@ class Cursor:
             self._rewrite_sql_cache[cache_key] = sql
         return sql, params
 
+    def _resolve_named_sql_and_params(self, operation, parameters):
+        sql, names = self._rewrite_named_sql_cached(operation)
+        return sql, _named_param_values(names, parameters)
+
+    def _rewrite_named_sql_cached(self, operation):
+        cache = self._connection._named_rewrite_cache
+        cached = cache.get(operation)
+        if cached is None:
+            if "?" in operation:
+                raise ProgrammingError(
+                    "Mixed parameter styles are not supported: got named parameters with qmark placeholders"
+                )
+            cached = _rewrite_named_params(operation)
+            cache[operation] = cached
+            if len(cache) > _NAMED_REWRITE_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(operation)
+        return cached
+
     def _is_direct_execute_sql_cached(self, sql):
         cached = self._is_direct_execute_sql_cache.get(sql)
         if cached is not None:
@@ -1388,11 +1639,10 @@ class Cursor:
             self._bind_param(i, param, sql, params)
             bound_count = i
 
-        has_row = ctypes.c_uint8()
-        code = self._lib.ddb_stmt_step(self._stmt, ctypes.byref(has_row))
+        code = self._lib.ddb_stmt_step(self._stmt, self._out_has_row_ref)
         if code != ERR_OK:
             _raise_error(code, sql=sql, params=params)
-        return bool(has_row.value), bound_count
+        return bool(self._out_has_row.value), bound_count
 
     def _execute_current_statement_bind_i64_step_row_view(self, sql, param, params):
         if self._native_bind_int64_step_i64_text_f64_enabled and self._stmt is not None:
@@ -1418,22 +1668,21 @@ class Cursor:
                 except Exception:
                     self._native_bind_int64_step_row_view_sql_support[sql] = False
 
-        values_ptr = ctypes.POINTER(DdbValueView)()
-        out_count = ctypes.c_size_t()
-        has_row = ctypes.c_uint8()
         code = self._lib.ddb_stmt_bind_int64_step_row_view(
             self._stmt,
             1,
             param,
-            ctypes.byref(values_ptr),
-            ctypes.byref(out_count),
-            ctypes.byref(has_row),
+            self._out_values_ptr_ref,
+            self._out_count_ref,
+            self._out_has_row_ref,
         )
         if code != ERR_OK:
             _raise_error(code, sql=sql, params=params)
-        if not has_row.value:
+        if not self._out_has_row.value:
             return False, 1, None
-        row = self._decode_row_view_values(values_ptr, int(out_count.value))
+        row = self._decode_row_view_values(
+            self._out_values_ptr, self._out_count.value
+        )
         return True, 1, row
 
     def _execute_current_statement_bind_text_step_row_view(self, sql, param, params):
@@ -1475,11 +1724,10 @@ class Cursor:
 
         self._bind_param(1, params[0], sql, params)
         self._bind_param(2, params[1], sql, params)
-        has_row = ctypes.c_uint8()
-        code = self._lib.ddb_stmt_step(self._stmt, ctypes.byref(has_row))
+        code = self._lib.ddb_stmt_step(self._stmt, self._out_has_row_ref)
         if code != ERR_OK:
             _raise_error(code, sql=sql, params=params)
-        return bool(has_row.value), 2, None
+        return bool(self._out_has_row.value), 2, None
 
     def _execute_current_statement_bind_text_i64_step(self, sql, params):
         if self._native_bind_text_i64_step_affected_enabled and self._stmt is not None:
@@ -1502,11 +1750,10 @@ class Cursor:
 
         self._bind_param(1, params[0], sql, params)
         self._bind_param(2, params[1], sql, params)
-        has_row = ctypes.c_uint8()
-        code = self._lib.ddb_stmt_step(self._stmt, ctypes.byref(has_row))
+        code = self._lib.ddb_stmt_step(self._stmt, self._out_has_row_ref)
         if code != ERR_OK:
             _raise_error(code, sql=sql, params=params)
-        return bool(has_row.value), 2, None
+        return bool(self._out_has_row.value), 2, None
 
     def _execute_current_statement_bind_int64_step_affected(self, sql, param, params):
         if self._native_bind_int64_step_affected_enabled and self._stmt is not None:
@@ -1521,7 +1768,9 @@ class Cursor:
         has_row, bound_count = self._execute_current_statement(sql, params)
         return has_row, bound_count, None
 
-    def _execute_cached_non_query_current_statement(self, sql, params):
+    def _execute_cached_non_query_current_statement(
+        self, sql, params, param_count=None
+    ):
         metadata = self._get_cached_metadata(sql)
         if (
             self._stmt is None
@@ -1531,10 +1780,11 @@ class Cursor:
         ):
             return None
 
-        try:
-            param_count = len(params)
-        except TypeError:
-            return None
+        if param_count is None:
+            try:
+                param_count = len(params)
+            except TypeError:
+                return None
 
         if param_count == 1 and type(params[0]) is int:
             if self._native_reset_bind_int64_step_affected_enabled:
@@ -1615,6 +1865,23 @@ class Cursor:
                 has_row, bound_count, affected_rowcount = (
                     self._execute_current_statement_bind_text_i64_step(sql, params)
                 )
+        elif self._native_reset_bind_step_affected_enabled:
+            try:
+                native_result = self._native_reset_bind_step_affected(
+                    self._stmt.value, params
+                )
+            except _NativeError as exc:
+                _raise_native_error(exc, sql=sql, params=params)
+            except (TypeError, ValueError):
+                # Argument and bind-conversion errors happen before the step,
+                # so the Python path can safely run the statement instead.
+                self._native_reset_bind_step_affected_enabled = False
+                return None
+            if native_result is None:
+                return None
+            affected_rowcount, has_row = native_result
+            bound_count = param_count
+            affected_rowcount = int(affected_rowcount)
         else:
             return None
 
@@ -1625,12 +1892,14 @@ class Cursor:
         self._has_buffered_row = False
         self._buffered_row = None
         self._prefetched_rows = None
+        self._iter_prefetched_rows = None
         if affected_rowcount is None:
-            affected = ctypes.c_uint64()
-            code = self._lib.ddb_stmt_affected_rows(self._stmt, ctypes.byref(affected))
+            code = self._lib.ddb_stmt_affected_rows(
+                self._stmt, self._out_affected_ref
+            )
             if code != ERR_OK:
                 _raise_error(code, sql=sql, params=params)
-            affected_rowcount = int(affected.value)
+            affected_rowcount = int(self._out_affected.value)
         self.rowcount = affected_rowcount
         return self
 
@@ -1638,7 +1907,8 @@ class Cursor:
         params_type = type(parameters)
         if params_type is tuple or params_type is list:
             params = parameters
-            sql = self._rewrite_sql_cache.get((operation, "seq", len(parameters)))
+            param_count = len(parameters)
+            sql = self._rewrite_sql_cache.get((operation, "seq", param_count))
         else:
             return None
         if sql is None or self._stmt is None:
@@ -1657,7 +1927,9 @@ class Cursor:
         metadata = self._get_cached_metadata(sql)
         if metadata != (0, None):
             return None
-        return self._execute_cached_non_query_current_statement(sql, params)
+        return self._execute_cached_non_query_current_statement(
+            sql, params, param_count
+        )
 
     def _should_prefetch_small_result(self, sql):
         cached = self._should_prefetch_small_result_sql_cache.get(sql)
@@ -1688,14 +1960,11 @@ class Cursor:
         return cached
 
     def _setup_fast_repeat(self, operation, parameters):
-        if parameters is None or self._stmt is None:
+        if self._stmt is None:
             return
         if not isinstance(parameters, (tuple, list)):
             return
-        try:
-            param_count = len(parameters)
-        except TypeError:
-            return
+        param_count = len(parameters)
         code = 0
         if param_count == 1 and type(parameters[0]) is int:
             if self._native_reset_bind_int64_step_affected_enabled:
@@ -1954,6 +2223,7 @@ class Cursor:
             return None
 
         step_out = ctypes.c_uint8()
+        step_out_ref = ctypes.byref(step_out)
         step_stmt = self._lib.ddb_stmt_step
         bind_param = self._bind_param
         reset_stmt = self._lib.ddb_stmt_reset
@@ -1987,7 +2257,7 @@ class Cursor:
             if code != ERR_OK:
                 _raise_error(code, sql=sql, params=params)
             bind_param(1, params[0], sql, params)
-            code = step_stmt(self._stmt, ctypes.byref(step_out))
+            code = step_stmt(self._stmt, step_out_ref)
             if code != ERR_OK:
                 _raise_error(code, sql=sql, params=params)
 
@@ -2032,6 +2302,7 @@ class Cursor:
             return None
 
         step_out = ctypes.c_uint8()
+        step_out_ref = ctypes.byref(step_out)
         step_stmt = self._lib.ddb_stmt_step
         bind_param = self._bind_param
         reset_stmt = self._lib.ddb_stmt_reset
@@ -2069,7 +2340,7 @@ class Cursor:
                 _raise_error(code, sql=sql, params=params)
             for i, param in enumerate(params, start=1):
                 bind_param(i, param, sql, params)
-            code = step_stmt(self._stmt, ctypes.byref(step_out))
+            code = step_stmt(self._stmt, step_out_ref)
             if code != ERR_OK:
                 _raise_error(code, sql=sql, params=params)
 
@@ -2211,6 +2482,7 @@ class Cursor:
             return None
 
         step_out = ctypes.c_uint8()
+        step_out_ref = ctypes.byref(step_out)
         step_stmt = self._lib.ddb_stmt_step
         bind_param = self._bind_param
         reset_stmt = self._lib.ddb_stmt_reset
@@ -2250,14 +2522,15 @@ class Cursor:
                 _raise_error(code, sql=sql, params=params)
             for i, param in enumerate(params, start=1):
                 bind_param(i, param, sql, params)
-            code = step_stmt(self._stmt, ctypes.byref(step_out))
+            code = step_stmt(self._stmt, step_out_ref)
             if code != ERR_OK:
                 _raise_error(code, sql=sql, params=params)
-            affected = ctypes.c_uint64()
-            code = self._lib.ddb_stmt_affected_rows(self._stmt, ctypes.byref(affected))
+            code = self._lib.ddb_stmt_affected_rows(
+                self._stmt, self._out_affected_ref
+            )
             if code != ERR_OK:
                 _raise_error(code, sql=sql, params=params)
-            total_affected += int(affected.value)
+            total_affected += int(self._out_affected.value)
 
         def flush_fast_batch():
             nonlocal total_affected
@@ -2342,6 +2615,7 @@ class Cursor:
                                 self._has_buffered_row = False
                                 self._buffered_row = None
                                 self._prefetched_rows = rows
+                                self._iter_prefetched_rows = None
                                 self._query_active = True
                                 self.description = sel_info[0]
                                 self._col_count = sel_info[1]
@@ -2371,6 +2645,7 @@ class Cursor:
                                     self._has_buffered_row = False
                                     self._buffered_row = None
                                     self._prefetched_rows = rows
+                                    self._iter_prefetched_rows = None
                                     self._query_active = True
                                     self.description = sel_info[0]
                                     self._col_count = sel_info[1]
@@ -2406,6 +2681,7 @@ class Cursor:
                                     self._has_buffered_row = False
                                     self._buffered_row = None
                                     self._prefetched_rows = rows
+                                    self._iter_prefetched_rows = None
                                     self._query_active = True
                                     self.description = sel_info[0]
                                     self._col_count = sel_info[1]
@@ -2424,6 +2700,7 @@ class Cursor:
         self._has_buffered_row = False
         self._buffered_row = None
         self._prefetched_rows = None
+        self._iter_prefetched_rows = None
         self._query_active = False
         self.description = None
         self.rowcount = -1
@@ -2448,7 +2725,7 @@ class Cursor:
             self._execute_direct(sql, params)
         else:
             cached_non_query = self._execute_cached_non_query_current_statement(
-                sql, params
+                sql, params, param_count
             )
             if cached_non_query is not None:
                 self._setup_fast_repeat(operation, parameters)
@@ -2575,6 +2852,7 @@ class Cursor:
                 if self._query_active and prefetched_rows is not None
                 else None
             )
+            self._iter_prefetched_rows = None
             if self._prefetched_rows is not None:
                 self._has_buffered_row = False
                 self._buffered_row = None
@@ -2613,14 +2891,14 @@ class Cursor:
             else:
                 self._buffered_row = None
                 self._prefetched_rows = None
+                self._iter_prefetched_rows = None
                 if affected_rowcount is None:
-                    affected = ctypes.c_uint64()
                     code = self._lib.ddb_stmt_affected_rows(
-                        self._stmt, ctypes.byref(affected)
+                        self._stmt, self._out_affected_ref
                     )
                     if code != ERR_OK:
                         _raise_error(code, sql=sql, params=params)
-                    affected_rowcount = int(affected.value)
+                    affected_rowcount = int(self._out_affected.value)
                 self.rowcount = affected_rowcount
         return self
 
@@ -2631,6 +2909,7 @@ class Cursor:
         self._has_buffered_row = False
         self._buffered_row = None
         self._prefetched_rows = None
+        self._iter_prefetched_rows = None
         self._query_active = False
         self.description = None
         self._col_count = 0
@@ -2652,28 +2931,33 @@ class Cursor:
         except StopIteration:
             return self
 
-        # Fast path for repeated positional DML binds.
-        if isinstance(first_params, Mapping):
-            self.execute(operation, first_params)
-            for params in iterator:
-                self.execute(operation, params)
-            return self
-
-        try:
-            expected_count = len(first_params)
-        except TypeError:
-            self.execute(operation, first_params)
-            for params in iterator:
-                self.execute(operation, params)
-            return self
+        # Named rows are rewritten once and then share the positional batch paths.
+        names = None
+        if type(first_params) is dict or isinstance(first_params, Mapping):
+            sql, names = self._rewrite_named_sql_cached(operation)
+            normalized_first = _named_param_values(names, first_params)
+            expected_count = len(names)
+        else:
+            try:
+                expected_count = len(first_params)
+            except TypeError:
+                self.execute(operation, first_params)
+                for params in iterator:
+                    self.execute(operation, params)
+                return self
+            sql, normalized_first = self._resolve_sql_and_params(
+                operation, first_params
+            )
 
-        sql, normalized_first = self._resolve_sql_and_params(operation, first_params)
         if _is_direct_execute_sql(sql):
             self.execute(operation, first_params)
             for params in iterator:
                 self.execute(operation, params)
             return self
 
+        if names is not None:
+            iterator = _named_rows_as_positional(names, iterator)
+
         self._has_buffered_row = False
         self._query_active = False
         self.description = None
@@ -2798,6 +3082,7 @@ class Cursor:
             return self
 
         step_out = ctypes.c_uint8()
+        step_out_ref = ctypes.byref(step_out)
         step_stmt = self._lib.ddb_stmt_step
         byref = ctypes.byref
         bind_param = self._bind_param
@@ -2840,12 +3125,36 @@ class Cursor:
 
         total_affected = 0
         bind_row_fast(normalized_first)
-        code = step_stmt(self._stmt, byref(step_out))
+        code = step_stmt(self._stmt, step_out_ref)
         if code != ERR_OK:
             _raise_error(code, sql=sql, params=normalized_first)
         total_affected += fetch_affected_rows(normalized_first)
         self._bound_param_count = expected_count
 
+        native_many = self._native_execute_many_generic
+        if native_many is not None:
+            source_rows = iterator
+
+            def rows_needing_python():
+                # The extension runs every row it can bind in one call and
+                # hands back the first row it cannot; the loops below only
+                # see those rows and raise the usual errors for them. Engine
+                # failures surface here once the row has been executed.
+                nonlocal total_affected
+                while True:
+                    try:
+                        affected_rows, pending = native_many(
+                            self._stmt.value, source_rows, expected_count
+                        )
+                    except _NativeError as exc:
+                        _raise_native_error(exc, sql=sql)
+                    total_affected += affected_rows
+                    if pending is None:
+                        return
+                    yield pending
+
+            iterator = rows_needing_python()
+
         if "?" in operation:
             for params in iterator:
                 try:
@@ -2863,23 +3172,27 @@ class Cursor:
                 if code != ERR_OK:
                     _raise_error(code, sql=sql, params=params)
                 bind_row_fast(params)
-                code = step_stmt(self._stmt, byref(step_out))
+                code = step_stmt(self._stmt, step_out_ref)
                 if code != ERR_OK:
                     _raise_error(code, sql=sql, params=params)
                 total_affected += fetch_affected_rows(params)
         else:
             for params in iterator:
-                if isinstance(params, Mapping):
-                    raise ProgrammingError(
-                        "Mixed parameter styles are not supported in executemany"
-                    )
-                try:
+                params_type = type(params)
+                if params_type is tuple or params_type is list:
                     param_len = len(params)
-                except TypeError:
-                    raise ProgrammingError(
-                        "Incorrect number of parameters: "
-                        f"expected {expected_count}, got unknown"
-                    )
+                else:
+                    if isinstance(params, Mapping):
+                        raise ProgrammingError(
+                            "Mixed parameter styles are not supported in executemany"
+                        )
+                    try:
+                        param_len = len(params)
+                    except TypeError:
+                        raise ProgrammingError(
+                            "Incorrect number of parameters: "
+                            f"expected {expected_count}, got unknown"
+                        )
                 if param_len != expected_count:
                     raise ProgrammingError(
                         f"Incorrect number of parameters: expected {expected_count}, got {param_len}"
@@ -2888,16 +3201,15 @@ class Cursor:
                 if code != ERR_OK:
                     _raise_error(code, sql=sql, params=params)
                 bind_row_fast(params)
-                code = step_stmt(self._stmt, byref(step_out))
+                code = step_stmt(self._stmt, step_out_ref)
                 if code != ERR_OK:
                     _raise_error(code, sql=sql, params=params)
                 total_affected += fetch_affected_rows(params)
 
-        count = ctypes.c_size_t()
-        code = self._lib.ddb_stmt_column_count(self._stmt, ctypes.byref(count))
+        code = self._lib.ddb_stmt_column_count(self._stmt, self._out_columns_ref)
         if code != ERR_OK:
             _raise_error(code, sql=sql, params=None)
-        self._col_count = int(count.value)
+        self._col_count = int(self._out_columns.value)
 
         if self._col_count > 0:
             self._load_description()
@@ -2943,7 +3255,7 @@ class Cursor:
                 if code != ERR_OK:
                     _raise_error(code, sql=self._last_sql, params=None)
 
-                tag = int(value.tag)
+                tag = value.tag
                 if tag == DDB_VALUE_NULL:
                     append_row(None)
                 elif tag == DDB_VALUE_INT64:
@@ -2975,16 +3287,15 @@ class Cursor:
         return tuple(row)
 
     def _decode_current_row_view(self):
-        values_ptr = ctypes.POINTER(DdbValueView)()
-        out_count = ctypes.c_size_t()
         code = self._lib.ddb_stmt_row_view(
-            self._stmt, ctypes.byref(values_ptr), ctypes.byref(out_count)
+            self._stmt, self._out_values_ptr_ref, self._out_count_ref
         )
         if code != ERR_OK:
             _raise_error(code, sql=self._last_sql, params=None)
 
-        count = int(out_count.value)
-        return self._decode_row_view_values(values_ptr, count)
+        return self._decode_row_view_values(
+            self._out_values_ptr, self._out_count.value
+        )
 
     def _decode_row_view_values(self, values_ptr, count):
         if count == 0:
@@ -3135,45 +3446,17 @@ class Cursor:
                 except Exception:
                     pass
 
-        row = []
-        append_row = row.append
-
-        for index in range(count):
-            value = values_ptr[index]
-            tag = int(value.tag)
-            if tag == DDB_VALUE_NULL:
-                append_row(None)
-            elif tag == DDB_VALUE_INT64:
-                append_row(value.int64_value)
-            elif tag == DDB_VALUE_FLOAT64:
-                append_row(value.float64_value)
-            elif tag == DDB_VALUE_BOOL:
-                append_row(value.bool_value != 0)
-            elif tag == DDB_VALUE_TEXT:
-                if not value.data or value.len == 0:
-                    append_row("")
-                else:
-                    append_row(string_at(value.data, value.len).decode("utf-8"))
-            elif tag in _BINARY_BYTES_TAGS:
-                if not value.data or value.len == 0:
-                    append_row(b"")
-                else:
-                    append_row(bytes(string_at(value.data, value.len)))
-            elif tag == DDB_VALUE_DECIMAL:
-                append_row(
-                    decimal.Decimal(int(value.decimal_scaled))
-                    / (decimal.Decimal(10) ** int(value.decimal_scale))
-                )
-            elif tag == DDB_VALUE_UUID:
-                append_row(bytes(value.uuid_bytes))
-            elif tag == DDB_VALUE_TIMESTAMP_MICROS:
-                append_row(
-                    _UNIX_EPOCH_UTC
-                    + datetime.timedelta(microseconds=int(value.timestamp_micros))
+        if self._decode_row_generic_native is not None:
+            try:
+                decoded = self._decode_row_generic_native(
+                    ctypes.addressof(values_ptr.contents), count
                 )
-            else:
-                append_row(_decode_ffi_value(self._lib, value))
-        return tuple(row)
+            except Exception:
+                decoded = None
+            if decoded is not None:
+                return decoded
+
+        return tuple(_decode_value_views(self._lib, values_ptr, count))
 
     def _decode_row_view_matrix(self, values_ptr, row_count, col_count):
         if row_count == 0:
@@ -3226,7 +3509,7 @@ class Cursor:
                 append_row = row.append
                 for col_index in range(2):
                     value = values_ptr[base + col_index]
-                    tag = int(value.tag)
+                    tag = value.tag
                     if tag == DDB_VALUE_NULL:
                         append_row(None)
                     elif tag == DDB_VALUE_INT64:
@@ -3247,8 +3530,8 @@ class Cursor:
                             append_row(bytes(string_at(value.data, value.len)))
                     elif tag == DDB_VALUE_DECIMAL:
                         append_row(
-                            decimal.Decimal(int(value.decimal_scaled))
-                            / (decimal.Decimal(10) ** int(value.decimal_scale))
+                            decimal.Decimal(value.decimal_scaled)
+                            / _DECIMAL_POW10[value.decimal_scale]
                         )
                     elif tag == DDB_VALUE_UUID:
                         append_row(bytes(value.uuid_bytes))
@@ -3329,7 +3612,7 @@ class Cursor:
                     append_row = row.append
                     for col_index in range(3):
                         value = values_ptr[base + col_index]
-                        tag = int(value.tag)
+                        tag = value.tag
                         if tag == DDB_VALUE_NULL:
                             append_row(None)
                         elif tag == DDB_VALUE_INT64:
@@ -3352,8 +3635,8 @@ class Cursor:
                                 append_row(bytes(string_at(value.data, value.len)))
                         elif tag == DDB_VALUE_DECIMAL:
                             append_row(
-                                decimal.Decimal(int(value.decimal_scaled))
-                                / (decimal.Decimal(10) ** int(value.decimal_scale))
+                                decimal.Decimal(value.decimal_scaled)
+                                / _DECIMAL_POW10[value.decimal_scale]
                             )
                         elif tag == DDB_VALUE_UUID:
                             append_row(bytes(value.uuid_bytes))
@@ -3406,7 +3689,7 @@ class Cursor:
                     append_row = row.append
                     for col_index in range(3):
                         value = values_ptr[base + col_index]
-                        tag = int(value.tag)
+                        tag = value.tag
                         if tag == DDB_VALUE_NULL:
                             append_row(None)
                         elif tag == DDB_VALUE_INT64:
@@ -3429,8 +3712,8 @@ class Cursor:
                                 append_row(bytes(string_at(value.data, value.len)))
                         elif tag == DDB_VALUE_DECIMAL:
                             append_row(
-                                decimal.Decimal(int(value.decimal_scaled))
-                                / (decimal.Decimal(10) ** int(value.decimal_scale))
+                                decimal.Decimal(value.decimal_scaled)
+                                / _DECIMAL_POW10[value.decimal_scale]
                             )
                         elif tag == DDB_VALUE_UUID:
                             append_row(bytes(value.uuid_bytes))
@@ -3483,7 +3766,7 @@ class Cursor:
                     append_row = row.append
                     for col_index in range(3):
                         value = values_ptr[base + col_index]
-                        tag = int(value.tag)
+                        tag = value.tag
                         if tag == DDB_VALUE_NULL:
                             append_row(None)
                         elif tag == DDB_VALUE_INT64:
@@ -3506,8 +3789,8 @@ class Cursor:
                                 append_row(bytes(string_at(value.data, value.len)))
                         elif tag == DDB_VALUE_DECIMAL:
                             append_row(
-                                decimal.Decimal(int(value.decimal_scaled))
-                                / (decimal.Decimal(10) ** int(value.decimal_scale))
+                                decimal.Decimal(value.decimal_scaled)
+                                / _DECIMAL_POW10[value.decimal_scale]
                             )
                         elif tag == DDB_VALUE_UUID:
                             append_row(bytes(value.uuid_bytes))
@@ -3543,7 +3826,7 @@ class Cursor:
                 append_row = row.append
                 for col_index in range(3):
                     value = values_ptr[base + col_index]
-                    tag = int(value.tag)
+                    tag = value.tag
                     if tag == DDB_VALUE_NULL:
                         append_row(None)
                     elif tag == DDB_VALUE_INT64:
@@ -3564,8 +3847,8 @@ class Cursor:
                             append_row(bytes(string_at(value.data, value.len)))
                     elif tag == DDB_VALUE_DECIMAL:
                         append_row(
-                            decimal.Decimal(int(value.decimal_scaled))
-                            / (decimal.Decimal(10) ** int(value.decimal_scale))
+                            decimal.Decimal(value.decimal_scaled)
+                            / _DECIMAL_POW10[value.decimal_scale]
                         )
                     elif tag == DDB_VALUE_UUID:
                         append_row(bytes(value.uuid_bytes))
@@ -3619,7 +3902,7 @@ class Cursor:
                     self._decode_matrix_i64_sql_support[sql] = False
             for row_index in range(row_count):
                 value = values_ptr[row_index]
-                tag = int(value.tag)
+                tag = value.tag
                 if tag == DDB_VALUE_INT64:
                     append_rows((value.int64_value,))
                 elif tag == DDB_VALUE_FLOAT64:
@@ -3641,8 +3924,8 @@ class Cursor:
                 elif tag == DDB_VALUE_DECIMAL:
                     append_rows(
                         (
-                            decimal.Decimal(int(value.decimal_scaled))
-                            / (decimal.Decimal(10) ** int(value.decimal_scale)),
+                            decimal.Decimal(value.decimal_scaled)
+                            / _DECIMAL_POW10[value.decimal_scale],
                         )
                     )
                 elif tag == DDB_VALUE_UUID:
@@ -3729,46 +4012,19 @@ class Cursor:
                 except Exception:
                     self._decode_matrix_i64_text_f64_i64_i64_sql_support[sql] = False
 
-        for row_index in range(row_count):
-            base = row_index * col_count
-            row = []
-            append_row = row.append
-            for col_index in range(col_count):
-                value = values_ptr[base + col_index]
-                tag = int(value.tag)
-                if tag == DDB_VALUE_NULL:
-                    append_row(None)
-                elif tag == DDB_VALUE_INT64:
-                    append_row(value.int64_value)
-                elif tag == DDB_VALUE_FLOAT64:
-                    append_row(value.float64_value)
-                elif tag == DDB_VALUE_BOOL:
-                    append_row(value.bool_value != 0)
-                elif tag == DDB_VALUE_TEXT:
-                    if not value.data or value.len == 0:
-                        append_row("")
-                    else:
-                        append_row(string_at(value.data, value.len).decode("utf-8"))
-                elif tag in _BINARY_BYTES_TAGS:
-                    if not value.data or value.len == 0:
-                        append_row(b"")
-                    else:
-                        append_row(bytes(string_at(value.data, value.len)))
-                elif tag == DDB_VALUE_DECIMAL:
-                    append_row(
-                        decimal.Decimal(int(value.decimal_scaled))
-                        / (decimal.Decimal(10) ** int(value.decimal_scale))
-                    )
-                elif tag == DDB_VALUE_UUID:
-                    append_row(bytes(value.uuid_bytes))
-                elif tag == DDB_VALUE_TIMESTAMP_MICROS:
-                    append_row(
-                        _UNIX_EPOCH_UTC
-                        + datetime.timedelta(microseconds=int(value.timestamp_micros))
-                    )
-                else:
-                    append_row(_decode_ffi_value(self._lib, value))
-            append_rows(tuple(row))
+        if self._decode_matrix_generic_native is not None:
+            try:
+                decoded = self._decode_matrix_generic_native(
+                    ctypes.addressof(values_ptr.contents), row_count, col_count
+                )
+            except Exception:
+                decoded = None
+            if decoded is not None:
+                return decoded
+
+        flat = _decode_value_views(self._lib, values_ptr, row_count * col_count)
+        for base in range(0, len(flat), col_count):
+            append_rows(tuple(flat[base : base + col_count]))
         return rows
 
     def fetchone(self):
@@ -3778,12 +4034,22 @@ class Cursor:
         if not self._query_active:
             return None
 
+        iter_rows = self._iter_prefetched_rows
+        if iter_rows:
+            return iter_rows.popleft()
+
         if self._prefetched_rows is not None:
             if not self._prefetched_rows:
                 self._prefetched_rows = None
                 return None
-            row = self._prefetched_rows.pop(0)
-            if not self._prefetched_rows:
+            # Serve the buffered result from a deque so row-at-a-time reads
+            # stay O(1) per row.
+            buffered = self._prefetched_rows
+            if type(buffered) is not collections.deque:
+                buffered = collections.deque(buffered)
+                self._prefetched_rows = buffered
+            row = buffered.popleft()
+            if not buffered:
                 self._prefetched_rows = None
             return row
 
@@ -3796,26 +4062,37 @@ class Cursor:
             return self._decode_current_row()
 
         if self._use_step_row_view:
-            values_ptr = ctypes.POINTER(DdbValueView)()
-            out_count = ctypes.c_size_t()
-            has_row = ctypes.c_uint8()
+            if self._native_step_row_generic is not None:
+                # One extension call steps and decodes without crossing libffi.
+                try:
+                    row = self._native_step_row_generic(self._stmt.value)
+                except _NativeError as exc:
+                    _raise_native_error(exc, sql=self._last_sql)
+                except (TypeError, ValueError):
+                    # Raised only by the argument checks, before stepping.
+                    self._native_step_row_generic = None
+                else:
+                    if row is NotImplemented:
+                        return self._decode_current_row_view()
+                    return row
             code = self._lib.ddb_stmt_step_row_view(
                 self._stmt,
-                ctypes.byref(values_ptr),
-                ctypes.byref(out_count),
-                ctypes.byref(has_row),
+                self._out_values_ptr_ref,
+                self._out_count_ref,
+                self._out_has_row_ref,
             )
             if code != ERR_OK:
                 _raise_error(code, sql=self._last_sql, params=None)
-            if not has_row.value:
+            if not self._out_has_row.value:
                 return None
-            return self._decode_row_view_values(values_ptr, int(out_count.value))
+            return self._decode_row_view_values(
+                self._out_values_ptr, self._out_count.value
+            )
 
-        has_row = ctypes.c_uint8()
-        code = self._lib.ddb_stmt_step(self._stmt, ctypes.byref(has_row))
+        code = self._lib.ddb_stmt_step(self._stmt, self._out_has_row_ref)
         if code != ERR_OK:
             _raise_error(code, sql=self._last_sql, params=None)
-        if not has_row.value:
+        if not self._out_has_row.value:
             return None
         return self._decode_current_row()
 
@@ -3848,13 +4125,32 @@ class Cursor:
         if not self._query_active:
             return []
 
+        iter_rows = self._iter_prefetched_rows
+        if iter_rows:
+            # Rows left over from a __next__ batch come first; keep reading
+            # from the statement once they run out.
+            if limit is None:
+                rows = list(iter_rows)
+                iter_rows.clear()
+                rows.extend(self._fetch_rows(limit=None))
+                return rows
+            popleft = iter_rows.popleft
+            rows = [popleft() for _ in range(min(limit, len(iter_rows)))]
+            if len(rows) < limit:
+                rows.extend(self._fetch_rows(limit=limit - len(rows)))
+            return rows
+
         if self._prefetched_rows is not None:
+            buffered = self._prefetched_rows
             if limit is None:
-                rows = self._prefetched_rows
                 self._prefetched_rows = None
-                return rows
-            rows = self._prefetched_rows[:limit]
-            self._prefetched_rows = self._prefetched_rows[limit:]
+                return buffered if type(buffered) is list else list(buffered)
+            if type(buffered) is list:
+                rows = buffered[:limit]
+                self._prefetched_rows = buffered[limit:]
+            else:
+                popleft = buffered.popleft
+                rows = [popleft() for _ in range(min(limit, len(buffered)))]
             if not self._prefetched_rows:
                 self._prefetched_rows = None
             return rows
@@ -3902,23 +4198,22 @@ class Cursor:
                 except Exception:
                     self._native_fetch_rows_i64_text_f64_sql_support[sql] = False
 
-            values_ptr = ctypes.POINTER(DdbValueView)()
-            out_rows = ctypes.c_size_t()
-            out_columns = ctypes.c_size_t()
             code = self._lib.ddb_stmt_fetch_row_views(
                 self._stmt,
                 include_current_row,
                 0 if remaining_limit is None else int(remaining_limit),
-                ctypes.byref(values_ptr),
-                ctypes.byref(out_rows),
-                ctypes.byref(out_columns),
+                self._out_values_ptr_ref,
+                self._out_count_ref,
+                self._out_columns_ref,
             )
             if code != ERR_OK:
                 _raise_error(code, sql=self._last_sql, params=None)
             self._has_buffered_row = False
             self._buffered_row = None
             batch_rows = self._decode_row_view_matrix(
-                values_ptr, int(out_rows.value), int(out_columns.value)
+                self._out_values_ptr,
+                self._out_count.value,
+                self._out_columns.value,
             )
             if rows:
                 rows.extend(batch_rows)
@@ -3940,31 +4235,33 @@ class Cursor:
                 return rows
 
         if self._use_step_row_view:
-            values_ptr = ctypes.POINTER(DdbValueView)()
-            out_count = ctypes.c_size_t()
-            has_row = ctypes.c_uint8()
+            values_ptr = self._out_values_ptr
+            out_count = self._out_count
+            has_row = self._out_has_row
+            values_ptr_ref = self._out_values_ptr_ref
+            out_count_ref = self._out_count_ref
+            has_row_ref = self._out_has_row_ref
             step_row_view = self._lib.ddb_stmt_step_row_view
-            byref = ctypes.byref
             decode_values = self._decode_row_view_values
             while limit is None or len(rows) < limit:
                 code = step_row_view(
                     self._stmt,
-                    byref(values_ptr),
-                    byref(out_count),
-                    byref(has_row),
+                    values_ptr_ref,
+                    out_count_ref,
+                    has_row_ref,
                 )
                 if code != ERR_OK:
                     _raise_error(code, sql=self._last_sql, params=None)
                 if not has_row.value:
                     break
-                append_row(decode_values(values_ptr, int(out_count.value)))
+                append_row(decode_values(values_ptr, out_count.value))
             return rows
 
         step_stmt = self._lib.ddb_stmt_step
-        byref = ctypes.byref
-        has_row = ctypes.c_uint8()
+        has_row = self._out_has_row
+        has_row_ref = self._out_has_row_ref
         while limit is None or len(rows) < limit:
-            code = step_stmt(self._stmt, byref(has_row))
+            code = step_stmt(self._stmt, has_row_ref)
             if code != ERR_OK:
                 _raise_error(code, sql=self._last_sql, params=None)
             if not has_row.value:
@@ -3977,6 +4274,24 @@ class Cursor:
         return self
 
     def __next__(self):
+        iter_rows = self._iter_prefetched_rows
+        if iter_rows:
+            return iter_rows.popleft()
+        if (
+            self._prefetched_rows is None
+            and self._iter_batch_rows > 0
+            and self._use_fetch_row_views
+            and self._query_active
+            and self._stmt
+        ):
+            # Pull rows in batches so iteration shares fetchmany's single
+            # native fetch + matrix decode instead of stepping per row.
+            rows = self._fetch_rows(limit=self._iter_batch_rows)
+            if not rows:
+                raise StopIteration
+            iter_rows = collections.deque(rows)
+            self._iter_prefetched_rows = iter_rows
+            return iter_rows.popleft()
         row = self.fetchone()
         if row is None:
             raise StopIteration
@@ -4019,7 +4334,16 @@ class Connection:
         self._watches = weakref.WeakSet()
         self._stmt_cache = collections.OrderedDict()
         self._stmt_cache_size = stmt_cache_size
+        self._named_rewrite_cache = collections.OrderedDict()
         self._stats = collections.Counter()
+        # Resolved once: a missing optional symbol costs a failed dlsym and
+        # an AttributeError on every CDLL lookup.
+        self._fn_list_tables = getattr(
+            self._lib, "decentdb_list_tables_json", None
+        ) or self._lib.ddb_db_list_tables_json
+        self._fn_describe_table = self._lib.ddb_db_describe_table_json
+        self._json_out = ctypes.c_char_p()
+        self._json_out_ref = ctypes.byref(self._json_out)
 
         fs_path = os.fspath(path)
         raw_path = fs_path.encode("utf-8") if isinstance(fs_path, str) else fs_path
@@ -4035,9 +4359,8 @@ class Connection:
             write_queue_max_group_delay_us=write_queue_max_group_delay_us,
         )
         using_options = bool(db_options)
-        option_bytes = (
-            ctypes.c_char_p(db_options.encode("utf-8")) if using_options else None
-        )
+        # Plain bytes satisfy the c_char_p argtype without a wrapper object.
+        option_bytes = db_options.encode("utf-8") if using_options else None
         if mode == "create":
             if using_options:
                 if hasattr(self._lib, "ddb_db_create_with_options"):
@@ -4107,8 +4430,10 @@ class Connection:
             raise ProgrammingError("Connection closed")
 
     def _get_cached_statement(self, sql):
-        if sql in self._stmt_cache:
-            stmt = self._stmt_cache.pop(sql)
+        # Checkout removes the entry so a statement is never shared by two
+        # cursors; _recycle_statement puts it back at the MRU end.
+        stmt = self._stmt_cache.pop(sql, None)
+        if stmt is not None:
             self._stats["cache_hit"] += 1
             return stmt, True
         self._stats["cache_miss"] += 1
@@ -4131,8 +4456,8 @@ class Connection:
             self._lib.ddb_stmt_free(ctypes.byref(ptr))
             return
 
-        if sql in self._stmt_cache:
-            old = self._stmt_cache.pop(sql)
+        old = self._stmt_cache.pop(sql, None)
+        if old is not None:
             ptr = ctypes.c_void_p(old.value)
             self._lib.ddb_stmt_free(ctypes.byref(ptr))
 
@@ -4329,31 +4654,26 @@ class Connection:
 
     def _call_json_api(self, func, *args):
         self._ensure_open()
-        out = ctypes.c_char_p()
-        code = func(self._db, *args, ctypes.byref(out))
+        # Connections are single-threaded, so one out-pointer is reused.
+        out_ref = self._json_out_ref
+        code = func(self._db, *args, out_ref)
         if code != ERR_OK:
             _raise_error(code)
         try:
-            raw = out.value.decode("utf-8") if out.value else ""
-            return json.loads(raw)
+            # Both json and orjson parse the UTF-8 bytes directly.
+            return _json_loads(self._json_out.value or b"")
         finally:
-            self._lib.ddb_string_free(ctypes.byref(out))
+            self._lib.ddb_string_free(out_ref)
 
     def list_tables(self):
-        payload = self._call_json_api(
-            getattr(
-                self._lib,
-                "decentdb_list_tables_json",
-                self._lib.ddb_db_list_tables_json,
-            )
-        )
+        payload = self._call_json_api(self._fn_list_tables)
         if isinstance(payload, list) and payload and isinstance(payload[0], dict):
             return [entry["name"] for entry in payload]
         return payload
 
     def get_table_columns(self, table_name):
-        name = table_name.encode("utf-8")
-        payload = self._call_json_api(self._lib.ddb_db_describe_table_json, name)
+        name = _utf8(table_name)
+        payload = self._call_json_api(self._fn_describe_table, name)
         columns = payload.get("columns", [])
         for column in columns:
             if "not_null" not in column:
@@ -4365,7 +4685,7 @@ class Connection:
 
     def get_table_ddl(self, table_name):
         self._ensure_open()
-        name = table_name.encode("utf-8")
+        name = _utf8(table_name)
         out = ctypes.c_char_p()
         code = self._lib.ddb_db_get_table_ddl(self._db, name, ctypes.byref(out))
         if code != ERR_OK:
@@ -4383,7 +4703,7 @@ class Connection:
 
     def get_view_ddl(self, view_name):
         self._ensure_open()
-        name = view_name.encode("utf-8")
+        name = _utf8(view_name)
         out = ctypes.c_char_p()
         code = self._lib.ddb_db_get_view_ddl(self._db, name, ctypes.byref(out))
         if code != ERR_OK:
@@ -4478,6 +4798,133 @@ def connect(dsn, **kwargs):
     )
 
 
+class ConnectionPool:
+    """Thread-safe pool of open connections to one database.
+
+    Idle connections stay open, so their statement caches and the engine's
+    page cache stay warm between uses. Each connection is still used by one
+    thread at a time; ``acquire`` blocks once ``max_size`` are checked out.
+    """
+
+    def __init__(self, dsn, *, min_size=0, max_size=8, **connect_kwargs):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        if min_size < 0 or min_size > max_size:
+            raise ValueError("min_size must be between 0 and max_size")
+        self._dsn = dsn
+        self._connect_kwargs = connect_kwargs
+        self._max_size = max_size
+        self._idle = collections.deque()
+        self._in_use = set()
+        self._size = 0
+        self._closed = False
+        self._cond = threading.Condition(threading.Lock())
+        try:
+            for _ in range(min_size):
+                self._idle.append(connect(dsn, **connect_kwargs))
+                self._size += 1
+        except Exception:
+            self.close()
+            raise
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def idle(self):
+        return len(self._idle)
+
+    def acquire(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise ProgrammingError("Connection pool closed")
+                if self._idle:
+                    conn = self._idle.pop()
+                    self._in_use.add(conn)
+                    return conn
+                if self._size < self._max_size:
+                    self._size += 1
+                    break
+                if deadline is None:
+                    self._cond.wait()
+                    continue
+                # Wakeups that lose the race to another thread only wait for
+                # whatever is left of the caller's timeout.
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise OperationalError(
+                        f"Timed out waiting for a pooled connection (max_size={self._max_size})"
+                    )
+                self._cond.wait(remaining)
+        try:
+            conn = connect(self._dsn, **self._connect_kwargs)
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._in_use.add(conn)
+        return conn
+
+    def release(self, conn):
+        with self._cond:
+            if conn not in self._in_use:
+                raise ProgrammingError("Connection is not checked out from this pool")
+            self._in_use.remove(conn)
+        broken = False
+        if not conn._closed:
+            try:
+                # Never hand uncommitted work to the next borrower.
+                conn.rollback()
+            except Exception:
+                broken = True
+        with self._cond:
+            if not broken and not conn._closed and not self._closed:
+                self._idle.append(conn)
+                self._cond.notify()
+                return
+            self._size -= 1
+            self._cond.notify()
+        if broken:
+            # The slot is already free; a failing close must not escape.
+            with contextlib.suppress(Exception):
+                conn.close()
+        else:
+            conn.close()
+
+    @contextlib.contextmanager
+    def connection(self, timeout=None):
+        conn = self.acquire(timeout=timeout)
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for conn in idle:
+            conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def create_pool(dsn, **kwargs):
+    return ConnectionPool(dsn, **kwargs)
+
+
 def evict_shared_wal(path):
     lib = load_library()
     fs_path = os.fspath(path)
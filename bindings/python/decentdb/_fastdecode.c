@@ -72,6 +72,8 @@ static PyObject *decode_i64_text_text_text_text_i64_values(
     int64_t int2_value);
 static PyObject *raise_decentdb_error(ddb_status_t code, const char *context);
 
+static PyObject *NativeError = NULL;
+
 static PyObject *decode_utf8_text_value(const uint8_t *text_data, size_t text_len) {
     if (text_data == NULL || text_len == 0) {
         return PyUnicode_New(0, 127);
@@ -1093,21 +1095,31 @@ static int execute_typed_row(
 }
 
 static PyObject *raise_decentdb_error(ddb_status_t code, const char *context) {
+    /* Raised as NativeError(message, code) so the Python layer can map the
+     * status code onto its DB-API exception hierarchy. */
     const char *msg = ddb_last_error_message();
+    PyObject *message;
     if (msg != NULL && msg[0] != '\0') {
-        PyErr_Format(
-            PyExc_RuntimeError,
+        message = PyUnicode_FromFormat(
             "DecentDB error %u in %s: %s",
             (unsigned int)code,
             context,
             msg);
     } else {
-        PyErr_Format(
-            PyExc_RuntimeError,
+        message = PyUnicode_FromFormat(
             "DecentDB error %u in %s",
             (unsigned int)code,
             context);
     }
+    if (message == NULL) {
+        return NULL;
+    }
+    PyObject *exc_args = Py_BuildValue("(NI)", message, (unsigned int)code);
+    if (exc_args == NULL) {
+        return NULL;
+    }
+    PyErr_SetObject(NativeError, exc_args);
+    Py_DECREF(exc_args);
     return NULL;
 }
 
@@ -1490,6 +1502,171 @@ static PyObject *decode_row_i64(PyObject *self, PyObject *args) {
     return decode_i64_row(row);
 }
 
+static PyObject *decode_generic_value(const ddb_value_view_t *value) {
+    switch (value->tag) {
+    case DDB_VALUE_NULL:
+        Py_RETURN_NONE;
+    case DDB_VALUE_INT64:
+        return PyLong_FromLongLong(value->int64_value);
+    case DDB_VALUE_FLOAT64:
+        return PyFloat_FromDouble(value->float64_value);
+    case DDB_VALUE_BOOL:
+        return PyBool_FromLong(value->bool_value != 0);
+    case DDB_VALUE_TEXT:
+        return decode_utf8_text_value(value->data, value->len);
+    case DDB_VALUE_BLOB:
+    case DDB_VALUE_GEOMETRY:
+    case DDB_VALUE_GEOGRAPHY:
+        if (value->data == NULL || value->len == 0) {
+            return PyBytes_FromStringAndSize(NULL, 0);
+        }
+        return PyBytes_FromStringAndSize((const char *)value->data, (Py_ssize_t)value->len);
+    case DDB_VALUE_UUID:
+        return PyBytes_FromStringAndSize((const char *)value->uuid_bytes, 16);
+    default:
+        /* Not handled natively; the caller falls back to the Python decoder. */
+        Py_RETURN_NOTIMPLEMENTED;
+    }
+}
+
+static PyObject *decode_generic_row(const ddb_value_view_t *row, Py_ssize_t count) {
+    if (count == 0) {
+        return PyTuple_New(0);
+    }
+    if (row == NULL) {
+        PyErr_SetString(PyExc_ValueError, "row pointer is null");
+        return NULL;
+    }
+    PyObject *tuple = PyTuple_New(count);
+    if (tuple == NULL) {
+        return NULL;
+    }
+    for (Py_ssize_t i = 0; i < count; i++) {
+        PyObject *item = decode_generic_value(&row[i]);
+        if (item == NULL) {
+            Py_DECREF(tuple);
+            return NULL;
+        }
+        if (item == Py_NotImplemented) {
+            Py_DECREF(tuple);
+            return item;
+        }
+        PyTuple_SET_ITEM(tuple, i, item);
+    }
+    return tuple;
+}
+
+static PyObject *decode_row_generic(PyObject *self, PyObject *args) {
+    unsigned long long addr = 0;
+    Py_ssize_t count = 0;
+    if (!PyArg_ParseTuple(args, "Kn", &addr, &count)) {
+        return NULL;
+    }
+    if (count < 0) {
+        PyErr_SetString(PyExc_ValueError, "count must be non-negative");
+        return NULL;
+    }
+    if (count == 0) {
+        return PyTuple_New(0);
+    }
+    if (addr == 0) {
+        PyErr_SetString(PyExc_ValueError, "row pointer is null");
+        return NULL;
+    }
+    PyObject *tuple = decode_generic_row(
+        (const ddb_value_view_t *)(uintptr_t)addr, count);
+    if (tuple == Py_NotImplemented) {
+        Py_DECREF(tuple);
+        Py_RETURN_NONE;
+    }
+    return tuple;
+}
+
+static PyObject *step_row_generic(PyObject *self, PyObject *args) {
+    unsigned long long stmt_addr = 0;
+    if (!PyArg_ParseTuple(args, "K", &stmt_addr)) {
+        return NULL;
+    }
+    if (stmt_addr == 0) {
+        PyErr_SetString(PyExc_ValueError, "statement pointer is null");
+        return NULL;
+    }
+
+    ddb_stmt_t *stmt = (ddb_stmt_t *)(uintptr_t)stmt_addr;
+    const ddb_value_view_t *values = NULL;
+    size_t column_count = 0;
+    uint8_t has_row = 0;
+    ddb_status_t code = ddb_stmt_step_row_view(stmt, &values, &column_count, &has_row);
+    if (code != DDB_OK) {
+        return raise_decentdb_error(code, "ddb_stmt_step_row_view");
+    }
+    if (has_row == 0) {
+        Py_RETURN_NONE;
+    }
+    /* NotImplemented leaves the stepped row current for the Python decoder.
+     * Decode-time TypeError/ValueError take the same route, so those two
+     * types only ever escape from the argument checks above. */
+    PyObject *row = decode_generic_row(values, (Py_ssize_t)column_count);
+    if (row == NULL
+        && (PyErr_ExceptionMatches(PyExc_TypeError)
+            || PyErr_ExceptionMatches(PyExc_ValueError))) {
+        PyErr_Clear();
+        Py_RETURN_NOTIMPLEMENTED;
+    }
+    return row;
+}
+
+static PyObject *decode_matrix_generic(PyObject *self, PyObject *args) {
+    unsigned long long addr = 0;
+    Py_ssize_t row_count = 0;
+    Py_ssize_t col_count = 0;
+    if (!PyArg_ParseTuple(args, "Knn", &addr, &row_count, &col_count)) {
+        return NULL;
+    }
+    if (row_count < 0 || col_count < 0) {
+        PyErr_SetString(PyExc_ValueError, "row_count and col_count must be non-negative");
+        return NULL;
+    }
+    if (row_count == 0) {
+        return PyList_New(0);
+    }
+    if (addr == 0 && col_count > 0) {
+        PyErr_SetString(PyExc_ValueError, "matrix pointer is null");
+        return NULL;
+    }
+
+    const ddb_value_view_t *values = (const ddb_value_view_t *)(uintptr_t)addr;
+    PyObject *rows = PyList_New(row_count);
+    if (rows == NULL) {
+        return NULL;
+    }
+    for (Py_ssize_t r = 0; r < row_count; r++) {
+        PyObject *tuple = PyTuple_New(col_count);
+        if (tuple == NULL) {
+            Py_DECREF(rows);
+            return NULL;
+        }
+        const ddb_value_view_t *row = values + (r * col_count);
+        for (Py_ssize_t c = 0; c < col_count; c++) {
+            PyObject *item = decode_generic_value(&row[c]);
+            if (item == NULL) {
+                Py_DECREF(tuple);
+                Py_DECREF(rows);
+                return NULL;
+            }
+            if (item == Py_NotImplemented) {
+                Py_DECREF(item);
+                Py_DECREF(tuple);
+                Py_DECREF(rows);
+                Py_RETURN_NONE;
+            }
+            PyTuple_SET_ITEM(tuple, c, item);
+        }
+        PyList_SET_ITEM(rows, r, tuple);
+    }
+    return rows;
+}
+
 static PyObject *decode_matrix_i64(PyObject *self, PyObject *args) {
     unsigned long long addr = 0;
     Py_ssize_t row_count = 0;
@@ -2628,6 +2805,250 @@ static PyObject *reset_bind_i64_text_step_affected(PyObject *self, PyObject *arg
     return result;
 }
 
+static int is_fused_bind_type(PyObject *value) {
+    if (value == Py_None || PyBool_Check(value) || PyFloat_CheckExact(value)
+        || PyUnicode_CheckExact(value) || PyBytes_CheckExact(value)) {
+        return 1;
+    }
+    if (PyLong_CheckExact(value)) {
+        int overflow = 0;
+        PyLong_AsLongLongAndOverflow(value, &overflow);
+        return overflow == 0 && !PyErr_Occurred();
+    }
+    return 0;
+}
+
+static int bind_python_value(ddb_stmt_t *stmt, size_t index_1_based, PyObject *value) {
+    ddb_status_t code;
+    if (value == Py_None) {
+        code = ddb_stmt_bind_null(stmt, index_1_based);
+        if (code != DDB_OK) {
+            raise_decentdb_error(code, "ddb_stmt_bind_null");
+            return -1;
+        }
+    } else if (PyBool_Check(value)) {
+        code = ddb_stmt_bind_bool(stmt, index_1_based, value == Py_True ? 1 : 0);
+        if (code != DDB_OK) {
+            raise_decentdb_error(code, "ddb_stmt_bind_bool");
+            return -1;
+        }
+    } else if (PyLong_CheckExact(value)) {
+        int64_t int_value = (int64_t)PyLong_AsLongLong(value);
+        if (PyErr_Occurred()) {
+            return -1;
+        }
+        code = ddb_stmt_bind_int64(stmt, index_1_based, int_value);
+        if (code != DDB_OK) {
+            raise_decentdb_error(code, "ddb_stmt_bind_int64");
+            return -1;
+        }
+    } else if (PyFloat_CheckExact(value)) {
+        code = ddb_stmt_bind_float64(stmt, index_1_based, PyFloat_AS_DOUBLE(value));
+        if (code != DDB_OK) {
+            raise_decentdb_error(code, "ddb_stmt_bind_float64");
+            return -1;
+        }
+    } else if (PyUnicode_CheckExact(value)) {
+        Py_ssize_t text_len = 0;
+        const char *text_ptr = PyUnicode_AsUTF8AndSize(value, &text_len);
+        if (text_ptr == NULL) {
+            return -1;
+        }
+        code = ddb_stmt_bind_text(stmt, index_1_based, text_ptr, (size_t)text_len);
+        if (code != DDB_OK) {
+            raise_decentdb_error(code, "ddb_stmt_bind_text");
+            return -1;
+        }
+    } else {
+        Py_ssize_t blob_len = PyBytes_GET_SIZE(value);
+        const uint8_t *blob_ptr =
+            blob_len > 0 ? (const uint8_t *)PyBytes_AS_STRING(value) : NULL;
+        code = ddb_stmt_bind_blob(stmt, index_1_based, blob_ptr, (size_t)blob_len);
+        if (code != DDB_OK) {
+            raise_decentdb_error(code, "ddb_stmt_bind_blob");
+            return -1;
+        }
+    }
+    return 0;
+}
+
+static PyObject *bind_text(PyObject *self, PyObject *args) {
+    unsigned long long stmt_addr = 0;
+    Py_ssize_t index_1_based = 0;
+    PyObject *value = NULL;
+    if (!PyArg_ParseTuple(args, "KnU", &stmt_addr, &index_1_based, &value)) {
+        return NULL;
+    }
+    if (stmt_addr == 0) {
+        PyErr_SetString(PyExc_ValueError, "statement pointer is null");
+        return NULL;
+    }
+
+    /* Borrow CPython's cached UTF-8 buffer; the engine copies bound text. */
+    Py_ssize_t text_len = 0;
+    const char *text_ptr = PyUnicode_AsUTF8AndSize(value, &text_len);
+    if (text_ptr == NULL) {
+        return NULL;
+    }
+    ddb_stmt_t *stmt = (ddb_stmt_t *)(uintptr_t)stmt_addr;
+    ddb_status_t code = ddb_stmt_bind_text(
+        stmt, (size_t)index_1_based, text_ptr, (size_t)text_len);
+    return PyLong_FromUnsignedLong((unsigned long)code);
+}
+
+static PyObject *reset_bind_step_affected(PyObject *self, PyObject *args) {
+    unsigned long long stmt_addr = 0;
+    PyObject *params = NULL;
+    if (!PyArg_ParseTuple(args, "KO", &stmt_addr, &params)) {
+        return NULL;
+    }
+    if (stmt_addr == 0) {
+        PyErr_SetString(PyExc_ValueError, "statement pointer is null");
+        return NULL;
+    }
+
+    PyObject *params_fast = PySequence_Fast(params, "params must be a sequence");
+    if (params_fast == NULL) {
+        return NULL;
+    }
+    Py_ssize_t param_count = PySequence_Fast_GET_SIZE(params_fast);
+    PyObject **items = PySequence_Fast_ITEMS(params_fast);
+    for (Py_ssize_t i = 0; i < param_count; i++) {
+        if (!is_fused_bind_type(items[i])) {
+            /* Let the Python bind path handle richer types and big ints. */
+            Py_DECREF(params_fast);
+            if (PyErr_Occurred()) {
+                return NULL;
+            }
+            Py_RETURN_NONE;
+        }
+    }
+
+    ddb_stmt_t *stmt = (ddb_stmt_t *)(uintptr_t)stmt_addr;
+    ddb_status_t code = ddb_stmt_reset(stmt);
+    if (code != DDB_OK) {
+        Py_DECREF(params_fast);
+        return raise_decentdb_error(code, "ddb_stmt_reset");
+    }
+    for (Py_ssize_t i = 0; i < param_count; i++) {
+        if (bind_python_value(stmt, (size_t)(i + 1), items[i]) != 0) {
+            Py_DECREF(params_fast);
+            return NULL;
+        }
+    }
+    Py_DECREF(params_fast);
+
+    uint8_t has_row = 0;
+    code = ddb_stmt_step(stmt, &has_row);
+    if (code != DDB_OK) {
+        return raise_decentdb_error(code, "ddb_stmt_step");
+    }
+    uint64_t affected = 0;
+    code = ddb_stmt_affected_rows(stmt, &affected);
+    if (code != DDB_OK) {
+        return raise_decentdb_error(code, "ddb_stmt_affected_rows");
+    }
+    PyObject *result = PyTuple_New(2);
+    if (result == NULL) {
+        return NULL;
+    }
+    PyTuple_SET_ITEM(result, 0, PyLong_FromUnsignedLongLong((unsigned long long)affected));
+    PyObject *has_row_obj = has_row ? Py_True : Py_False;
+    Py_INCREF(has_row_obj);
+    PyTuple_SET_ITEM(result, 1, has_row_obj);
+    return result;
+}
+
+/* Execute one executemany row natively. Returns 1 on success, 0 when the
+ * row must go through the Python path instead (not an exact tuple/list,
+ * wrong length, or a type the fused binder does not handle; all checked
+ * before the statement is reset), and -1 with an exception set once the
+ * row has reached the engine, so a failed row is never executed twice. */
+static int execute_many_row(
+    ddb_stmt_t *stmt, PyObject *row, Py_ssize_t expected_count, uint64_t *total_affected) {
+    if (!PyTuple_CheckExact(row) && !PyList_CheckExact(row)) {
+        return 0;
+    }
+    PyObject **items = PySequence_Fast_ITEMS(row);
+    if (PySequence_Fast_GET_SIZE(row) != expected_count) {
+        return 0;
+    }
+    for (Py_ssize_t i = 0; i < expected_count; i++) {
+        if (!is_fused_bind_type(items[i])) {
+            PyErr_Clear();
+            return 0;
+        }
+    }
+    ddb_status_t code = ddb_stmt_reset(stmt);
+    if (code != DDB_OK) {
+        raise_decentdb_error(code, "ddb_stmt_reset");
+        return -1;
+    }
+    for (Py_ssize_t i = 0; i < expected_count; i++) {
+        if (bind_python_value(stmt, (size_t)(i + 1), items[i]) != 0) {
+            return -1;
+        }
+    }
+    uint8_t has_row = 0;
+    code = ddb_stmt_step(stmt, &has_row);
+    if (code != DDB_OK) {
+        raise_decentdb_error(code, "ddb_stmt_step");
+        return -1;
+    }
+    uint64_t affected = 0;
+    code = ddb_stmt_affected_rows(stmt, &affected);
+    if (code != DDB_OK) {
+        raise_decentdb_error(code, "ddb_stmt_affected_rows");
+        return -1;
+    }
+    *total_affected += affected;
+    return 1;
+}
+
+static PyObject *execute_many_generic(PyObject *self, PyObject *args) {
+    unsigned long long stmt_addr = 0;
+    PyObject *rows = NULL;
+    Py_ssize_t expected_count = 0;
+    if (!PyArg_ParseTuple(args, "KOn", &stmt_addr, &rows, &expected_count)) {
+        return NULL;
+    }
+    if (stmt_addr == 0) {
+        PyErr_SetString(PyExc_ValueError, "statement pointer is null");
+        return NULL;
+    }
+
+    PyObject *iterator = PyObject_GetIter(rows);
+    if (iterator == NULL) {
+        return NULL;
+    }
+    ddb_stmt_t *stmt = (ddb_stmt_t *)(uintptr_t)stmt_addr;
+    uint64_t total_affected = 0;
+    PyObject *pending = NULL;
+    PyObject *row = NULL;
+    while ((row = PyIter_Next(iterator)) != NULL) {
+        int status = execute_many_row(stmt, row, expected_count, &total_affected);
+        if (status < 0) {
+            Py_DECREF(row);
+            Py_DECREF(iterator);
+            return NULL;
+        }
+        if (status == 0) {
+            pending = row;
+            break;
+        }
+        Py_DECREF(row);
+    }
+    Py_DECREF(iterator);
+    if (pending == NULL && PyErr_Occurred()) {
+        return NULL;
+    }
+    if (pending == NULL) {
+        pending = Py_None;
+        Py_INCREF(pending);
+    }
+    return Py_BuildValue("(KN)", (unsigned long long)total_affected, pending);
+}
+
 static PyObject *bind_text_i64_step_affected(PyObject *self, PyObject *args) {
     unsigned long long stmt_addr = 0;
     const char *text_ptr = NULL;
@@ -2927,6 +3348,12 @@ static PyMethodDef methods[] = {
      "Decode one INT64 row from a ddb_value_view_t pointer."},
     {"decode_matrix_i64", decode_matrix_i64, METH_VARARGS,
      "Decode row_count INT64 rows from a ddb_value_view_t pointer."},
+    {"decode_matrix_generic", decode_matrix_generic, METH_VARARGS,
+     "Decode row_count rows of col_count values by tag; returns None if a tag needs the Python decoder."},
+    {"decode_row_generic", decode_row_generic, METH_VARARGS,
+     "Decode one row of count values by tag; returns None if a tag needs the Python decoder."},
+    {"step_row_generic", step_row_generic, METH_VARARGS,
+     "Step a statement and decode the row by tag; None at end, NotImplemented if the row needs the Python decoder."},
     {"decode_row_i64_f64_text_text_i64_f64", decode_row_i64_f64_text_text_i64_f64, METH_VARARGS,
      "Decode one INT64/FLOAT64/TEXT/TEXT/INT64/FLOAT64 row from a ddb_value_view_t pointer."},
     {"decode_matrix_i64_f64_text_text_i64_f64", decode_matrix_i64_f64_text_text_i64_f64, METH_VARARGS,
@@ -2979,6 +3406,12 @@ static PyMethodDef methods[] = {
      "Bind (INT64, TEXT), step, and return (affected_rows, has_row)."},
     {"reset_bind_i64_text_step_affected", reset_bind_i64_text_step_affected, METH_VARARGS,
      "Reset statement, bind (INT64, TEXT), step, and return (affected_rows, has_row)."},
+    {"bind_text", bind_text, METH_VARARGS,
+     "Bind a str parameter from its cached UTF-8 buffer; returns the ddb status code."},
+    {"reset_bind_step_affected", reset_bind_step_affected, METH_VARARGS,
+     "Reset statement, bind a sequence of primitive parameters, step, and return (affected_rows, has_row); None if a type is unsupported."},
+    {"execute_many_generic", execute_many_generic, METH_VARARGS,
+     "Run reset/bind/step for each row of an iterator; return (affected_rows, pending_row) where pending_row needs the Python path, or None when exhausted."},
     {"bind_text_i64_step", bind_text_i64_step, METH_VARARGS,
      "Bind (TEXT, INT64) and step statement once."},
     {"bind_text_i64_step_affected", bind_text_i64_step_affected, METH_VARARGS,
@@ -3003,5 +3436,21 @@ PyMODINIT_FUNC PyInit__fastdecode(void) {
     if (PyDateTimeAPI == NULL) {
         return NULL;
     }
-    return PyModule_Create(&module);
+    PyObject *m = PyModule_Create(&module);
+    if (m == NULL) {
+        return NULL;
+    }
+    NativeError = PyErr_NewException("decentdb._fastdecode.NativeError", PyExc_RuntimeError, NULL);
+    if (NativeError == NULL) {
+        Py_DECREF(m);
+        return NULL;
+    }
+    Py_INCREF(NativeError);
+    if (PyModule_AddObject(m, "NativeError", NativeError) < 0) {
+        Py_DECREF(NativeError);
+        Py_CLEAR(NativeError);
+        Py_DECREF(m);
+        return NULL;
+    }
+    return m;
 }
@@ -1,5 +1,6 @@
 import ctypes
 import os
+import sys
 from ctypes import (
     POINTER,
     Structure,
@@ -146,41 +147,46 @@ _lib = None
 _preloaded_lib = None
 
 
+def _platform_library_names():
+    if sys.platform == "win32":
+        return ("decentdb.dll", "c_api.dll")
+    if sys.platform == "darwin":
+        return ("libdecentdb.dylib", "libc_api.dylib")
+    return ("libdecentdb.so", "libc_api.so")
+
+
 def _candidate_library_paths():
+    # Yielded lazily so resolve_library_path stops at the first hit.
     lib_path = os.environ.get("DECENTDB_NATIVE_LIB")
     if lib_path:
-        return [lib_path]
+        yield lib_path
+        return
 
     here = os.path.abspath(__file__)
-    candidates = []
-    lib_names = [
-        "libdecentdb.so",
-        "libdecentdb.dylib",
-        "decentdb.dll",
-        "libc_api.so",
-        "libc_api.dylib",
-        "c_api.dll",
-    ]
+    lib_names = _platform_library_names()
+
+    # A wheel ships the library as package data next to this module.
+    package_dir = os.path.dirname(here)
+    for name in lib_names:
+        yield os.path.join(package_dir, name)
 
     cwd = os.getcwd()
     for name in lib_names:
-        candidates.append(os.path.join(cwd, "build", name))
-        candidates.append(os.path.join(cwd, "target", "release", name))
-        candidates.append(os.path.join(cwd, "target", "debug", name))
+        yield os.path.join(cwd, "build", name)
+        yield os.path.join(cwd, "target", "release", name)
+        yield os.path.join(cwd, "target", "debug", name)
 
-    cur_dir = os.path.dirname(here)
+    cur_dir = package_dir
     for _ in range(0, 8):
         for name in lib_names:
-            candidates.append(os.path.join(cur_dir, "build", name))
-            candidates.append(os.path.join(cur_dir, "target", "release", name))
-            candidates.append(os.path.join(cur_dir, "target", "debug", name))
+            yield os.path.join(cur_dir, "build", name)
+            yield os.path.join(cur_dir, "target", "release", name)
+            yield os.path.join(cur_dir, "target", "debug", name)
         parent = os.path.dirname(cur_dir)
         if parent == cur_dir:
             break
         cur_dir = parent
 
-    return candidates
-
 
 def resolve_library_path():
     for candidate in _candidate_library_paths():
@@ -192,6 +198,11 @@ def resolve_library_path():
     )
 
 
+# Lazy binding resolves each PLT entry on first call instead of all of them
+# at dlopen time. Windows has no dlopen flags, so the mode stays 0 there.
+_LAZY_DLOPEN_MODE = getattr(os, "RTLD_LAZY", 0)
+
+
 def preload_library_for_extensions():
     global _preloaded_lib
     if _preloaded_lib is not None:
@@ -204,7 +215,9 @@ def preload_library_for_extensions():
 
     try:
         if hasattr(ctypes, "RTLD_GLOBAL"):
-            _preloaded_lib = ctypes.CDLL(lib_path, mode=ctypes.RTLD_GLOBAL)
+            _preloaded_lib = ctypes.CDLL(
+                lib_path, mode=ctypes.RTLD_GLOBAL | _LAZY_DLOPEN_MODE
+            )
         else:
             _preloaded_lib = ctypes.CDLL(lib_path)
     except OSError:
@@ -227,7 +240,7 @@ def load_library():
         ):
             _lib = _preloaded_lib
         else:
-            _lib = ctypes.CDLL(lib_path)
+            _lib = ctypes.CDLL(lib_path, mode=ctypes.DEFAULT_MODE | _LAZY_DLOPEN_MODE)
     except OSError as exc:
         raise RuntimeError(
             f"Failed to load decentdb native library at {lib_path}: {exc}"
@@ -385,19 +398,21 @@ def load_library():
     _lib.ddb_stmt_bind_bool.restype = c_uint32
     _lib.ddb_stmt_bind_text.argtypes = [c_void_p, c_size_t, c_char_p, c_size_t]
     _lib.ddb_stmt_bind_text.restype = c_uint32
-    _lib.ddb_stmt_bind_blob.argtypes = [c_void_p, c_size_t, POINTER(c_uint8), c_size_t]
+    # Byte payloads are declared as c_char_p so callers can pass ``bytes``
+    # directly; the explicit length argument makes embedded NULs safe.
+    _lib.ddb_stmt_bind_blob.argtypes = [c_void_p, c_size_t, c_char_p, c_size_t]
     _lib.ddb_stmt_bind_blob.restype = c_uint32
     _lib.ddb_stmt_bind_geometry_wkb.argtypes = [
         c_void_p,
         c_size_t,
-        POINTER(c_uint8),
+        c_char_p,
         c_size_t,
     ]
     _lib.ddb_stmt_bind_geometry_wkb.restype = c_uint32
     _lib.ddb_stmt_bind_geography_wkb.argtypes = [
         c_void_p,
         c_size_t,
-        POINTER(c_uint8),
+        c_char_p,
         c_size_t,
     ]
     _lib.ddb_stmt_bind_geography_wkb.restype = c_uint32
@@ -509,6 +524,16 @@ def load_library():
     _lib.ddb_db_open.argtypes = [c_char_p, POINTER(c_void_p)]
     _lib.ddb_db_open.restype = c_uint32
 
+    if hasattr(_lib, "ddb_db_create_with_options"):
+        _lib.ddb_db_create_with_options.argtypes = [c_char_p, c_char_p, POINTER(c_void_p)]
+        _lib.ddb_db_create_with_options.restype = c_uint32
+    if hasattr(_lib, "ddb_db_open_with_options"):
+        _lib.ddb_db_open_with_options.argtypes = [c_char_p, c_char_p, POINTER(c_void_p)]
+        _lib.ddb_db_open_with_options.restype = c_uint32
+    if hasattr(_lib, "ddb_db_open_or_create_with_options"):
+        _lib.ddb_db_open_or_create_with_options.argtypes = [c_char_p, c_char_p, POINTER(c_void_p)]
+        _lib.ddb_db_open_or_create_with_options.restype = c_uint32
+
     _lib.ddb_db_get_table_ddl.argtypes = [c_void_p, c_char_p, POINTER(c_char_p)]
     _lib.ddb_db_get_table_ddl.restype = c_uint32
 
@@ -8,16 +8,92 @@ from __future__ import annotations
 
 import argparse
 import dataclasses
+import functools
 import gzip
+import io
 import json
 import os
 import re
 import sys
 from collections import defaultdict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from typing import Any, Iterator, Sequence
 
 import decentdb
 
+# Parser patterns are compiled once at import time; the parse loop runs them
+# against every line of the dump.
+_RE_TYPE_MOD = re.compile(r"\(.*\)")
+_RE_COL_QUOTED = re.compile(r'^"([^"]+)"\s+(.+)$')
+_RE_COL_UNQUOTED = re.compile(r"^([a-zA-Z_][a-zA-Z0-9_]*)\s+(.+)$")
+_RE_DEFAULT = re.compile(r"\s+DEFAULT\s+(.+)$", re.IGNORECASE)
+_RE_NULL_TAIL = re.compile(r"(\s+NOT)?\s+NULL$", re.IGNORECASE)
+_RE_CONSTR_SPLIT = re.compile(
+    r"\s+(?:PRIMARY|UNIQUE|REFERENCES|CHECK)\s+", re.IGNORECASE
+)
+_RE_CONSTRAINT = re.compile(r"^\s*CONSTRAINT\s+", re.IGNORECASE)
+_RE_TBL_CONSTR = re.compile(
+    r"^(?:CONSTRAINT|PRIMARY\s+KEY|UNIQUE|FOREIGN\s+KEY|CHECK)\s+", re.IGNORECASE
+)
+_RE_CREATE_TABLE_Q = re.compile(
+    r'CREATE\s+TABLE\s+(\w+)\."([^"]+)"\s*\(', re.IGNORECASE
+)
+_RE_CREATE_TABLE_UQ = re.compile(
+    r"CREATE\s+TABLE\s+(\w+)\.([a-zA-Z_][a-zA-Z0-9_]*)\s*\(", re.IGNORECASE
+)
+_RE_ALTER_PK = re.compile(
+    r'ALTER\s+TABLE\s+(?:ONLY\s+)?(\w+)\."?([^"]+)"?\s+ADD\s+CONSTRAINT\s+"?[^"]+"?\s+PRIMARY\s+KEY\s*\(([^)]+)\)',
+    re.IGNORECASE,
+)
+_RE_ALTER_FK = re.compile(
+    r'ALTER\s+TABLE\s+(?:ONLY\s+)?(\w+)\."?([^"]+)"?\s+ADD\s+CONSTRAINT\s+"?[^"]+"?\s+FOREIGN\s+KEY\s*\("?([^"]+)"?\)\s+'
+    r'REFERENCES\s+(?:\w+\.)?"?([^"]+)"?\s*\("?([^"]+)"?\)'
+    r"(?:\s+ON\s+DELETE\s+(\w+))?",
+    re.IGNORECASE,
+)
+_RE_CREATE_INDEX = re.compile(
+    r'CREATE\s+(UNIQUE\s+)?INDEX\s+"?([^"]+)"?\s+ON\s+(?:\w+\.)?"?([^"]+)"?(?:\s+USING\s+\w+)?\s*\(([^)]+)\)',
+    re.IGNORECASE,
+)
+_RE_INDEX_COL_SUFFIX = re.compile(r"\s+(?:ASC|DESC|COLLATE\s+\w+).*", re.IGNORECASE)
+_RE_COPY = re.compile(
+    r'COPY\s+(\w+)\."?([^"]+)"?\s*\(([^)]+)\)\s+FROM\s+stdin', re.IGNORECASE
+)
+_RE_CREATE_TABLE_PREFIX = re.compile(r"CREATE\s+TABLE\s+", re.IGNORECASE)
+_RE_ALTER_PREFIX = re.compile(r"ALTER\s+TABLE\s+", re.IGNORECASE)
+_RE_CREATE_INDEX_PREFIX = re.compile(
+    r"CREATE\s+(?:UNIQUE\s+)?INDEX\s+", re.IGNORECASE
+)
+_RE_SKIPPED_TABLE_WARNING = re.compile(r"Skipping table '([^']+)': (.+)")
+_RE_COPY_ESCAPE = re.compile(r"\\(.?)", re.DOTALL)
+
+# COPY text-format escapes. \N is kept intact so _unescape_copy_value can
+# recognise NULL; any other escaped character stands for itself.
+_COPY_ESCAPES = {
+    "n": "\n",
+    "t": "\t",
+    "r": "\r",
+    "b": "\b",
+    "f": "\f",
+    "\\": "\\",
+    "N": "\\N",
+}
+
+
+def _decode_copy_escape(match: re.Match[str]) -> str:
+    char = match.group(1)
+    return _COPY_ESCAPES.get(char, char)
+
+
+# COPY data lines handed to a parse worker per task.
+_COPY_CHUNK_LINES = 50_000
+
+
+def _parse_copy_chunk(lines: list[str]) -> list[tuple]:
+    """Parse a batch of COPY data lines (runs in a worker process)."""
+    parse_line = PgDumpParser._parse_copy_line
+    return [parse_line(line) for line in lines]
+
 
 @dataclasses.dataclass(frozen=True)
 class PgColumn:
@@ -51,7 +127,7 @@ class SkippedIndex:
     reason: str
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass
 class PgTable:
     name: str
     schema: str
@@ -96,125 +172,37 @@ def _quote_ident(name: str) -> str:
     return '"' + name.replace('"', '""') + '"'
 
 
-def _map_pg_type_to_decentdb(pg_type: str) -> str:
-    """Map PostgreSQL type to DecentDB type.
-
-    DecentDB supports: INT64, BOOL, FLOAT64, TEXT, BLOB
-    """
-    t = pg_type.lower().strip()
-
-    # Remove type modifiers like (255) from varchar(255)
-    base_type = re.sub(r"\(.*\)", "", t).strip()
-
+# PostgreSQL base types (modifiers stripped) with a dedicated DecentDB type.
+# Everything else, arrays included, is stored as TEXT.
+_PG_TYPE_MAP: dict[str, str] = {
     # Integer types
-    if base_type in (
-        "integer",
-        "int",
-        "int4",
-        "smallint",
-        "int2",
-        "bigint",
-        "int8",
-        "serial",
-        "bigserial",
-    ):
-        return "INT64"
-
+    "integer": "INT64",
+    "int": "INT64",
+    "int4": "INT64",
+    "smallint": "INT64",
+    "int2": "INT64",
+    "bigint": "INT64",
+    "int8": "INT64",
+    "serial": "INT64",
+    "bigserial": "INT64",
     # Boolean
-    if base_type in ("boolean", "bool"):
-        return "BOOL"
-
+    "boolean": "BOOL",
+    "bool": "BOOL",
     # Floating point
-    if base_type in ("real", "float4", "double precision", "float8", "float"):
-        return "FLOAT64"
-
-    # Numeric/Decimal - store as DECIMAL
-    if base_type in ("numeric", "decimal"):
-        # If original type string has modifiers, use them
-        if "(" in t:
-            return t.upper().replace("NUMERIC", "DECIMAL")
-        return "DECIMAL(18,6)"
-
+    "real": "FLOAT64",
+    "float4": "FLOAT64",
+    "double precision": "FLOAT64",
+    "float8": "FLOAT64",
+    "float": "FLOAT64",
     # UUID
-    if base_type in ("uuid",):
-        return "UUID"
-
+    "uuid": "UUID",
     # Binary data
-    if base_type in ("bytea",):
-        return "BLOB"
-
-    # Character types
-    if base_type in (
-        "character varying",
-        "varchar",
-        "character",
-        "char",
-        "text",
-        "name",
-    ):
-        return "TEXT"
-
-    # Date/Time types - store as TEXT
-    if base_type in (
-        "timestamp",
-        "timestamptz",
-        "timestamp with time zone",
-        "timestamp without time zone",
-        "date",
-        "time",
-        "timetz",
-        "time with time zone",
-        "time without time zone",
-        "interval",
-    ):
-        return "TEXT"
-
-    # UUID - store as TEXT
-    if base_type == "uuid":
-        return "TEXT"
-
-    # JSON types - store as TEXT
-    if base_type in ("json", "jsonb"):
-        return "TEXT"
-
-    # Arrays - store as TEXT (PostgreSQL array literal format)
-    if base_type.endswith("[]"):
-        return "TEXT"
+    "bytea": "BLOB",
+}
 
-    # Network types - store as TEXT
-    if base_type in ("inet", "cidr", "macaddr", "macaddr8"):
-        return "TEXT"
-
-    # Text search types - store as TEXT
-    if base_type in ("tsvector", "tsquery"):
-        return "TEXT"
-
-    # XML - store as TEXT
-    if base_type == "xml":
-        return "TEXT"
-
-    # Bit strings - store as TEXT
-    if base_type in ("bit", "bit varying", "varbit"):
-        return "TEXT"
-
-    # Money - store as TEXT
-    if base_type == "money":
-        return "TEXT"
-
-    # OID and other system types - store as TEXT
-    if base_type in ("oid", "regclass", "regtype", "regproc"):
-        return "TEXT"
-
-    # Default to TEXT for unknown types
-    return "TEXT"
-
-
-def _is_unsupported_type(pg_type: str) -> bool:
-    """Check if a PostgreSQL type might lose information when converted."""
-    t = pg_type.lower().strip()
-    base_type = re.sub(r"\(.*\)", "", t).strip()
-
-    unsupported = {
+# Types that might lose information when converted.
+_LOSSY_PG_TYPES = frozenset(
+    {
         "numeric",
         "decimal",  # Precision loss
         "timestamp",
@@ -245,21 +233,50 @@ def _is_unsupported_type(pg_type: str) -> bool:
         "regtype",
         "regproc",
     }
+)
 
-    if base_type in unsupported:
-        return True
 
-    # Arrays
-    if base_type.endswith("[]"):
+@functools.lru_cache(maxsize=512)
+def _map_pg_type_to_decentdb(pg_type: str) -> str:
+    """Map PostgreSQL type to DecentDB type.
+
+    DecentDB supports: INT64, BOOL, FLOAT64, TEXT, BLOB
+    """
+    t = pg_type.lower().strip()
+
+    # Remove type modifiers like (255) from varchar(255)
+    base_type = _RE_TYPE_MOD.sub("", t).strip()
+
+    # Numeric/Decimal - store as DECIMAL
+    if base_type in ("numeric", "decimal"):
+        # If original type string has modifiers, use them
+        if "(" in t:
+            return t.upper().replace("NUMERIC", "DECIMAL")
+        return "DECIMAL(18,6)"
+
+    # Character, date/time, JSON, array, network and other types - store as TEXT
+    return _PG_TYPE_MAP.get(base_type, "TEXT")
+
+
+@functools.lru_cache(maxsize=512)
+def _is_unsupported_type(pg_type: str) -> bool:
+    """Check if a PostgreSQL type might lose information when converted."""
+    t = pg_type.lower().strip()
+    base_type = _RE_TYPE_MOD.sub("", t).strip()
+
+    if base_type in _LOSSY_PG_TYPES:
         return True
 
-    return False
+    # Arrays
+    return base_type.endswith("[]")
 
 
 class PgDumpParser:
     """Parser for PostgreSQL dump files."""
 
-    def __init__(self, file_path: str, *, progress=None, console=None):
+    def __init__(
+        self, file_path: str, *, progress=None, console=None, workers: int = 1
+    ):
         self.file_path = file_path
         self.tables: dict[str, PgTable] = {}
         self.indexes: list[PgIndex] = []
@@ -274,6 +291,11 @@ class PgDumpParser:
         self._progress = progress
         self._console = console
         self._parse_task = None
+        self._source = None
+        self._copy_pool: ProcessPoolExecutor | None = None
+        if workers <= 0:
+            workers = os.cpu_count() or 1
+        self._workers = workers
 
     def _get_file_size(self) -> int:
         """Get file size for progress tracking."""
@@ -283,26 +305,28 @@ class PgDumpParser:
             return 0
 
     def _open_file(self) -> Iterator[str]:
-        """Open file, handling gzip compression."""
-        if self.file_path.endswith(".gz"):
-            with gzip.open(
-                self.file_path, "rt", encoding="utf-8", errors="replace"
-            ) as f:
-                for line in f:
-                    yield line
-        else:
-            with open(self.file_path, "r", encoding="utf-8", errors="replace") as f:
-                for line in f:
-                    yield line
+        """Open file, handling gzip compression.
+
+        While iterating, ``self._source`` is the underlying file so progress can
+        be reported as (compressed) bytes read.
+        """
+        with open(self.file_path, "rb") as raw:
+            self._source = raw
+            stream = raw
+            if self.file_path.endswith(".gz"):
+                stream = gzip.GzipFile(fileobj=raw)
+            with io.TextIOWrapper(stream, encoding="utf-8", errors="replace") as f:
+                yield from f
 
     def _parse_column_def(self, col_def: str) -> PgColumn:
         """Parse a column definition from CREATE TABLE."""
         # Match: "ColumnName" type [NOT NULL] [DEFAULT ...]
         # Handle quoted identifiers
-        match = re.match(r'^"([^"]+)"\s+(.+)$', col_def.strip())
+        col_def = col_def.strip()
+        match = _RE_COL_QUOTED.match(col_def)
         if not match:
             # Try unquoted
-            match = re.match(r"^([a-zA-Z_][a-zA-Z0-9_]*)\s+(.+)$", col_def.strip())
+            match = _RE_COL_UNQUOTED.match(col_def)
 
         if not match:
             raise ConversionError(f"Cannot parse column definition: {col_def}")
@@ -310,33 +334,26 @@ class PgDumpParser:
         col_name = match.group(1)
         rest = match.group(2).strip()
 
-        # Check for DEFAULT
+        # Check for DEFAULT (the expression runs to the end of the line)
         has_default = False
         default_value = None
-        default_match = re.search(r"\s+DEFAULT\s+(.+)$", rest, re.IGNORECASE)
+        default_match = _RE_DEFAULT.search(rest)
         if default_match:
             has_default = True
             default_value = default_match.group(1).strip()
-            rest = rest[: default_match.start()].strip()
+            rest = rest[: default_match.start()]
 
-        # Check for NOT NULL
+        # Check for NOT NULL / NULL (explicit); only a NULL-suffixed tail can match
         not_null = False
-        if re.search(r"\s+NOT\s+NULL\s*$", rest, re.IGNORECASE):
-            not_null = True
-            rest = re.sub(r"\s+NOT\s+NULL\s*$", "", rest, flags=re.IGNORECASE).strip()
-
-        # Check for NULL (explicit)
-        if re.search(r"\s+NULL\s*$", rest, re.IGNORECASE):
-            rest = re.sub(r"\s+NULL\s*$", "", rest, flags=re.IGNORECASE).strip()
+        if rest[-4:].upper() == "NULL":
+            null_match = _RE_NULL_TAIL.search(rest)
+            if null_match:
+                not_null = null_match.group(1) is not None
+                rest = rest[: null_match.start()]
 
         # Remove any remaining constraints (PRIMARY KEY, UNIQUE, REFERENCES, CHECK)
-        # These are usually at the end
-        rest = re.split(
-            r"\s+(?:PRIMARY|UNIQUE|REFERENCES|CHECK)\s+", rest, flags=re.IGNORECASE
-        )[0].strip()
-
-        # The rest is the type
-        pg_type = rest
+        # These are usually at the end; the rest is the type
+        pg_type = _RE_CONSTR_SPLIT.split(rest, maxsplit=1)[0].strip()
 
         return PgColumn(
             name=col_name,
@@ -350,14 +367,10 @@ class PgDumpParser:
         """Parse CREATE TABLE statement. Returns (schema, table) or None."""
         # Match: CREATE TABLE schema."TableName" (
         # Note: columns are on subsequent lines, so we don't try to match them here
-        match = re.match(r'CREATE\s+TABLE\s+(\w+)\."([^"]+)"\s*\(', line, re.IGNORECASE)
+        match = _RE_CREATE_TABLE_Q.match(line)
         if not match:
             # Try unquoted table name
-            match = re.match(
-                r"CREATE\s+TABLE\s+(\w+)\.([a-zA-Z_][a-zA-Z0-9_]*)\s*\(",
-                line,
-                re.IGNORECASE,
-            )
+            match = _RE_CREATE_TABLE_UQ.match(line)
 
         if not match:
             return None
@@ -367,16 +380,13 @@ class PgDumpParser:
 
         return schema, table
 
-    def _process_table_columns(
-        self, lines: list[str], start_idx: int
-    ) -> tuple[list[PgColumn], int]:
-        """Process column definitions starting at start_idx. Returns (columns, next_idx)."""
+    def _process_table_columns(self, lines: Iterator[str]) -> list[PgColumn]:
+        """Consume column definitions up to the closing paren of CREATE TABLE."""
         columns = []
-        i = start_idx
         paren_depth = 1  # We start inside the CREATE TABLE (...)
 
-        while i < len(lines) and paren_depth > 0:
-            line = lines[i].strip()
+        for raw_line in lines:
+            line = raw_line.strip()
 
             # Count parentheses
             paren_depth += line.count("(") - line.count(")")
@@ -387,13 +397,12 @@ class PgDumpParser:
                 line = line.rstrip(")").rstrip().rstrip(";")
                 if line:
                     # Check if it's a table constraint (starts with CONSTRAINT)
-                    if not re.match(r"^\s*CONSTRAINT\s+", line, re.IGNORECASE):
+                    if not _RE_CONSTRAINT.match(line):
                         try:
                             col = self._parse_column_def(line)
                             columns.append(col)
                         except ConversionError:
                             pass  # Skip constraints
-                i += 1
                 break
 
             # Remove trailing comma
@@ -401,16 +410,10 @@ class PgDumpParser:
 
             # Skip empty lines and comments
             if not line or line.startswith("--"):
-                i += 1
                 continue
 
             # Check if it's a table constraint (CONSTRAINT, PRIMARY KEY, FOREIGN KEY, etc.)
-            if re.match(
-                r"^(?:CONSTRAINT|PRIMARY\s+KEY|UNIQUE|FOREIGN\s+KEY|CHECK)\s+",
-                line,
-                re.IGNORECASE,
-            ):
-                i += 1
+            if _RE_TBL_CONSTR.match(line):
                 continue
 
             try:
@@ -419,20 +422,14 @@ class PgDumpParser:
             except ConversionError:
                 pass  # Skip if we can't parse
 
-            i += 1
-
-        return columns, i
+        return columns
 
     def _parse_alter_table_primary_key(
         self, line: str
     ) -> tuple[str, str, list[str]] | None:
         """Parse ALTER TABLE ... ADD CONSTRAINT ... PRIMARY KEY."""
         # Match: ALTER TABLE [ONLY] schema."TableName" ADD CONSTRAINT "Name" PRIMARY KEY ("Col1", "Col2");
-        match = re.match(
-            r'ALTER\s+TABLE\s+(?:ONLY\s+)?(\w+)\."?([^"]+)"?\s+ADD\s+CONSTRAINT\s+"?[^"]+"?\s+PRIMARY\s+KEY\s*\(([^)]+)\)',
-            line,
-            re.IGNORECASE,
-        )
+        match = _RE_ALTER_PK.match(line)
         if not match:
             return None
 
@@ -455,13 +452,7 @@ class PgDumpParser:
         """Parse ALTER TABLE ... ADD CONSTRAINT ... FOREIGN KEY."""
         # Match: ALTER TABLE [ONLY] schema."TableName" ADD CONSTRAINT "Name" FOREIGN KEY ("Col")
         #        REFERENCES schema."OtherTable"("OtherCol") [ON DELETE ...];
-        match = re.match(
-            r'ALTER\s+TABLE\s+(?:ONLY\s+)?(\w+)\."?([^"]+)"?\s+ADD\s+CONSTRAINT\s+"?[^"]+"?\s+FOREIGN\s+KEY\s*\("?([^"]+)"?\)\s+'
-            r'REFERENCES\s+(?:\w+\.)?"?([^"]+)"?\s*\("?([^"]+)"?\)'
-            r"(?:\s+ON\s+DELETE\s+(\w+))?",
-            line,
-            re.IGNORECASE,
-        )
+        match = _RE_ALTER_FK.match(line)
         if not match:
             return None
 
@@ -484,11 +475,7 @@ class PgDumpParser:
     def _parse_create_index(self, line: str) -> PgIndex | None:
         """Parse CREATE INDEX statement."""
         # Match: CREATE [UNIQUE] INDEX "Name" ON schema."Table" USING method ("Col1", "Col2");
-        match = re.match(
-            r'CREATE\s+(UNIQUE\s+)?INDEX\s+"?([^"]+)"?\s+ON\s+(?:\w+\.)?"?([^"]+)"?(?:\s+USING\s+\w+)?\s*\(([^)]+)\)',
-            line,
-            re.IGNORECASE,
-        )
+        match = _RE_CREATE_INDEX.match(line)
         if not match:
             return None
 
@@ -502,9 +489,7 @@ class PgDumpParser:
         for col in cols_str.split(","):
             col = col.strip()
             # Remove any ASC/DESC/COLLATE before stripping quotes
-            col = re.sub(
-                r"\s+(?:ASC|DESC|COLLATE\s+\w+).*", "", col, flags=re.IGNORECASE
-            ).strip().strip('"')
+            col = _RE_INDEX_COL_SUFFIX.sub("", col).strip().strip('"')
             if col:
                 columns.append(col)
 
@@ -513,11 +498,7 @@ class PgDumpParser:
     def _parse_copy_statement(self, line: str) -> tuple[str, str, list[str]] | None:
         """Parse COPY statement. Returns (schema, table, columns) or None."""
         # Match: COPY schema."Table" ("Col1", "Col2") FROM stdin;
-        match = re.match(
-            r'COPY\s+(\w+)\."?([^"]+)"?\s*\(([^)]+)\)\s+FROM\s+stdin',
-            line,
-            re.IGNORECASE,
-        )
+        match = _RE_COPY.match(line)
         if not match:
             return None
 
@@ -534,7 +515,8 @@ class PgDumpParser:
 
         return schema, table, columns
 
-    def _parse_copy_line(self, line: str) -> tuple | None:
+    @staticmethod
+    def _parse_copy_line(line: str) -> tuple | None:
         """Parse a line from COPY data. Returns tuple of values or None if end marker."""
         line = line.rstrip("\n")
 
@@ -542,67 +524,17 @@ class PgDumpParser:
         if line == "\\.":
             return None
 
-        # Parse tab-separated values
-        values = []
-        i = 0
-        current = []
-
-        while i < len(line):
-            char = line[i]
-
-            if char == "\t":
-                # End of field
-                val = "".join(current)
-                values.append(self._unescape_copy_value(val))
-                current = []
-                i += 1
-            elif char == "\\":
-                # Escape sequence
-                if i + 1 < len(line):
-                    next_char = line[i + 1]
-                    if next_char == "n":
-                        current.append("\n")
-                        i += 2
-                    elif next_char == "t":
-                        current.append("\t")
-                        i += 2
-                    elif next_char == "r":
-                        current.append("\r")
-                        i += 2
-                    elif next_char == "b":
-                        current.append("\b")
-                        i += 2
-                    elif next_char == "f":
-                        current.append("\f")
-                        i += 2
-                    elif next_char == "\\":
-                        current.append("\\")
-                        i += 2
-                    elif next_char == ".":
-                        # \. is end marker, shouldn't appear in data
-                        current.append(".")
-                        i += 2
-                    elif next_char == "N":
-                        # \N is the NULL marker - preserve for _unescape_copy_value
-                        current.append("\\")
-                        current.append("N")
-                        i += 2
-                    else:
-                        current.append(next_char)
-                        i += 2
-                else:
-                    i += 1
-            else:
-                current.append(char)
-                i += 1
-
-        # Add last field
-        val = "".join(current)
-        values.append(self._unescape_copy_value(val))
-
-        return tuple(values)
+        # Data tabs are always escaped as \t, so a raw tab is a field separator.
+        unescape = PgDumpParser._unescape_copy_value
+        return tuple(
+            unescape(_RE_COPY_ESCAPE.sub(_decode_copy_escape, field))
+            if "\\" in field
+            else unescape(field)
+            for field in line.split("\t")
+        )
 
-    def _unescape_copy_value(self, val: str) -> Any:
+    @staticmethod
+    def _unescape_copy_value(val: str) -> Any:
         """Unescape and convert a COPY value."""
         # NULL is represented as \N
         if val == "\\N":
@@ -629,147 +561,176 @@ class PgDumpParser:
         # Return as string
         return val
 
+    def _copy_executor(self) -> ProcessPoolExecutor:
+        """Return the COPY worker pool for this parse, starting it on first use."""
+        if self._copy_pool is None:
+            self._copy_pool = ProcessPoolExecutor(max_workers=self._workers)
+        return self._copy_pool
+
+    def _read_copy_rows(self, lines: Iterator[str]) -> list[tuple]:
+        """Read and parse COPY data lines up to the ``\\.`` terminator.
+
+        With more than one worker, large blocks are parsed in the parse's
+        process pool in chunks of ``_COPY_CHUNK_LINES``; rows keep their dump
+        order.
+        """
+        rows: list[tuple] = []
+        if self._workers <= 1:
+            for data_line in lines:
+                parsed = self._parse_copy_line(data_line)
+                if parsed is None:
+                    # End of COPY
+                    break
+                rows.append(parsed)
+            return rows
+
+        chunk: list[str] = []
+        pending: deque[Future] = deque()
+        try:
+            for data_line in lines:
+                if data_line.rstrip("\n") == "\\.":
+                    # End of COPY
+                    break
+                chunk.append(data_line)
+                if len(chunk) < _COPY_CHUNK_LINES:
+                    continue
+                pending.append(self._copy_executor().submit(_parse_copy_chunk, chunk))
+                chunk = []
+                # Bound the raw lines held in flight
+                if len(pending) > 2 * self._workers:
+                    rows.extend(pending.popleft().result())
+            while pending:
+                rows.extend(pending.popleft().result())
+        finally:
+            for future in pending:
+                future.cancel()
+        rows.extend(_parse_copy_chunk(chunk))
+        return rows
+
     def parse(self) -> None:
         """Parse the entire dump file."""
         # Show initial progress message
         if self._console is not None:
             self._console.print(f"[dim]Reading {self.file_path}...[/dim]")
 
-        lines = list(self._open_file())
-        total_lines = len(lines)
-
         # Setup progress for parsing phase
+        total_bytes = self._get_file_size()
         if self._progress is not None:
             self._parse_task = self._progress.add_task(
-                "Parse dump file", total=total_lines
+                "Parse dump file", total=total_bytes
             )
 
-        i = 0
-        last_update = 0
-        update_interval = max(1, total_lines // 100)  # Update ~100 times
+        # The dump is consumed as a single line stream; statements that span
+        # lines and COPY blocks pull their continuation lines from it directly,
+        # so the raw text is never held in memory as a whole.
+        lines = self._open_file()
+        statements = 0
+        update_interval = 1_000
 
-        while i < len(lines):
-            line = lines[i]
+        # One worker pool serves every COPY block in the dump, so workers are
+        # started at most once per parse.
+        try:
+            for line in lines:
+                # Skip empty lines and comments
+                stripped = line.strip()
+                if not stripped or stripped.startswith("--"):
+                    continue
 
-            # Skip empty lines and comments
-            if not line.strip() or line.strip().startswith("--"):
-                i += 1
-                continue
+                # Gate the keyword regexes on a cheap prefix test so SET, SELECT,
+                # GRANT and friends never reach the regex engine.
+                head = line[:6].upper()
 
-            # CREATE TABLE
-            if re.match(r"CREATE\s+TABLE\s+", line, re.IGNORECASE):
-                result = self._parse_create_table(line)
-                if result:
-                    schema, table = result
-                    columns, i = self._process_table_columns(lines, i + 1)
+                # CREATE TABLE
+                if head == "CREATE" and _RE_CREATE_TABLE_PREFIX.match(line):
+                    result = self._parse_create_table(line)
+                    if result:
+                        schema, table = result
+                        columns = self._process_table_columns(lines)
 
-                    pg_table = PgTable(name=table, schema=schema, columns=columns)
-                    self.tables[table] = pg_table
-                    continue
+                        pg_table = PgTable(name=table, schema=schema, columns=columns)
+                        self.tables[table] = pg_table
+                        continue
 
-            # ALTER TABLE ... PRIMARY KEY / FOREIGN KEY
-            if re.match(r"ALTER\s+TABLE\s+", line, re.IGNORECASE):
-                # Accumulate lines until we have a complete statement (ends with ;)
-                stmt_lines = [line]
-                while i + 1 < len(lines) and not stmt_lines[-1].strip().endswith(";"):
-                    i += 1
-                    next_line = lines[i]
-                    if next_line.strip() and not next_line.strip().startswith("--"):
-                        stmt_lines.append(next_line)
-
-                full_stmt = " ".join(line.strip() for line in stmt_lines)
-
-                pk_result = self._parse_alter_table_primary_key(full_stmt)
-                if pk_result:
-                    schema, table, pk_cols = pk_result
-                    if table in self.tables:
-                        self.tables[table] = dataclasses.replace(
-                            self.tables[table], primary_key=pk_cols
-                        )
-                    i += 1
+                # ALTER TABLE ... PRIMARY KEY / FOREIGN KEY
+                if head.startswith("ALTER") and _RE_ALTER_PREFIX.match(line):
+                    # Accumulate lines until we have a complete statement (ends with ;)
+                    stmt_lines = [line]
+                    while not stmt_lines[-1].strip().endswith(";"):
+                        next_line = next(lines, None)
+                        if next_line is None:
+                            break
+                        if next_line.strip() and not next_line.strip().startswith("--"):
+                            stmt_lines.append(next_line)
+
+                    full_stmt = " ".join(line.strip() for line in stmt_lines)
+
+                    pk_result = self._parse_alter_table_primary_key(full_stmt)
+                    if pk_result:
+                        schema, table, pk_cols = pk_result
+                        if table in self.tables:
+                            self.tables[table].primary_key = pk_cols
+                        continue
+
+                    fk_result = self._parse_alter_table_foreign_key(full_stmt)
+                    if fk_result:
+                        schema, table, fk = fk_result
+                        self.foreign_keys.append((table, fk))
+                        continue
+
+                # CREATE INDEX
+                if head == "CREATE" and _RE_CREATE_INDEX_PREFIX.match(line):
+                    idx = self._parse_create_index(line)
+                    if idx:
+                        self.indexes.append(idx)
                     continue
 
-                fk_result = self._parse_alter_table_foreign_key(full_stmt)
-                if fk_result:
-                    schema, table, fk = fk_result
-                    self.foreign_keys.append((table, fk))
-                    i += 1
+                # COPY
+                copy_result = (
+                    self._parse_copy_statement(line) if head.startswith("COPY") else None
+                )
+                if copy_result:
+                    schema, table, columns = copy_result
+                    self._in_copy = True
+                    self._copy_columns = columns
+                    self._copy_buffer = self._read_copy_rows(lines)
+
+                    self.copy_statements[table] = (self._copy_columns, self._copy_buffer)
+                    self._in_copy = False
+
+                    # Update progress after COPY block
+                    if self._progress is not None and self._parse_task is not None:
+                        self._progress.update(
+                            self._parse_task, completed=self._source.tell()
+                        )
                     continue
 
-            # CREATE INDEX
-            if re.match(r"CREATE\s+(?:UNIQUE\s+)?INDEX\s+", line, re.IGNORECASE):
-                idx = self._parse_create_index(line)
-                if idx:
-                    self.indexes.append(idx)
-                i += 1
-                continue
+                statements += 1
 
-            # COPY
-            copy_result = self._parse_copy_statement(line)
-            if copy_result:
-                schema, table, columns = copy_result
-                self._in_copy = True
-                self._copy_columns = columns
-                self._copy_buffer = []
-
-                # Read data lines until \.
-                i += 1
-                while i < len(lines):
-                    data_line = lines[i]
-                    parsed = self._parse_copy_line(data_line)
-                    if parsed is None:
-                        # End of COPY
-                        break
-                    self._copy_buffer.append(parsed)
-                    i += 1
-
-                self.copy_statements[table] = (self._copy_columns, self._copy_buffer)
-                self._in_copy = False
-                i += 1
-
-                # Update progress after COPY block
+                # Update progress periodically
                 if (
                     self._progress is not None
                     and self._parse_task is not None
-                    and i - last_update >= update_interval
+                    and statements % update_interval == 0
                 ):
-                    self._progress.update(self._parse_task, completed=i)
-                    last_update = i
-
-                continue
-
-            i += 1
-
-            # Update progress periodically
-            if (
-                self._progress is not None
-                and self._parse_task is not None
-                and i - last_update >= update_interval
-            ):
-                self._progress.update(self._parse_task, completed=i)
-                last_update = i
+                    self._progress.update(self._parse_task, completed=self._source.tell())
+        finally:
+            if self._copy_pool is not None:
+                self._copy_pool.shutdown()
+                self._copy_pool = None
 
         # Final progress update
         if self._progress is not None and self._parse_task is not None:
-            self._progress.update(self._parse_task, completed=total_lines)
+            self._progress.update(self._parse_task, completed=total_bytes)
 
         # Associate foreign keys and indexes with tables
         for table_name, fk in self.foreign_keys:
             if table_name in self.tables:
-                existing_fks = list(self.tables[table_name].foreign_keys)
-                existing_fks.append(fk)
-                self.tables[table_name] = dataclasses.replace(
-                    self.tables[table_name], foreign_keys=existing_fks
-                )
+                self.tables[table_name].foreign_keys.append(fk)
 
         # Associate indexes with tables
         for idx in self.indexes:
             if idx.table in self.tables:
-                existing_indexes = list(self.tables[idx.table].indexes)
-                existing_indexes.append(idx)
-                self.tables[idx.table] = dataclasses.replace(
-                    self.tables[idx.table], indexes=existing_indexes
-                )
+                self.tables[idx.table].indexes.append(idx)
 
 
 def _build_name_maps(
@@ -861,13 +822,10 @@ def _toposort_tables(tables: list[PgTable]) -> list[PgTable]:
     # Add self-referencing FKs back to tables
     for table_name, fks in self_refs.items():
         if table_name in by_name:
-            existing_fks = list(by_name[table_name].foreign_keys)
+            existing_fks = by_name[table_name].foreign_keys
             for fk in fks:
                 if fk not in existing_fks:
                     existing_fks.append(fk)
-            by_name[table_name] = dataclasses.replace(
-                by_name[table_name], foreign_keys=existing_fks
-            )
 
     return [by_name[name] for name in out]
 
@@ -1019,22 +977,13 @@ def _copy_table_data(
             f"[dim]Copying {total:,} rows into {table_name_map.get(table.name, table.name)}...[/dim]"
         )
 
-    cur = conn.cursor()
-    n = 0
-    skipped = 0
-    last_logged = 0
-    log_interval = max(1, min(10000, total // 10))  # Log every 10% or 10000 rows
-    in_tx = False
+    col_count = len(col_mapping)
 
-    if commit_every and commit_every > 0:
-        conn.execute("BEGIN")
-        in_tx = True
-
-    for row in rows:
+    def convert_row(row: tuple) -> list:
         # Convert row values based on column types
         converted = []
         for i, val in enumerate(row):
-            if i >= len(col_mapping):
+            if i >= col_count:
                 break
 
             if val is None:
@@ -1071,37 +1020,76 @@ def _copy_table_data(
                     converted.append(str(val) if val is not None else None)
             else:
                 converted.append(val)
+        return converted
 
-        try:
-            cur.execute(insert_sql, converted)
-            n += 1
-        except (decentdb.IntegrityError, decentdb.InternalError):
-            # Skip rows that violate constraints (e.g., FK violations, missing parent)
-            skipped += 1
+    cur = conn.cursor()
+    n = 0
+    skipped = 0
+    last_logged = 0
+    log_interval = max(1, min(10000, total // 10))  # Log every 10% or 10000 rows
+
+    if not (commit_every and commit_every > 0):
+        # Autocommit: one statement per row
+        for row in rows:
+            try:
+                cur.execute(insert_sql, convert_row(row))
+                n += 1
+            except (decentdb.IntegrityError, decentdb.InternalError):
+                # Skip rows that violate constraints (e.g., FK violations, missing parent)
+                skipped += 1
 
-        if in_tx and commit_every and commit_every > 0 and (n % commit_every == 0):
+            if (
+                progress is not None
+                and task_id is not None
+                and (n % update_every == 0 or n == total)
+            ):
+                progress.update(task_id, completed=n)
+
+            # Verbose logging
+            if verbose and console is not None and n - last_logged >= log_interval:
+                console.print(
+                    f"  [dim]{table.name}: {n:,}/{total:,} rows ({100 * n // total}%)...[/dim]"
+                )
+                last_logged = n
+    else:
+        # One transaction and one executemany call per commit_every rows. If
+        # any row in the batch violates a constraint, the batch is rolled back
+        # and replayed row by row so only the offending rows are skipped.
+        for start in range(0, total, commit_every):
+            batch = [convert_row(row) for row in rows[start : start + commit_every]]
+            conn.execute("BEGIN")
+            try:
+                cur.executemany(insert_sql, batch)
+                inserted = len(batch)
+            except (decentdb.IntegrityError, decentdb.InternalError):
+                cur.close()
+                conn.execute("ROLLBACK")
+                conn.execute("BEGIN")
+                cur = conn.cursor()
+                inserted = 0
+                for converted in batch:
+                    try:
+                        cur.execute(insert_sql, converted)
+                        inserted += 1
+                    except (decentdb.IntegrityError, decentdb.InternalError):
+                        # Skip rows that violate constraints (e.g., FK violations, missing parent)
+                        skipped += 1
             cur.close()
             conn.execute("COMMIT")
-            conn.execute("BEGIN")
             cur = conn.cursor()
+            n += inserted
 
-        if (
-            progress is not None
-            and task_id is not None
-            and (n % update_every == 0 or n == total)
-        ):
-            progress.update(task_id, completed=n)
+            if progress is not None and task_id is not None:
+                progress.update(task_id, completed=n)
 
-        # Verbose logging
-        if verbose and console is not None and n - last_logged >= log_interval:
-            console.print(
-                f"  [dim]{table.name}: {n:,}/{total:,} rows ({100 * n // total}%)...[/dim]"
-            )
-            last_logged = n
+            # Verbose logging
+            if verbose and console is not None and n - last_logged >= log_interval:
+                console.print(
+                    f"  [dim]{table.name}: {n:,}/{total:,} rows ({100 * n // total}%)...[/dim]"
+                )
+                last_logged = n
 
-    if in_tx:
-        cur.close()
-        conn.execute("COMMIT")
+    cur.close()
 
     if progress is not None and task_id is not None:
         progress.update(task_id, completed=n)
@@ -1190,8 +1178,13 @@ def convert_pg_dump_to_decentdb(
     cache_pages: int | None = None,
     cache_mb: int | None = None,
     verbose: bool = False,
+    parse_workers: int = 1,
 ) -> ConversionReport:
-    """Convert a PostgreSQL dump file to DecentDB."""
+    """Convert a PostgreSQL dump file to DecentDB.
+
+    ``parse_workers`` > 1 parses large COPY blocks in that many worker
+    processes; 0 uses one per CPU.
+    """
     import time
 
     start_time = time.time()
@@ -1253,7 +1246,9 @@ def convert_pg_dump_to_decentdb(
         progress.start()
 
     # Parse the dump file
-    parser = PgDumpParser(pg_dump_path, progress=progress, console=console)
+    parser = PgDumpParser(
+        pg_dump_path, progress=progress, console=console, workers=parse_workers
+    )
     parser.parse()
 
     if progress is not None:
@@ -1556,7 +1551,7 @@ def convert_pg_dump_to_decentdb(
                 for warning in report.warnings:
                     if warning.startswith("Skipping table"):
                         # Parse "Skipping table 'Name': reason"
-                        match = re.match(r"Skipping table '([^']+)': (.+)", warning)
+                        match = _RE_SKIPPED_TABLE_WARNING.match(warning)
                         if match:
                             skipped_tbl.add_row(match.group(1), match.group(2))
                 console.print(skipped_tbl)
@@ -1653,6 +1648,12 @@ def main(argv: Sequence[str] | None = None) -> int:
         default=None,
         help="Override DecentDB cache size in pages (DefaultPageSize pages)",
     )
+    p.add_argument(
+        "--parse-workers",
+        type=int,
+        default=1,
+        help="Parse large COPY blocks in N worker processes (0 = one per CPU)",
+    )
     p.add_argument(
         "--verbose",
         "-v",
@@ -1671,6 +1672,7 @@ def main(argv: Sequence[str] | None = None) -> int:
         cache_mb=args.cache_mb,
         cache_pages=args.cache_pages,
         verbose=bool(args.verbose),
+        parse_workers=int(args.parse_workers),
     )
 
     if args.report_json:
@@ -277,6 +277,92 @@ class TestCursorExecutemany:
 
         conn.close()
 
+    def test_executemany_named_params_use_batch_path(self, tmp_path):
+        """Mapping rows are rewritten once and batched like positional rows."""
+        db_path = str(tmp_path / "executemany_named.ddb")
+
+        conn = decentdb.connect(db_path)
+        cur = conn.cursor()
+        cur.execute("CREATE TABLE t (id INT64, name TEXT, score FLOAT64)")
+
+        rows = [
+            {"id": 1, "name": "one", "score": 1.5},
+            {"score": 2.5, "id": 2, "name": "two"},
+            {"id": 3, "name": "three", "score": 3.5, "unused": None},
+        ]
+        cur.executemany("INSERT INTO t VALUES (:id, :name, :score)", rows)
+        conn.commit()
+
+        assert cur.rowcount == len(rows)
+        cur.execute("SELECT id, name, score FROM t ORDER BY id")
+        assert cur.fetchall() == [(1, "one", 1.5), (2, "two", 2.5), (3, "three", 3.5)]
+
+        with pytest.raises(decentdb.ProgrammingError, match="Mixed parameter styles"):
+            cur.executemany(
+                "INSERT INTO t VALUES (:id, :name, :score)",
+                [{"id": 4, "name": "four", "score": 4.5}, (5, "five", 5.5)],
+            )
+
+        conn.close()
+
+    def test_executemany_mixed_rows_hand_off_between_native_and_python(self, tmp_path):
+        """Rows with NULLs, blobs, and richer types all land, in order."""
+        db_path = str(tmp_path / "executemany_mixed_rows.ddb")
+
+        conn = decentdb.connect(db_path)
+        cur = conn.cursor()
+        cur.execute("CREATE TABLE t (id INT64, payload BLOB, note TEXT, amount DECIMAL(10,2))")
+
+        rows = [
+            (1, b"\x00\x01", None, None),
+            (2, None, "two", decimal.Decimal("2.50")),
+            (3, b"", "three", None),
+            [4, b"\xff", None, decimal.Decimal("4.25")],
+            (5, None, None, None),
+        ]
+        cur.executemany("INSERT INTO t VALUES (?, ?, ?, ?)", rows)
+        conn.commit()
+
+        assert cur.rowcount == len(rows)
+        cur.execute("SELECT id, payload, note, amount FROM t ORDER BY id")
+        assert cur.fetchall() == [
+            (1, b"\x00\x01", None, None),
+            (2, None, "two", decimal.Decimal("2.50")),
+            (3, b"", "three", None),
+            (4, b"\xff", None, decimal.Decimal("4.25")),
+            (5, None, None, None),
+        ]
+
+        with pytest.raises(decentdb.ProgrammingError, match="Incorrect number"):
+            cur.executemany(
+                "INSERT INTO t VALUES (?, ?, ?, ?)",
+                [(6, None, None, None), (7, None, None)],
+            )
+
+        conn.close()
+
+    def test_executemany_native_rows_raise_engine_errors_once(self, tmp_path):
+        """A constraint failure on a natively bound row raises IntegrityError."""
+        db_path = str(tmp_path / "executemany_engine_error.ddb")
+
+        conn = decentdb.connect(db_path)
+        cur = conn.cursor()
+        cur.execute("CREATE TABLE t (id INT64 PRIMARY KEY, name TEXT)")
+        conn.commit()
+
+        with pytest.raises(decentdb.IntegrityError):
+            cur.executemany(
+                "INSERT INTO t VALUES (?, ?)",
+                [(1, "one"), (2, "two"), (2, "again"), (3, "three")],
+            )
+
+        cur.execute("SELECT id FROM t ORDER BY id")
+        ids = [row[0] for row in cur.fetchall()]
+        assert 3 not in ids
+        assert ids.count(2) <= 1
+
+        conn.close()
+
 
 class TestCursorFetchmany:
     """Tests for cursor.fetchmany()."""
@@ -451,7 +537,38 @@ class TestCursorIteration:
         
         with pytest.raises(decentdb.ProgrammingError):
             next(cur)
-        
+
+        conn.close()
+
+    def test_cursor_iteration_batches_mix_with_fetch_calls(self, tmp_path):
+        """Batched iteration hands remaining rows to fetchone/fetchmany/fetchall."""
+        db_path = str(tmp_path / "cursor_iter_batches.ddb")
+
+        conn = decentdb.connect(db_path)
+        cur = conn.cursor()
+        cur.execute("CREATE TABLE t (id INTEGER)")
+        cur.executemany("INSERT INTO t VALUES (?)", [(i,) for i in range(10)])
+        conn.commit()
+
+        cur._iter_batch_rows = 3
+        cur.execute("SELECT id FROM t ORDER BY id")
+        assert next(cur) == (0,)
+        assert cur.fetchone() == (1,)
+        assert cur.fetchmany(3) == [(2,), (3,), (4,)]
+        assert next(cur) == (5,)
+        assert cur.fetchall() == [(6,), (7,), (8,), (9,)]
+        with pytest.raises(StopIteration):
+            next(cur)
+
+        cur.execute("SELECT id FROM t ORDER BY id")
+        assert list(cur) == [(i,) for i in range(10)]
+
+        # A half-consumed batch must not leak into the next result.
+        cur.execute("SELECT id FROM t ORDER BY id")
+        assert next(cur) == (0,)
+        cur.execute("SELECT id FROM t WHERE id >= 8 ORDER BY id")
+        assert cur.fetchall() == [(8,), (9,)]
+
         conn.close()
 
 
@@ -241,3 +241,30 @@ def test_low_hit_rate_emits_performance_warning(tmp_path):
 
     with pytest.warns(decentdb.PerformanceWarning, match="parameterized"):
         conn.close()
+
+
+def test_named_param_rewrite_is_cached_per_connection(tmp_path):
+    db_path = str(tmp_path / "named_rewrite_cache.ddb")
+    conn = decentdb.connect(db_path)
+    conn.execute("CREATE TABLE foo (id INT64 PRIMARY KEY, name TEXT)")
+    conn.execute("INSERT INTO foo VALUES (?, ?)", (1, "a"))
+    conn.execute("INSERT INTO foo VALUES (?, ?)", (2, "b"))
+
+    sql = "SELECT name FROM foo WHERE id = :id OR name = :name OR id = :id"
+    cur = conn.cursor()
+    cur.execute(sql, {"id": 1, "name": "zzz"})
+    assert cur.fetchall() == [("a",)]
+    assert conn._named_rewrite_cache[sql] == (
+        "SELECT name FROM foo WHERE id = $1 OR name = $2 OR id = $1",
+        ("id", "name"),
+    )
+
+    other = conn.cursor()
+    other.execute(sql, {"id": 2, "name": "zzz", "extra": 0})
+    assert other.fetchall() == [("b",)]
+    assert len(conn._named_rewrite_cache) == 1
+
+    with pytest.raises(decentdb.ProgrammingError, match="Missing parameter 'name'"):
+        other.execute(sql, {"id": 1})
+
+    conn.close()
@@ -384,16 +384,16 @@ def test_missing_line_942_947(db_path, monkeypatch):
             return None
     
     lib = conn._lib
-    orig_info = lib.decentdb_list_tables_json
+    orig_info = conn._fn_list_tables
     orig_code = getattr(lib, 'decentdb_last_error_code', None)
     try:
-        lib.decentdb_list_tables_json = Mocker().err
+        conn._fn_list_tables = Mocker().err
         if orig_code:
             lib.decentdb_last_error_code = lambda *x: 1
         with pytest.raises(Exception):
             conn.list_tables()
     finally:
-        lib.decentdb_list_tables_json = orig_info
+        conn._fn_list_tables = orig_info
         if orig_code:
             lib.decentdb_last_error_code = orig_code
         lib.decentdb_last_error_code = orig_code
@@ -4,6 +4,7 @@ import os
 import pytest
 
 import decentdb
+from decentdb.tools import pgbak_import
 from decentdb.tools.pgbak_import import convert_pg_dump_to_decentdb, write_report_json
 
 
@@ -355,6 +356,88 @@ def test_pg_dump_file_not_found():
         )
 
 
+def _make_pg_dump_fk_violation(path: str) -> None:
+    """Create a PG dump whose Albums COPY block has one orphaned row."""
+    dump = """\
+CREATE TABLE public."Artists" (
+    "Id" integer NOT NULL,
+    "Name" character varying(255) NOT NULL
+);
+
+CREATE TABLE public."Albums" (
+    "Id" integer NOT NULL,
+    "ArtistId" integer NOT NULL,
+    "Title" character varying(255) NOT NULL
+);
+
+COPY public."Artists" ("Id", "Name") FROM stdin;
+1	The Beatles
+2	Pink Floyd
+\\.
+
+COPY public."Albums" ("Id", "ArtistId", "Title") FROM stdin;
+1	1	Abbey Road
+2	1	Revolver
+3	2	Animals
+4	2	Meddle
+5	99	Orphan
+6	1	Help!
+7	2	Wish You Were Here
+\\.
+
+ALTER TABLE ONLY public."Artists"
+    ADD CONSTRAINT "Artists_pkey" PRIMARY KEY ("Id");
+
+ALTER TABLE ONLY public."Albums"
+    ADD CONSTRAINT "Albums_pkey" PRIMARY KEY ("Id");
+
+ALTER TABLE ONLY public."Albums"
+    ADD CONSTRAINT "Albums_ArtistId_fkey" FOREIGN KEY ("ArtistId") REFERENCES public."Artists"("Id");
+"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(dump)
+
+
+def test_pg_dump_chunked_commit_replays_failed_chunk(tmp_path, monkeypatch):
+    """A chunk with a bad row is replayed row by row; only that row is skipped."""
+    pg_path = str(tmp_path / "dump.sql")
+    decent_path = str(tmp_path / "dst.decentdb")
+
+    _make_pg_dump_fk_violation(pg_path)
+
+    copy_table_data = pgbak_import._copy_table_data
+    open_after_copy = []
+
+    def checked_copy_table_data(**kwargs):
+        result = copy_table_data(**kwargs)
+        open_after_copy.append(kwargs["conn"].in_transaction)
+        return result
+
+    monkeypatch.setattr(pgbak_import, "_copy_table_data", checked_copy_table_data)
+
+    report = convert_pg_dump_to_decentdb(
+        pg_dump_path=pg_path,
+        decentdb_path=decent_path,
+        overwrite=False,
+        show_progress=False,
+        commit_every=3,
+    )
+
+    assert open_after_copy == [False, False]
+    assert report.rows_copied.get("albums") == 6
+    assert report.rows_skipped == 1
+
+    conn = decentdb.connect(decent_path)
+    try:
+        ids = [
+            row[0]
+            for row in conn.execute('SELECT "id" FROM "albums" ORDER BY "id"').fetchall()
+        ]
+        assert ids == [1, 2, 3, 4, 6, 7]
+    finally:
+        conn.close()
+
+
 def _make_pg_dump_nullable_numerics(path: str) -> None:
     """Create a PG dump with nullable int4 and float8 columns containing NULLs."""
     dump = """\
@@ -502,3 +585,67 @@ def test_pg_dump_composite_pk_tables_imported(tmp_path):
         assert rows[3] == (2, 3, 2)
     finally:
         conn.close()
+
+
+def test_pg_dump_parse_workers_match_serial_parse(tmp_path, monkeypatch):
+    """COPY blocks parsed in worker processes keep row order and values."""
+    pg_path = str(tmp_path / "dump.sql")
+    data = "".join(f"{i}\tname\\t{i}\t\\N\t{i}.5\n" for i in range(1, 11))
+    with open(pg_path, "w", encoding="utf-8") as f:
+        f.write(
+            'CREATE TABLE public."Items" (\n'
+            '    "Id" integer NOT NULL,\n'
+            '    "Name" text,\n'
+            '    "Note" text,\n'
+            '    "Score" double precision\n'
+            ");\n\n"
+            'COPY public."Items" ("Id", "Name", "Note", "Score") FROM stdin;\n'
+            + data
+            + "\\.\n"
+        )
+
+    serial = pgbak_import.PgDumpParser(pg_path)
+    serial.parse()
+
+    monkeypatch.setattr(pgbak_import, "_COPY_CHUNK_LINES", 3)
+    parallel = pgbak_import.PgDumpParser(pg_path, workers=2)
+    parallel.parse()
+
+    assert parallel.copy_statements == serial.copy_statements
+    _, rows = parallel.copy_statements["Items"]
+    assert len(rows) == 10
+    assert rows[0] == (1, "name\t1", None, 1.5)
+
+
+def test_pg_dump_parse_workers_share_one_pool(tmp_path, monkeypatch):
+    """Every COPY block in one parse is handled by a single worker pool."""
+    pg_path = str(tmp_path / "dump.sql")
+    with open(pg_path, "w", encoding="utf-8") as f:
+        for name in ("First", "Second"):
+            f.write(
+                f'CREATE TABLE public."{name}" (\n'
+                '    "Id" integer NOT NULL\n'
+                ");\n\n"
+                f'COPY public."{name}" ("Id") FROM stdin;\n'
+                + "".join(f"{i}\n" for i in range(1, 8))
+                + "\\.\n\n"
+            )
+
+    started = []
+    executor_type = pgbak_import.ProcessPoolExecutor
+
+    def counting_executor(*args, **kwargs):
+        pool = executor_type(*args, **kwargs)
+        started.append(pool)
+        return pool
+
+    monkeypatch.setattr(pgbak_import, "ProcessPoolExecutor", counting_executor)
+    monkeypatch.setattr(pgbak_import, "_COPY_CHUNK_LINES", 3)
+    parser = pgbak_import.PgDumpParser(pg_path, workers=2)
+    parser.parse()
+
+    assert len(started) == 1
+    assert parser._copy_pool is None
+    for name in ("First", "Second"):
+        _, rows = parser.copy_statements[name]
+        assert rows == [(i,) for i in range(1, 8)]
@@ -0,0 +1,131 @@
+import threading
+
+import pytest
+
+import decentdb
+
+
+def test_pool_reuses_released_connections(db_path):
+    with decentdb.create_pool(db_path, max_size=2) as pool:
+        with pool.connection() as conn:
+            conn.execute("CREATE TABLE t (id INT64)")
+            conn.execute("INSERT INTO t VALUES (1)")
+            conn.commit()
+            first = conn
+
+        assert pool.size == 1
+        assert pool.idle == 1
+        with pool.connection() as conn:
+            assert conn is first
+            assert conn.execute("SELECT id FROM t").fetchall() == [(1,)]
+
+
+def test_pool_min_size_opens_connections_up_front(db_path):
+    pool = decentdb.ConnectionPool(db_path, min_size=2, max_size=3)
+    try:
+        assert pool.size == 2
+        assert pool.idle == 2
+    finally:
+        pool.close()
+    assert pool.size == 0
+
+
+def test_pool_release_rolls_back_uncommitted_work(db_path):
+    with decentdb.create_pool(db_path, max_size=1) as pool:
+        with pool.connection() as conn:
+            conn.execute("CREATE TABLE t (id INT64)")
+            conn.commit()
+
+        with pool.connection() as conn:
+            conn.execute("BEGIN")
+            conn.execute("INSERT INTO t VALUES (1)")
+
+        with pool.connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM t").fetchone() == (0,)
+
+
+def test_pool_acquire_times_out_when_exhausted(db_path):
+    with decentdb.create_pool(db_path, max_size=1) as pool:
+        conn = pool.acquire()
+        with pytest.raises(decentdb.OperationalError):
+            pool.acquire(timeout=0.01)
+        pool.release(conn)
+        pool.release(pool.acquire(timeout=0.01))
+
+
+def test_pool_acquire_waits_for_release(db_path):
+    with decentdb.create_pool(db_path, max_size=1) as pool:
+        conn = pool.acquire()
+        acquired = []
+
+        def worker():
+            other = pool.acquire(timeout=5)
+            acquired.append(other)
+            pool.release(other)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        pool.release(conn)
+        thread.join(timeout=5)
+        assert acquired == [conn]
+
+
+def test_pool_closed_connection_is_dropped_on_release(db_path):
+    with decentdb.create_pool(db_path, max_size=1) as pool:
+        conn = pool.acquire()
+        conn.close()
+        pool.release(conn)
+        assert pool.size == 0
+        with pool.connection() as fresh:
+            assert fresh is not conn
+
+
+def test_pool_rejects_acquire_after_close(db_path):
+    pool = decentdb.create_pool(db_path)
+    pool.close()
+    with pytest.raises(decentdb.ProgrammingError):
+        pool.acquire()
+
+
+def test_pool_validates_sizes(db_path):
+    with pytest.raises(ValueError):
+        decentdb.ConnectionPool(db_path, max_size=0)
+    with pytest.raises(ValueError):
+        decentdb.ConnectionPool(db_path, min_size=3, max_size=2)
+
+
+def test_pool_rejects_unknown_and_duplicate_release(db_path):
+    with decentdb.create_pool(db_path, max_size=1) as pool:
+        conn = pool.acquire()
+        pool.release(conn)
+        with pytest.raises(decentdb.ProgrammingError):
+            pool.release(conn)
+        assert pool.size == 1
+        assert pool.idle == 1
+
+        stranger = decentdb.connect(db_path)
+        try:
+            with pytest.raises(decentdb.ProgrammingError):
+                pool.release(stranger)
+        finally:
+            stranger.close()
+
+
+def test_pool_frees_slot_when_rollback_and_close_fail(db_path, monkeypatch):
+    with decentdb.create_pool(db_path, max_size=1) as pool:
+        conn = pool.acquire()
+
+        def fail(*_args, **_kwargs):
+            raise decentdb.OperationalError("boom")
+
+        monkeypatch.setattr(conn, "rollback", fail)
+        monkeypatch.setattr(conn, "close", fail)
+        pool.release(conn)
+        monkeypatch.undo()
+        assert pool.size == 0
+        assert pool.idle == 0
+
+        fresh = pool.acquire(timeout=1)
+        assert fresh is not conn
+        pool.release(fresh)
+        conn.close()
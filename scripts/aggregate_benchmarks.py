@@ -11,13 +11,46 @@ from __future__ import annotations
 
 import argparse
 import json
+from collections import defaultdict
 from copy import deepcopy
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup.
+    orjson = None
+
+
+def _load_json(path):
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _write_json(path, document):
+    if orjson is not None:
+        path.write_bytes(
+            orjson.dumps(
+                document,
+                option=orjson.OPT_INDENT_2
+                | orjson.OPT_SORT_KEYS
+                | orjson.OPT_APPEND_NEWLINE,
+            )
+        )
+        return
+    with path.open("w", encoding="utf-8") as handle:
+        json.dump(document, handle, indent=2, sort_keys=True)
+        handle.write("\n")
+
 
 def _safe_float(value):
-    if value is None or isinstance(value, bool):
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int:
+        return float(value)
+    if value is None or value_type is bool:
         return None
     try:
         return float(value)
@@ -117,17 +150,17 @@ def _append_metadata_note(existing_note, addition):
 
 
 def _pick_nearest(records, target_operations):
-    best = None
-    best_distance = None
+    target = int(target_operations)
+    candidates = []
     for record in records:
-        operations = record.get("operations", record.get("n_ops"))
+        operations = record.get("operations")
         if operations is None:
-            continue
-        distance = abs(int(operations) - int(target_operations))
-        if best is None or distance < best_distance:
-            best = record
-            best_distance = distance
-    return best
+            operations = record.get("n_ops")
+        if operations is not None:
+            candidates.append((abs(int(operations) - target), record))
+    if not candidates:
+        return None
+    return min(candidates, key=lambda candidate: candidate[0])[1]
 
 
 def _add_storage_metadata(
@@ -182,8 +215,7 @@ def load_native_summary(path):
             "Run `cargo bench -p decentdb --bench embedded_compare` first."
         )
 
-    with path.open("r", encoding="utf-8") as handle:
-        document = json.load(handle)
+    document = _load_json(path)
 
     engines = document.get("engines")
     if not isinstance(engines, dict) or not engines:
@@ -219,7 +251,7 @@ def merge_python_embedded_compare_results(summary, py_results_path, target_opera
         }
 
     try:
-        document = json.loads(path.read_text(encoding="utf-8"))
+        document = _load_json(path)
     except json.JSONDecodeError as exc:
         return {
             "merged": False,
@@ -247,22 +279,39 @@ def merge_python_embedded_compare_results(summary, py_results_path, target_opera
     }
 
     merged_engines = []
-    grouped = {}
+    existing_engines = {_canonical_engine_name(name) for name in summary["engines"]}
+    # Resolved once per distinct engine; None marks engines that can never
+    # be merged, so their rows are dropped before grouping.
+    output_names = {}
+    grouped = defaultdict(list)
     for row in results:
-        engine = row.get("engine")
-        benchmark = row.get("benchmark", row.get("bench"))
+        row_get = row.get
+        engine = row_get("engine")
+        benchmark = row_get("benchmark")
+        if benchmark is None:
+            benchmark = row_get("bench")
         if not engine or not benchmark:
             continue
-        grouped.setdefault((engine, benchmark), []).append(row)
+        raw_name = str(engine)
+        if raw_name not in output_names:
+            output_name = engine_name_map.get(raw_name) or _canonicalize_python_engine_name(
+                raw_name
+            )
+            if (
+                output_name not in {"H2", "Apache Derby", "HSQLDB", "Firebird", "LiteDB"}
+                or _canonical_engine_name(output_name) in existing_engines
+            ):
+                output_name = None
+            output_names[raw_name] = output_name
+        if output_names[raw_name] is None:
+            continue
+        grouped[(engine, benchmark)].append(row)
 
     for (python_engine, benchmark), rows in grouped.items():
         raw_name = str(python_engine)
-        output_name = engine_name_map.get(raw_name) or _canonicalize_python_engine_name(
-            raw_name
-        )
-        if output_name not in {"H2", "Apache Derby", "HSQLDB", "Firebird", "LiteDB"}:
-            continue
-        if _engine_exists(summary["engines"], output_name):
+        output_name = output_names[raw_name]
+        canonical_output = _canonical_engine_name(output_name)
+        if canonical_output in existing_engines:
             continue
 
         chosen = _pick_nearest(rows, target_operations)
@@ -271,15 +320,13 @@ def merge_python_embedded_compare_results(summary, py_results_path, target_opera
 
         chosen_metadata = _extract_engine_metadata(chosen)
         engine_metrics = summary["engines"].setdefault(output_name, {})
+        existing_engines.add(canonical_output)
         updated = False
 
         if benchmark == "point_select":
             p95_ms = _load_point_metric(chosen)
             if p95_ms is not None:
-                if _safe_float(engine_metrics.get("read_p95_ms")) is None:
-                    engine_metrics["read_p95_ms"] = p95_ms
-                else:
-                    engine_metrics["read_p95_ms"] = p95_ms
+                engine_metrics["read_p95_ms"] = p95_ms
                 updated = True
 
         elif benchmark == "prepared_statement_roundtrip":
@@ -305,10 +352,7 @@ def merge_python_embedded_compare_results(summary, py_results_path, target_opera
                     if p50_us_per_op is not None and p50_us_per_op != 0:
                         throughput = 1_000_000.0 / p50_us_per_op
             if throughput is not None and throughput != 0:
-                if _safe_float(engine_metrics.get("insert_rows_per_sec")) is None:
-                    engine_metrics["insert_rows_per_sec"] = throughput
-                else:
-                    engine_metrics["insert_rows_per_sec"] = throughput
+                engine_metrics["insert_rows_per_sec"] = throughput
                 updated = True
 
         _add_storage_metadata(engine_metrics, chosen_metadata, existing_source=raw_name.lower())
@@ -318,6 +362,7 @@ def merge_python_embedded_compare_results(summary, py_results_path, target_opera
             merged_engines.append(output_name)
         elif not updated and not engine_metrics:
             summary["engines"].pop(output_name, None)
+            existing_engines.discard(canonical_output)
 
     if not merged_engines:
         return {
@@ -376,9 +421,7 @@ def main():
     )
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", encoding="utf-8") as handle:
-        json.dump(summary, handle, indent=2, sort_keys=True)
-        handle.write("\n")
+    _write_json(output_path, summary)
 
     print(f"Wrote benchmark summary to: {output_path}")
     print(f"  Engines: {', '.join(summary['engines'].keys())}")
@@ -0,0 +1,17 @@
+"""Shared helpers for scanning benchmark result directories."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+
+def json_files(directory: Path) -> list[Path]:
+    # scandir reports the entry type from the directory listing itself, so
+    # filtering needs no per-entry stat call.
+    with os.scandir(directory) as entries:
+        return sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(".json") and entry.is_file()
+        )
@@ -307,38 +307,39 @@ def parse_comparisons(log_path: Path) -> list[Comparison]:
     current: Comparison | None = None
     section: str | None = None
 
-    for raw_line in log_path.read_text(encoding="utf-8", errors="replace").splitlines():
-        line = raw_line.strip()
-        match = COMPARISON_RE.match(line)
-        if match:
-            name = (match.group("name") or "Complex").strip()
-            current = Comparison(name=name)
-            comparisons.append(current)
-            section = None
-            continue
-
-        if current is None:
-            continue
-        if line == "DecentDB better at:":
-            section = "decentdb_better"
-            continue
-        if line == "SQLite better at:":
-            section = "sqlite_better"
-            continue
-        if line == "Ties:":
-            section = "ties"
-            continue
-        if line == "Skipped/unsupported:":
-            section = "skipped"
-            continue
-        if line.startswith("==="):
-            section = None
-            continue
-
-        if section and line.startswith("- "):
-            item = line[2:].strip()
-            if item and item != "none":
-                getattr(current, section).append(item)
+    with log_path.open("r", encoding="utf-8", errors="replace") as handle:
+        for raw_line in handle:
+            line = raw_line.strip()
+            match = COMPARISON_RE.match(line)
+            if match:
+                name = (match.group("name") or "Complex").strip()
+                current = Comparison(name=name)
+                comparisons.append(current)
+                section = None
+                continue
+
+            if current is None:
+                continue
+            if line == "DecentDB better at:":
+                section = "decentdb_better"
+                continue
+            if line == "SQLite better at:":
+                section = "sqlite_better"
+                continue
+            if line == "Ties:":
+                section = "ties"
+                continue
+            if line == "Skipped/unsupported:":
+                section = "skipped"
+                continue
+            if line.startswith("==="):
+                section = None
+                continue
+
+            if section and line.startswith("- "):
+                item = line[2:].strip()
+                if item and item != "none":
+                    getattr(current, section).append(item)
 
     return comparisons
 
@@ -15,6 +15,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from benchmark_json_files import json_files
+
 
 DEFAULT_HISTORY_DIR = Path("benchmarks/rust-baseline/results")
 DEFAULT_CURRENT_DIR = Path(".tmp/rust-baseline-current")
@@ -59,7 +61,7 @@ def load_runs(directory: Path) -> list[Run]:
     if not directory.exists():
         return runs
 
-    for path in sorted(directory.glob("*.json")):
+    for path in json_files(directory):
         with path.open("r", encoding="utf-8") as handle:
             document = json.load(handle)
         steps = {
@@ -10,9 +10,12 @@ Outputs:
 """
 
 import json
-import math
 from pathlib import Path
 
+import matplotlib
+
+matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
 import numpy as np
 
@@ -67,24 +70,33 @@ def load() -> tuple[list[dict[str, object]], dict[str, object]]:
 
 
 def normalize(rows: list[dict[str, object]]) -> list[dict[str, object]]:
-    baseline = next((row for row in rows if row["engine"] == BASELINE_ENGINE), None)
-    if baseline is None:
+    engines = [row["engine"] for row in rows]
+    if BASELINE_ENGINE not in engines:
         raise SystemExit(f"Baseline engine '{BASELINE_ENGINE}' not found in data.")
 
-    normalized: list[dict[str, object]] = []
-    for row in rows:
-        normalized_row: dict[str, object] = {"engine": row["engine"]}
-        for key, _, direction in METRICS:
-            base_value = to_float(baseline.get(key))
-            value = to_float(row.get(key))
-            if base_value is None or value is None:
-                normalized_row[key] = None
-            elif direction == "higher":
-                normalized_row[key] = value / base_value if base_value != 0 else None
-            else:
-                normalized_row[key] = base_value / value if value != 0 else None
-        normalized.append(normalized_row)
-    return normalized
+    keys = [key for key, _, _ in METRICS]
+    higher = np.array([direction == "higher" for _, _, direction in METRICS])
+    values = np.array(
+        [[to_float(row.get(key)) for key in keys] for row in rows], dtype=float
+    )
+    baseline = values[engines.index(BASELINE_ENGINE)]
+
+    # "higher" metrics score value/baseline; "lower" metrics score baseline/value.
+    numerator = np.where(higher, values, baseline)
+    denominator = np.where(higher, baseline, values)
+    valid = ~np.isnan(numerator) & ~np.isnan(denominator) & (denominator != 0)
+    scores = np.divide(numerator, denominator, out=np.zeros_like(values), where=valid)
+
+    return [
+        {
+            "engine": engine,
+            **{
+                key: float(score) if ok else None
+                for key, score, ok in zip(keys, score_row, valid_row)
+            },
+        }
+        for engine, score_row, valid_row in zip(engines, scores, valid)
+    ]
 
 
 def plot(rows: list[dict[str, object]], meta: dict[str, object]) -> None:
@@ -114,17 +126,21 @@ def plot(rows: list[dict[str, object]], meta: dict[str, object]) -> None:
     width = 0.8 / max(len(engines), 1)
     offsets = (np.arange(len(engines), dtype=float) - (len(engines) - 1) / 2.0) * width
 
+    # Pivot to an engine x metric score matrix once; missing cells become NaN.
+    scores = np.array(
+        [
+            [to_float(rows_by_display[engine].get(key)) for key, _ in available_metrics]
+            for engine in engines
+        ],
+        dtype=float,
+    )
+
     fig, ax = plt.subplots(figsize=(12, 5))
 
     for index, engine in enumerate(engines):
-        row = rows_by_display[engine]
-        values = [
-            to_float(row.get(key)) if row.get(key) is not None else math.nan
-            for key, _ in available_metrics
-        ]
         ax.bar(
             positions + offsets[index],
-            values,
+            scores[index],
             width=width,
             label=engine,
             color=display_engine_color(engine, index),
@@ -140,11 +156,11 @@ def plot(rows: list[dict[str, object]], meta: dict[str, object]) -> None:
     ax.axhline(1.0, linewidth=1)
     ax.legend(title="Engine")
 
-    plt.tight_layout()
+    fig.tight_layout()
     OUT_SVG.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(OUT_SVG, format="svg")
+    fig.savefig(OUT_SVG, format="svg")
     strip_trailing_whitespace(OUT_SVG)
-    plt.savefig(OUT_PNG, format="png", dpi=180)
+    fig.savefig(OUT_PNG, format="png", dpi=180)
     plt.close(fig)
 
     print(f"Wrote: {OUT_SVG}")
@@ -10,6 +10,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from benchmark_json_files import json_files
+
 
 METRICS = [
     ("read_p95_ms", "Point read p95", "lower"),
@@ -69,7 +71,7 @@ def rust_baseline_runs(directory: Path) -> list[RustBaselineRun]:
         return []
 
     runs: list[RustBaselineRun] = []
-    for path in sorted(directory.glob("*.json")):
+    for path in json_files(directory):
         document = load_json(path)
         steps = document.get("steps", [])
         if not isinstance(steps, list):
@@ -13,9 +13,14 @@ import json
 import math
 from pathlib import Path
 
-import matplotlib.pyplot as plt
+import matplotlib
 import numpy as np
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup.
+    orjson = None
+
 from benchmark_chart_style import (
     BASELINE_ENGINE,
     display_engine_color,
@@ -23,6 +28,8 @@ from benchmark_chart_style import (
     ordered_display_engines,
 )
 
+matplotlib.use("Agg")
+
 ROOT = Path(__file__).resolve().parents[1]
 DATA = ROOT / "data" / "bench_summary.json"
 OUT_RADAR = ROOT / "assets" / "decentdb-radar.png"
@@ -51,8 +58,11 @@ def load() -> dict[str, dict[str, object]]:
     if not DATA.exists():
         raise SystemExit(f"Benchmark summary not found: {DATA}")
 
-    with DATA.open("r", encoding="utf-8") as handle:
-        doc = json.load(handle)
+    if orjson is not None:
+        doc = orjson.loads(DATA.read_bytes())
+    else:
+        with DATA.open("r", encoding="utf-8") as handle:
+            doc = json.load(handle)
 
     return doc["engines"]
 
@@ -65,64 +75,51 @@ def available_metrics(engines: dict[str, dict[str, object]]) -> list[tuple[str,
     ]
 
 
+def metric_matrix(
+    engines: dict[str, dict[str, object]], metrics: list[tuple[str, str, str]]
+) -> tuple[np.ndarray, np.ndarray]:
+    values = np.array(
+        [[to_float(row.get(key)) for key, _, _ in metrics] for row in engines.values()],
+        dtype=float,
+    ).reshape(len(engines), len(metrics))
+    higher = np.array([direction == "higher" for _, _, direction in metrics])
+    return values, higher
+
+
 def normalize_radar(engines: dict[str, dict[str, object]]) -> tuple[list[tuple[str, str, str]], dict[str, list[float]]]:
     metrics = available_metrics(engines)
     if not metrics:
         raise SystemExit("No plottable metrics found for radar chart.")
 
-    metric_index = {key: idx for idx, (key, _, _) in enumerate(metrics)}
-    normalized: dict[str, list[float]] = {}
-    for engine, values in engines.items():
-        display_name = display_engine_name(engine)
-        normalized[display_name] = [math.nan for _ in metrics]
-        for key, _, direction in metrics:
-            candidates = [
-                to_float(candidate_values.get(key))
-                for candidate_values in engines.values()
-            ]
-            finite = [
-                candidate for candidate in candidates if candidate is not None and candidate > 0.0
-            ]
-            if not finite:
-                continue
-
-            value = to_float(values.get(key))
-            if value is None:
-                continue
-            if value <= 0.0:
-                continue
-
-            idx = metric_index[key]
-
-            if direction == "lower":
-                best_value = min(finite)
-                normalized[display_name][idx] = best_value / value
-            else:
-                best_value = max(finite)
-                normalized[display_name][idx] = value / best_value
+    values, higher = metric_matrix(engines, metrics)
+    # Non-positive and missing values never score; fmin/fmax skip the NaNs.
+    positive = np.where(values > 0.0, values, np.nan)
+    best = np.where(higher, np.fmax.reduce(positive, axis=0), np.fmin.reduce(positive, axis=0))
+    scores = np.where(higher, positive / best, best / positive)
 
+    normalized = {
+        display_engine_name(engine): row.tolist() for engine, row in zip(engines, scores)
+    }
     return metrics, normalized
 
 
 def plot_radar(engines: dict[str, dict[str, object]]) -> None:
+    import matplotlib.pyplot as plt
+
     metrics, normalized = normalize_radar(engines)
     categories = [label for _, label, _ in metrics]
     count = len(categories)
-    angles = [index / float(count) * 2 * math.pi for index in range(count)]
-    angles += angles[:1]
+    spokes = np.linspace(0.0, 2 * np.pi, count, endpoint=False)
+    angles = np.concatenate((spokes, spokes[:1]))
 
-    fig = plt.figure(figsize=(10, 10))
-    ax = plt.subplot(111, polar=True)
+    fig, ax = plt.subplots(figsize=(10, 10), subplot_kw={"polar": True})
 
-    plt.xticks(angles[:-1], categories, color="grey", size=10)
+    ax.set_xticks(spokes)
+    ax.set_xticklabels(categories, color="grey", size=10)
     ax.set_rlabel_position(0)
-    plt.yticks(
-        [0.25, 0.5, 0.75, 1.0],
-        ["0.25", "0.50", "0.75", "1.00"],
-        color="grey",
-        size=7,
-    )
-    plt.ylim(0, 1.1)
+    ax.set_yticks([0.25, 0.5, 0.75, 1.0])
+    ax.set_yticklabels(["0.25", "0.50", "0.75", "1.00"], color="grey", size=7)
+    ax.set_ylim(0, 1.1)
 
     engines_for_radar = ordered_display_engines(list(normalized.keys()))
     complete_engines = [
@@ -155,7 +152,7 @@ def plot_radar(engines: dict[str, dict[str, object]]) -> None:
             fill = np.ma.array(wrapped, mask=np.isnan(wrapped))
             ax.fill(angles, fill, color, alpha=0.1)
 
-    plt.title("Overall Performance (Outer is Better)", size=16, y=1.1)
+    ax.set_title("Overall Performance (Outer is Better)", size=16, y=1.1)
     handles, labels = ax.get_legend_handles_labels()
     fig.legend(
         handles,
@@ -166,7 +163,7 @@ def plot_radar(engines: dict[str, dict[str, object]]) -> None:
     )
 
     OUT_RADAR.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(OUT_RADAR, dpi=150)
+    fig.savefig(OUT_RADAR, dpi=150)
     plt.close(fig)
     print(f"Wrote: {OUT_RADAR}")
 
@@ -179,25 +176,24 @@ def normalize_speedup(engines: dict[str, dict[str, object]]) -> tuple[list[tuple
     if not metrics:
         raise SystemExit("No plottable metrics found for speedup chart.")
 
-    baseline = engines[BASELINE_ENGINE]
-    normalized: dict[str, list[float]] = {}
-    for engine, values in engines.items():
-        display_name = display_engine_name(engine)
-        normalized[display_name] = []
-        for key, _, direction in metrics:
-            base_value = to_float(baseline.get(key))
-            value = to_float(values.get(key))
-            if base_value is None or value is None:
-                normalized[display_name].append(math.nan)
-            elif direction == "lower":
-                normalized[display_name].append(base_value / value if value > 0 else math.nan)
-            else:
-                normalized[display_name].append(value / base_value if base_value > 0 else math.nan)
+    values, higher = metric_matrix(engines, metrics)
+    baseline = values[list(engines).index(BASELINE_ENGINE)]
+    # "higher" metrics score value/baseline; "lower" metrics score baseline/value.
+    numerator = np.where(higher, values, baseline)
+    denominator = np.where(higher, baseline, values)
+    scores = np.divide(
+        numerator, denominator, out=np.full_like(values, np.nan), where=denominator > 0
+    )
 
+    normalized = {
+        display_engine_name(engine): row.tolist() for engine, row in zip(engines, scores)
+    }
     return metrics, normalized
 
 
 def plot_speedup(engines: dict[str, dict[str, object]]) -> None:
+    import matplotlib.pyplot as plt
+
     metrics, normalized = normalize_speedup(engines)
     labels = [label for _, label, _ in metrics]
     engine_names = ordered_display_engines(list(normalized.keys()))
@@ -210,26 +206,17 @@ def plot_speedup(engines: dict[str, dict[str, object]]) -> None:
         values = np.array(normalized[engine], dtype=float)
         y_pos = positions + (len(engine_names) - 1 - index) * height
         color = display_engine_color(engine, index)
-        first_bar = True
-        for metric_index, value in enumerate(values):
-            if math.isnan(float(value)):
-                ax.text(0.02, y_pos[metric_index], "n/a", va="center", size=9, color="gray")
-            else:
-                ax.barh(
-                    y_pos[metric_index],
-                    float(value),
-                    height,
-                    color=color,
-                    label=engine if first_bar else None,
-                )
-                first_bar = False
-                ax.text(
-                    float(value) + 0.05,
-                    y_pos[metric_index],
-                    f"{float(value):.2f}x",
-                    va="center",
-                    size=9,
-                )
+        valid = ~np.isnan(values)
+        for missing_y in y_pos[~valid]:
+            ax.text(0.02, missing_y, "n/a", va="center", size=9, color="gray")
+        if valid.any():
+            bars = ax.barh(y_pos[valid], values[valid], height, color=color, label=engine)
+            ax.bar_label(
+                bars,
+                labels=[f"{value:.2f}x" for value in values[valid]],
+                padding=3,
+                size=9,
+            )
 
     baseline_label = display_engine_name(BASELINE_ENGINE)
     ax.axvline(
@@ -247,8 +234,8 @@ def plot_speedup(engines: dict[str, dict[str, object]]) -> None:
     ax.set_title(f"Relative Performance vs {baseline_label}")
     ax.legend()
 
-    plt.tight_layout()
-    plt.savefig(OUT_SPEEDUP, dpi=150)
+    fig.tight_layout()
+    fig.savefig(OUT_SPEEDUP, dpi=150)
     plt.close(fig)
     print(f"Wrote: {OUT_SPEEDUP}")
 